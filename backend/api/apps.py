@@ -4,3 +4,14 @@ from django.apps import AppConfig
 class ApiConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'api'
+
+    def ready(self):
+        from django.db.models.signals import post_migrate
+        from .services.content_types import warm_content_types
+
+        # Cache invalidation hooks
+        from . import signals  # noqa: F401
+
+        # Content type registry: loads lazily on first lookup (no database access
+        # here); reload whenever migrate may have changed ids
+        post_migrate.connect(warm_content_types, sender=self, dispatch_uid="api_content_types")
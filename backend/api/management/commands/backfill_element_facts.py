@@ -0,0 +1,61 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from api.models import ElementAttemptFact, SessionLog
+from api.services.element_consistency import clear_consistency_cache
+from api.services.element_facts import build_element_facts
+
+LOG_FIELDS = (
+    "id",
+    "session_date",
+    "athlete_season_id",
+    "content_type_id",
+    "object_id",
+    "element_attempts",
+    "program_runs",
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Rebuilds ElementAttemptFact rows from every SessionLog's element_attempts "
+        "and program_runs"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=2000,
+            help="Session logs read per batch (default 2000)",
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options["batch_size"]
+        logs = (
+            SessionLog.objects.exclude(element_attempts=[], program_runs=[])
+            .order_by("id")
+            .only(*LOG_FIELDS)
+        )
+
+        with transaction.atomic():
+            # 1. Start from scratch (facts are derived, nothing is lost)
+            ElementAttemptFact.objects.all().delete()
+
+            # 2. Rebuild in id order, one batch of logs at a time
+            total_logs = total_facts = 0
+            last_id = 0
+            while True:
+                batch = list(logs.filter(id__gt=last_id)[:batch_size])
+                if not batch:
+                    break
+                facts = ElementAttemptFact.objects.bulk_create(build_element_facts(batch))
+                total_logs += len(batch)
+                total_facts += len(facts)
+                last_id = batch[-1].id
+
+            # 3. Cached consistency weeks were built from the old rows
+            transaction.on_commit(clear_consistency_cache)
+
+        self.stdout.write(
+            self.style.SUCCESS(f"Element facts rebuilt: {total_facts} from {total_logs} logs.")
+        )
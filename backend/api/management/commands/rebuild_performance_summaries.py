@@ -0,0 +1,32 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from api.models import EntityPerformanceSummary
+from api.services.performance import SUMMARY_MODELS, build_performance_summaries
+
+
+class Command(BaseCommand):
+    help = "Rebuilds every EntityPerformanceSummary from competition results and session logs"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=500,
+            help="Entities computed per batch (default 500)",
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options["batch_size"]
+
+        with transaction.atomic():
+            # 1. Start from scratch (also drops rows for deleted entities)
+            EntityPerformanceSummary.objects.all().delete()
+
+            # 2. Rebuild per entity type, in batches
+            for model in SUMMARY_MODELS:
+                ids = list(model.objects.order_by("id").values_list("id", flat=True))
+                for i in range(0, len(ids), batch_size):
+                    build_performance_summaries(model, ids[i : i + batch_size])
+                self.stdout.write(f"{model.__name__}: {len(ids)} summaries")
+
+        self.stdout.write(self.style.SUCCESS("Performance summaries rebuilt."))
@@ -0,0 +1,33 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from api.models import DailyTrainingLoad, Skater
+from api.services.training_load import rebuild_daily_loads
+
+
+class Command(BaseCommand):
+    help = "Rebuilds every DailyTrainingLoad row from session logs and planned sessions"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=200,
+            help="Skaters computed per batch (default 200)",
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options["batch_size"]
+
+        with transaction.atomic():
+            # 1. Start from scratch (also drops rows for deleted logs)
+            DailyTrainingLoad.objects.all().delete()
+
+            # 2. Rebuild skater by skater, in batches
+            ids = list(Skater.objects.order_by("id").values_list("id", flat=True))
+            rows = 0
+            for i in range(0, len(ids), batch_size):
+                rows += rebuild_daily_loads(ids[i : i + batch_size])
+
+        self.stdout.write(
+            self.style.SUCCESS(f"Training load rebuilt: {rows} days for {len(ids)} skaters.")
+        )
@@ -0,0 +1,75 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from api.models import User
+from api.seeding import seed_synthetic_club
+
+
+class Command(BaseCommand):
+    help = (
+        "Seeds synthetic clubs (coaches, skaters, teams, synchro, plans, logs, results) "
+        "for load testing. Output is deterministic for a given --seed and date."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--clubs", type=int, default=1, help="Clubs (organizations) to seed")
+        parser.add_argument("--skaters", type=int, default=200, help="Skaters per club")
+        parser.add_argument(
+            "--assistant-coaches",
+            type=int,
+            default=2,
+            help="Coaches per club besides the head coach",
+        )
+        parser.add_argument("--seasons", type=int, default=3, help="Seasons of history")
+        parser.add_argument(
+            "--sessions-per-week",
+            type=int,
+            default=3,
+            help="Planned and logged sessions per week for each skater and team (0-5)",
+        )
+        parser.add_argument("--seed", type=int, default=0, help="Random seed")
+        parser.add_argument(
+            "--batch-size", type=int, default=2000, help="Rows per bulk insert (default 2000)"
+        )
+        parser.add_argument(
+            "--coach-email",
+            help="Existing user who heads every seeded club (default: a new coach per club)",
+        )
+
+    def handle(self, *args, **options):
+        coach = None
+        if options["coach_email"]:
+            try:
+                coach = User.objects.get(email=options["coach_email"])
+            except User.DoesNotExist:
+                raise CommandError(f"No user with email {options['coach_email']}")
+
+        totals = {}
+        started = time.monotonic()
+        for n in range(options["clubs"]):
+            club_started = time.monotonic()
+            club = seed_synthetic_club(
+                coach=coach,
+                skaters=options["skaters"],
+                assistant_coaches=options["assistant_coaches"],
+                seasons=options["seasons"],
+                sessions_per_week=options["sessions_per_week"],
+                seed=options["seed"],
+                club=n,
+                batch_size=options["batch_size"],
+            )
+            for name, count in club.counts.items():
+                totals[name] = totals.get(name, 0) + count
+            self.stdout.write(
+                f"{club.organization.name}: {sum(club.counts.values())} rows "
+                f"in {time.monotonic() - club_started:.1f}s (head coach {club.coach.email})"
+            )
+
+        for name, count in sorted(totals.items()):
+            self.stdout.write(f"  {name}: {count}")
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Seeded {options['clubs']} club(s), {sum(totals.values())} rows "
+                f"in {time.monotonic() - started:.1f}s."
+            )
+        )
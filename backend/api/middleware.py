@@ -0,0 +1,63 @@
+import json
+import logging
+from contextlib import ExitStack
+
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connections
+
+from api.services.instrumentation import (
+    endpoint_stats,
+    end_request_metrics,
+    install_serializer_timer,
+    start_request_metrics,
+)
+
+logger = logging.getLogger("api.instrumentation")
+
+
+class RequestInstrumentationMiddleware:
+    """
+    Opt-in (API_INSTRUMENTATION) per-request metrics for DRF views.
+
+    Records query count, duplicate statements, DB time, serializer time and
+    total time for each API request. Every request is logged as one JSON line
+    on the "api.instrumentation" logger (WARNING when slower than
+    API_INSTRUMENTATION_SLOW_MS or when it repeats a statement), and added to
+    the in-process aggregate served at /api/admin/instrumentation/.
+    """
+
+    def __init__(self, get_response):
+        if not getattr(settings, "API_INSTRUMENTATION", False):
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        self.slow_ms = getattr(settings, "API_INSTRUMENTATION_SLOW_MS", 500)
+        install_serializer_timer()
+
+    def __call__(self, request):
+        metrics, token = start_request_metrics()
+        try:
+            with ExitStack() as stack:
+                for connection in connections.all():
+                    stack.enter_context(connection.execute_wrapper(metrics))
+                response = self.get_response(request)
+        finally:
+            end_request_metrics(token)
+
+        # Only DRF views (as_view() leaves the class on the view function)
+        match = getattr(request, "resolver_match", None)
+        view_class = getattr(match.func, "cls", None) if match else None
+        if view_class is None:
+            return response
+
+        sample = metrics.finish(
+            request.method,
+            match.route,
+            f"{view_class.__module__}.{view_class.__name__}",
+            response.status_code,
+        )
+        slow = sample["total_ms"] >= self.slow_ms
+        endpoint_stats.record(sample, slow=slow)
+        level = logging.WARNING if slow or sample["duplicates"] else logging.INFO
+        logger.log(level, json.dumps({"event": "api_request", "slow": slow, **sample}))
+        return response
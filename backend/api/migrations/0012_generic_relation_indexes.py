@@ -0,0 +1,95 @@
+# Generated by Django 4.2.30 on 2026-10-16 23:41
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("api", "0011_weeklyplan_max_session_count_and_more"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="athleteseason",
+            index=models.Index(
+                fields=["content_type", "object_id", "is_active"], name="season_entity_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="competitionresult",
+            index=models.Index(
+                fields=["content_type", "object_id", "status"], name="result_entity_status_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="goal",
+            index=models.Index(
+                fields=["content_type", "object_id", "current_status", "target_date"],
+                name="goal_entity_status_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="goal",
+            index=models.Index(
+                condition=models.Q(("current_status__in", ["IN_PROGRESS", "PENDING", "APPROVED"])),
+                fields=["assignee_skater", "target_date"],
+                name="goal_open_assignee_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="injurylog",
+            index=models.Index(
+                condition=models.Q(("recovery_status__in", ["Active", "Recovering"])),
+                fields=["skater", "date_of_onset"],
+                name="injury_open_skater_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="planningentityaccess",
+            index=models.Index(
+                fields=["content_type", "object_id", "access_level"], name="pea_entity_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="program",
+            index=models.Index(
+                fields=["content_type", "object_id", "-season"], name="program_entity_season_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="sessionlog",
+            index=models.Index(
+                fields=["athlete_season", "-session_date"], name="sessionlog_season_date_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="sessionlog",
+            index=models.Index(
+                fields=["content_type", "object_id", "-session_date"],
+                name="sessionlog_entity_date_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="teamtrip",
+            index=models.Index(
+                fields=["content_type", "object_id", "-start_date"], name="trip_entity_date_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="yearlyplan",
+            index=models.Index(fields=["content_type", "object_id"], name="yearlyplan_entity_idx"),
+        ),
+        # Drop the single-column FK index only once its replacement exists
+        migrations.AlterField(
+            model_name="sessionlog",
+            name="athlete_season",
+            field=models.ForeignKey(
+                db_index=False,
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="session_logs",
+                to="api.athleteseason",
+            ),
+        ),
+    ]
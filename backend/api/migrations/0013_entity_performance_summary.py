@@ -0,0 +1,67 @@
+# Generated by Django 4.2.30 on 2026-10-16 23:51
+
+import django.core.serializers.json
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("contenttypes", "0002_remove_content_type_name"),
+        ("api", "0012_generic_relation_indexes"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="EntityPerformanceSummary",
+            fields=[
+                ("id", models.AutoField(primary_key=True, serialize=False)),
+                ("object_id", models.PositiveIntegerField()),
+                (
+                    "overall",
+                    models.JSONField(
+                        default=dict, encoder=django.core.serializers.json.DjangoJSONEncoder
+                    ),
+                ),
+                (
+                    "segments",
+                    models.JSONField(
+                        default=dict, encoder=django.core.serializers.json.DjangoJSONEncoder
+                    ),
+                ),
+                (
+                    "history",
+                    models.JSONField(
+                        default=list, encoder=django.core.serializers.json.DjangoJSONEncoder
+                    ),
+                ),
+                ("volume", models.PositiveIntegerField(default=0)),
+                ("season_name", models.CharField(default="Current", max_length=50)),
+                ("season_start", models.DateField()),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                (
+                    "content_type",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE, to="contenttypes.contenttype"
+                    ),
+                ),
+                (
+                    "last_competition",
+                    models.ForeignKey(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.SET_NULL,
+                        related_name="+",
+                        to="api.competition",
+                    ),
+                ),
+            ],
+        ),
+        migrations.AddConstraint(
+            model_name="entityperformancesummary",
+            constraint=models.UniqueConstraint(
+                fields=("content_type", "object_id"), name="unique_performance_summary"
+            ),
+        ),
+    ]
@@ -0,0 +1,44 @@
+# Generated by Django 4.2.30 on 2026-10-17 00:28
+
+from django.db import migrations, models
+
+
+def mark_existing_sent(apps, schema_editor):
+    # Invitations created before the task queue were emailed synchronously
+    Invitation = apps.get_model("api", "Invitation")
+    Invitation.objects.update(email_status="SENT", email_attempts=1)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("api", "0013_entity_performance_summary"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="invitation",
+            name="email_attempts",
+            field=models.PositiveSmallIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="invitation",
+            name="email_error",
+            field=models.CharField(blank=True, max_length=255),
+        ),
+        migrations.AddField(
+            model_name="invitation",
+            name="email_sent_at",
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="invitation",
+            name="email_status",
+            field=models.CharField(
+                choices=[("QUEUED", "Queued"), ("SENT", "Sent"), ("FAILED", "Failed")],
+                default="QUEUED",
+                max_length=10,
+            ),
+        ),
+        migrations.RunPython(mark_existing_sent, migrations.RunPython.noop),
+    ]
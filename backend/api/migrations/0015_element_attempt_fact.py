@@ -0,0 +1,73 @@
+# Generated by Django 4.2.30 on 2026-10-17 00:36
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("contenttypes", "0002_remove_content_type_name"),
+        ("api", "0014_invitation_email_status"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ElementAttemptFact",
+            fields=[
+                ("id", models.BigAutoField(primary_key=True, serialize=False)),
+                ("session_date", models.DateField()),
+                ("object_id", models.PositiveIntegerField()),
+                ("element_code", models.CharField(max_length=50)),
+                ("attempts", models.PositiveIntegerField()),
+                ("successful", models.PositiveIntegerField()),
+                (
+                    "content_type",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE, to="contenttypes.contenttype"
+                    ),
+                ),
+                (
+                    "element",
+                    models.ForeignKey(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.SET_NULL,
+                        related_name="+",
+                        to="api.skatingelement",
+                    ),
+                ),
+                (
+                    "session_log",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="element_facts",
+                        to="api.sessionlog",
+                    ),
+                ),
+                (
+                    "skater",
+                    models.ForeignKey(
+                        blank=True,
+                        db_index=False,
+                        null=True,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="element_facts",
+                        to="api.skater",
+                    ),
+                ),
+            ],
+            options={
+                "indexes": [
+                    models.Index(
+                        fields=["skater", "element_code", "session_date"],
+                        name="elementfact_skater_idx",
+                    ),
+                    models.Index(
+                        fields=["content_type", "object_id", "session_date"],
+                        name="elementfact_entity_idx",
+                    ),
+                ],
+            },
+        ),
+    ]
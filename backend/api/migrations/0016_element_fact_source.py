@@ -0,0 +1,22 @@
+# Generated by Django 4.2.30 on 2026-10-17 00:39
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("api", "0015_element_attempt_fact"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="elementattemptfact",
+            name="source",
+            field=models.CharField(
+                choices=[("PRACTICE", "Element attempts"), ("PROGRAM_RUN", "Program runs")],
+                default="PRACTICE",
+                max_length=12,
+            ),
+        ),
+    ]
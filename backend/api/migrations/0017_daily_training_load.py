@@ -0,0 +1,37 @@
+# Generated by Django 4.2.30 on 2026-10-17 00:44
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("api", "0016_element_fact_source"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="DailyTrainingLoad",
+            fields=[
+                ("id", models.BigAutoField(primary_key=True, serialize=False)),
+                ("date", models.DateField()),
+                ("sessions", models.PositiveSmallIntegerField(default=0)),
+                ("minutes", models.PositiveIntegerField(default=0)),
+                ("load", models.PositiveIntegerField(default=0)),
+                (
+                    "skater",
+                    models.ForeignKey(
+                        db_index=False,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="daily_loads",
+                        to="api.skater",
+                    ),
+                ),
+            ],
+        ),
+        migrations.AddConstraint(
+            model_name="dailytrainingload",
+            constraint=models.UniqueConstraint(fields=("skater", "date"), name="unique_daily_load"),
+        ),
+    ]
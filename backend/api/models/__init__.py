@@ -17,13 +17,15 @@ from .planning import (
     YearlyPlan,
     Macrocycle,
     WeeklyPlan,
+    PlannedSession,
     Goal,
     GapAnalysis,
 )
-from .logs import SessionLog, InjuryLog, MeetingLog
+from .logs import SessionLog, ElementAttemptFact, DailyTrainingLoad, InjuryLog, MeetingLog
 from .competitions import (
     Competition,
     CompetitionResult,
+    EntityPerformanceSummary,
     SkaterTest,
     Program,
     ProgramAsset,
@@ -1,6 +1,7 @@
 from django.db import models
 from django.contrib.contenttypes.fields import GenericForeignKey
 from django.contrib.contenttypes.models import ContentType
+from django.core.serializers.json import DjangoJSONEncoder
 from .users import User
 from .skaters import Skater
 
@@ -95,6 +96,49 @@ class CompetitionResult(models.Model):
 
     class Meta:
         ordering = ["-competition__start_date"]
+        indexes = [
+            models.Index(
+                fields=["content_type", "object_id", "status"], name="result_entity_status_idx"
+            ),
+        ]
+
+
+class EntityPerformanceSummary(models.Model):
+    """
+    Denormalized stats for a Skater, Team or SynchroTeam: PB/SB per segment,
+    score history, session volume and last competition.
+    Kept up to date by api.signals; rebuild with `rebuild_performance_summaries`.
+    """
+
+    id = models.AutoField(primary_key=True)
+
+    content_type = models.ForeignKey(ContentType, on_delete=models.CASCADE)
+    object_id = models.PositiveIntegerField()
+    planning_entity = GenericForeignKey("content_type", "object_id")
+
+    overall = models.JSONField(default=dict, encoder=DjangoJSONEncoder)
+    segments = models.JSONField(default=dict, encoder=DjangoJSONEncoder)
+    history = models.JSONField(default=list, encoder=DjangoJSONEncoder)
+
+    volume = models.PositiveIntegerField(default=0)
+    season_name = models.CharField(max_length=50, default="Current")
+    # Season the SBs were computed for; a new season makes the row stale
+    season_start = models.DateField()
+
+    last_competition = models.ForeignKey(
+        Competition, on_delete=models.SET_NULL, null=True, blank=True, related_name="+"
+    )
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"Performance summary for {self.planning_entity}"
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["content_type", "object_id"], name="unique_performance_summary"
+            ),
+        ]
 
 
 class SkaterTest(models.Model):
@@ -174,6 +218,13 @@ class Program(models.Model):
     def __str__(self):
         return f"{self.title} ({self.season})"
 
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=["content_type", "object_id", "-season"], name="program_entity_season_idx"
+            ),
+        ]
+
 
 class ProgramAsset(models.Model):
     """
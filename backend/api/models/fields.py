@@ -0,0 +1,90 @@
+from django.db.models.query_utils import DeferredAttribute
+from django.utils.encoding import force_bytes
+from django_cryptography.fields import EncryptedMixin, encrypt
+
+LAZY_FIELD_CACHE = {}
+
+
+class Ciphertext(bytes):
+    """An encrypted column value that has not been decrypted yet."""
+
+
+class LazyDecryptAttribute(DeferredAttribute):
+    """
+    Decrypts the stored Ciphertext on first access and caches the plain value
+    on the instance. Deferred columns are still loaded on demand as usual.
+    """
+
+    def __get__(self, instance, cls=None):
+        if instance is None:
+            return self
+        value = super().__get__(instance, cls)
+        if isinstance(value, Ciphertext):
+            value = self.field._load(value)
+            instance.__dict__[self.field.attname] = value
+        return value
+
+    def __set__(self, instance, value):
+        # A data descriptor, so __get__ runs even once the value is in __dict__
+        instance.__dict__[self.field.attname] = value
+
+
+class LazyDecryptMixin:
+    """
+    Encrypted field that keeps ciphertext as-is when rows are loaded.
+
+    - Rows whose value is never read are never decrypted
+    - Saving an instance without touching the value writes the ciphertext back
+      unchanged instead of re-encrypting it
+    - Migrations see a plain django_cryptography encrypt() field
+
+    Note: .values() / .values_list() return Ciphertext for these columns; use
+    field.decrypt(value) if a raw query ever needs the plain text.
+    """
+
+    descriptor_class = LazyDecryptAttribute
+
+    def from_db_value(self, value, *args, **kwargs):
+        if value is not None:
+            return Ciphertext(force_bytes(value))
+        return value
+
+    def decrypt(self, value):
+        if isinstance(value, Ciphertext):
+            return self._load(value)
+        return value
+
+    def pre_save(self, model_instance, add):
+        # Read the raw value: going through the descriptor would decrypt it
+        if self.attname in model_instance.__dict__:
+            return model_instance.__dict__[self.attname]
+        # Deferred column: loaded (and decrypted) on demand as usual
+        return super().pre_save(model_instance, add)
+
+    def get_db_prep_value(self, value, connection, prepared=False):
+        if isinstance(value, Ciphertext):
+            return connection.Database.Binary(bytes(value))
+        return super().get_db_prep_value(value, connection, prepared)
+
+    def deconstruct(self):
+        name, path, args, kwargs = super(EncryptedMixin, self).deconstruct()
+        path = f"{encrypt.__module__}.{encrypt.__name__}"
+        args = [self.base_class(*args, **kwargs)]
+        kwargs = {}
+        if self.ttl is not None:
+            kwargs["ttl"] = self.ttl
+        return name, path, args, kwargs
+
+
+def lazy_encrypt(base_field):
+    """
+    Drop-in replacement for django_cryptography's encrypt() that only decrypts
+    a value when the attribute is read.
+    """
+    encrypted_class = type(encrypt(base_field))
+    if encrypted_class not in LAZY_FIELD_CACHE:
+        LAZY_FIELD_CACHE[encrypted_class] = type(
+            "Lazy" + encrypted_class.__name__, (LazyDecryptMixin, encrypted_class), {}
+        )
+    name, path, args, kwargs = base_field.deconstruct()
+    return LAZY_FIELD_CACHE[encrypted_class](*args, **kwargs)
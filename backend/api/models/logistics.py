@@ -51,6 +51,11 @@ class TeamTrip(models.Model):
 
     class Meta:
         ordering = ["-start_date"]
+        indexes = [
+            models.Index(
+                fields=["content_type", "object_id", "-start_date"], name="trip_entity_date_idx"
+            ),
+        ]
 
 
 class ItineraryItem(models.Model):
@@ -1,10 +1,12 @@
 from django.db import models
+from django.db.models import Q
 from django.contrib.contenttypes.fields import GenericForeignKey
 from django.contrib.contenttypes.models import ContentType
 from django.utils import timezone
 from datetime import date
-from django_cryptography.fields import encrypt
+from .fields import lazy_encrypt
 from .users import User
+from .core import SkatingElement
 from .skaters import Skater
 from .planning import AthleteSeason
 
@@ -38,7 +40,10 @@ class SessionLog(models.Model):
     )
 
     athlete_season = models.ForeignKey(
-        AthleteSeason, on_delete=models.CASCADE, related_name="session_logs"
+        AthleteSeason,
+        on_delete=models.CASCADE,
+        related_name="session_logs",
+        db_index=False,  # Covered by sessionlog_season_date_idx
     )
 
     # Link to Discipline (Singles, Dance, etc.)
@@ -55,8 +60,8 @@ class SessionLog(models.Model):
     wellbeing_mental_focus_notes = models.TextField(blank=True, null=True)
 
     # Notes
-    coach_notes = encrypt(models.TextField(blank=True, null=True))
-    skater_notes = encrypt(models.TextField(blank=True, null=True))
+    coach_notes = lazy_encrypt(models.TextField(blank=True, null=True))
+    skater_notes = lazy_encrypt(models.TextField(blank=True, null=True))
 
     attendance = models.JSONField(default=list, blank=True)
 
@@ -91,6 +96,101 @@ class SessionLog(models.Model):
 
     class Meta:
         ordering = ["-session_date", "-session_time"]  # Ordered by date then time
+        indexes = [
+            models.Index(
+                fields=["athlete_season", "-session_date"], name="sessionlog_season_date_idx"
+            ),
+            models.Index(
+                fields=["content_type", "object_id", "-session_date"],
+                name="sessionlog_entity_date_idx",
+            ),
+        ]
+
+
+class ElementAttemptFact(models.Model):
+    """
+    One element of a SessionLog, as a row: an element_attempts entry, or an
+    element's total across the log's program_runs.
+    Derived data: rewritten whenever the log is saved (api.signals) and
+    rebuilt with `backfill_element_facts`. Never edit directly.
+    """
+
+    class Source(models.TextChoices):
+        PRACTICE = "PRACTICE", "Element attempts"
+        PROGRAM_RUN = "PROGRAM_RUN", "Program runs"
+
+    id = models.BigAutoField(primary_key=True)
+    session_log = models.ForeignKey(
+        SessionLog, on_delete=models.CASCADE, related_name="element_facts"
+    )
+    session_date = models.DateField()
+    source = models.CharField(max_length=12, choices=Source.choices, default=Source.PRACTICE)
+
+    # Who attempted it: the log's planning entity, and the skater for
+    # individual seasons (team seasons have none)
+    skater = models.ForeignKey(
+        Skater,
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+        related_name="element_facts",
+        db_index=False,  # Covered by elementfact_skater_idx
+    )
+    content_type = models.ForeignKey(ContentType, on_delete=models.CASCADE)
+    object_id = models.PositiveIntegerField()
+    planning_entity = GenericForeignKey("content_type", "object_id")
+
+    element_code = models.CharField(max_length=50)
+    element = models.ForeignKey(
+        SkatingElement, on_delete=models.SET_NULL, null=True, blank=True, related_name="+"
+    )
+    attempts = models.PositiveIntegerField()
+    successful = models.PositiveIntegerField()
+
+    def __str__(self):
+        return f"{self.element_code} {self.successful}/{self.attempts} on {self.session_date}"
+
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=["skater", "element_code", "session_date"], name="elementfact_skater_idx"
+            ),
+            models.Index(
+                fields=["content_type", "object_id", "session_date"],
+                name="elementfact_entity_idx",
+            ),
+        ]
+
+
+class DailyTrainingLoad(models.Model):
+    """
+    Session-RPE training load of one skater on one day, summed over the
+    session logs of all their seasons (see api.services.training_load).
+    Derived data: refreshed whenever a log is saved or deleted (api.signals)
+    and rebuilt with `rebuild_training_load`.
+    """
+
+    id = models.BigAutoField(primary_key=True)
+    skater = models.ForeignKey(
+        Skater,
+        on_delete=models.CASCADE,
+        related_name="daily_loads",
+        db_index=False,  # Covered by the unique constraint
+    )
+    date = models.DateField()
+
+    sessions = models.PositiveSmallIntegerField(default=0)
+    minutes = models.PositiveIntegerField(default=0)
+    # Arbitrary units: duration (minutes) x RPE (0-10) per session
+    load = models.PositiveIntegerField(default=0)
+
+    def __str__(self):
+        return f"{self.load} AU for skater {self.skater_id} on {self.date}"
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["skater", "date"], name="unique_daily_load"),
+        ]
 
 
 class InjuryLog(models.Model):
@@ -117,6 +217,14 @@ class InjuryLog(models.Model):
 
     class Meta:
         ordering = ["-date_of_onset"]
+        indexes = [
+            # Dashboard red flags only ever look at open injuries
+            models.Index(
+                fields=["skater", "date_of_onset"],
+                name="injury_open_skater_idx",
+                condition=Q(recovery_status__in=["Active", "Recovering"]),
+            ),
+        ]
 
 
 class MeetingLog(models.Model):
@@ -1,4 +1,5 @@
 from django.db import models
+from django.db.models import Q
 from django.contrib.contenttypes.fields import GenericForeignKey
 from django.contrib.contenttypes.models import ContentType
 from .users import User
@@ -36,6 +37,14 @@ class AthleteSeason(models.Model):
     def __str__(self):
         return f"{self.season} - {self.skater or self.planning_entity}"
 
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=["content_type", "object_id", "is_active"],
+                name="season_entity_idx",
+            ),
+        ]
+
 
 class YearlyPlan(models.Model):
     id = models.AutoField(primary_key=True)
@@ -73,6 +82,11 @@ class YearlyPlan(models.Model):
     def __str__(self):
         return f"YTP: {self.planning_entity}"
 
+    class Meta:
+        indexes = [
+            models.Index(fields=["content_type", "object_id"], name="yearlyplan_entity_idx"),
+        ]
+
 
 class Macrocycle(models.Model):
     id = models.AutoField(primary_key=True)
@@ -274,6 +288,18 @@ class Goal(models.Model):
 
     class Meta:
         ordering = ["-updated_at"]
+        indexes = [
+            models.Index(
+                fields=["content_type", "object_id", "current_status", "target_date"],
+                name="goal_entity_status_idx",
+            ),
+            # Dashboard red flags: open goals of a skater by due date
+            models.Index(
+                fields=["assignee_skater", "target_date"],
+                name="goal_open_assignee_idx",
+                condition=Q(current_status__in=["IN_PROGRESS", "PENDING", "APPROVED"]),
+            ),
+        ]
 
 
 class GapAnalysis(models.Model):
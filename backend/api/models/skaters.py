@@ -1,7 +1,7 @@
 from django.db import models
 from django.contrib.contenttypes.fields import GenericForeignKey
 from django.contrib.contenttypes.models import ContentType
-from django_cryptography.fields import encrypt
+from .fields import lazy_encrypt
 from .users import User
 from .core import Federation, FederationLevel
 
@@ -60,19 +60,19 @@ class AthleteProfile(models.Model):
     )
 
     # --- Contact Info (For Invites) ---
-    skater_email = encrypt(models.EmailField(blank=True, null=True))
-    guardian_name = encrypt(models.CharField(max_length=255, blank=True, null=True))
-    guardian_email = encrypt(models.EmailField(blank=True, null=True))
+    skater_email = lazy_encrypt(models.EmailField(blank=True, null=True))
+    guardian_name = lazy_encrypt(models.CharField(max_length=255, blank=True, null=True))
+    guardian_email = lazy_encrypt(models.EmailField(blank=True, null=True))
 
     # --- Emergency & Safety ---
-    emergency_contact_name = encrypt(
+    emergency_contact_name = lazy_encrypt(
         models.CharField(max_length=255, blank=True, null=True)
     )
-    emergency_contact_phone = encrypt(
+    emergency_contact_phone = lazy_encrypt(
         models.CharField(max_length=50, blank=True, null=True)
     )
 
-    relevant_medical_notes = encrypt(
+    relevant_medical_notes = lazy_encrypt(
         models.TextField(
             blank=True, null=True, help_text="Allergies, conditions, etc."
         )
@@ -194,3 +194,11 @@ class PlanningEntityAccess(models.Model):
 
     class Meta:
         unique_together = ("user", "content_type", "object_id", "access_level")
+        indexes = [
+            # Staff lists and dashboard invalidation look rows up by entity.
+            # (user, content_type) lookups already use the unique index prefix.
+            models.Index(
+                fields=["content_type", "object_id", "access_level"],
+                name="pea_entity_idx",
+            ),
+        ]
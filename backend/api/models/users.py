@@ -169,6 +169,11 @@ class Invitation(models.Model):
         ATHLETE = "ATHLETE", "Athlete"  # Legacy/Frontend term for Skater
         PARENT = "PARENT", "Parent"  # Legacy term for Guardian
 
+    class EmailStatus(models.TextChoices):
+        QUEUED = "QUEUED", "Queued"
+        SENT = "SENT", "Sent"
+        FAILED = "FAILED", "Failed"
+
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
     email = models.EmailField()
 
@@ -193,6 +198,14 @@ class Invitation(models.Model):
     expires_at = models.DateTimeField()
     accepted_at = models.DateTimeField(null=True, blank=True)
 
+    # Delivery of the invitation email (sent by api.tasks.send_invitation_emails)
+    email_status = models.CharField(
+        max_length=10, choices=EmailStatus.choices, default=EmailStatus.QUEUED
+    )
+    email_attempts = models.PositiveSmallIntegerField(default=0)
+    email_error = models.CharField(max_length=255, blank=True)
+    email_sent_at = models.DateTimeField(null=True, blank=True)
+
     def save(self, *args, **kwargs):
         if not self.expires_at:
             self.expires_at = timezone.now() + timedelta(days=7)
@@ -0,0 +1,116 @@
+import json
+
+from django.db.models import Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import CursorPagination, _reverse_ordering
+
+
+def _after(ordering, values):
+    """
+    Q for the rows strictly after `values` in `ordering`, compared as a tuple:
+    (a > x) | (a = x & b > y) | ... NULLs sort as Postgres does, last
+    ascending and first descending.
+    """
+    query = Q(pk__in=[])
+    equal = Q()
+    for order, value in zip(ordering, values):
+        field = order.lstrip("-")
+        descending = order.startswith("-")
+        if value is None:
+            after = Q(**{f"{field}__isnull": False}) if descending else Q(pk__in=[])
+            same = Q(**{f"{field}__isnull": True})
+        else:
+            after = Q(**{f"{field}__lt" if descending else f"{field}__gt": value})
+            if not descending:
+                after |= Q(**{f"{field}__isnull": True})
+            same = Q(**{field: value})
+        query |= equal & after
+        equal &= same
+    return query
+
+
+class OptInCursorPagination(CursorPagination):
+    """
+    Keyset (cursor) pagination for list endpoints, only used when the client asks.
+
+    - No `cursor` / `page_size` query param: the full list is returned as before,
+      so existing callers keep working unchanged.
+    - `?page_size=N` (capped at max_page_size) starts paginating; follow the
+      `next` / `previous` links from there.
+
+    Views declare their natural ordering as `cursor_ordering`, ending in a
+    unique column. The cursor position is the whole ordering tuple of the
+    boundary row, so low-cardinality leading fields (e.g. "-is_active") never
+    fall back to offsets. Related fields (e.g. "-competition__start_date") are
+    supported.
+    """
+
+    page_size = 50
+    max_page_size = 200
+    page_size_query_param = "page_size"
+    ordering = ("-id",)
+
+    def paginate_queryset(self, queryset, request, view=None):
+        params = request.query_params
+        if self.cursor_query_param not in params and self.page_size_query_param not in params:
+            return None
+
+        self.request = request
+        self.page_size = self.get_page_size(request)
+        self.base_url = request.build_absolute_uri()
+        self.ordering = self.get_ordering(request, queryset, view)
+
+        self.cursor = self.decode_cursor(request)
+        if self.cursor is None:
+            offset, reverse, position = 0, False, None
+        else:
+            offset, reverse, position = self.cursor
+
+        ordering = _reverse_ordering(self.ordering) if reverse else self.ordering
+        queryset = queryset.order_by(*ordering)
+        if position is not None:
+            try:
+                values = json.loads(position)
+            except ValueError:
+                raise NotFound(self.invalid_cursor_message)
+            if not isinstance(values, list) or len(values) != len(ordering):
+                raise NotFound(self.invalid_cursor_message)
+            queryset = queryset.filter(_after(ordering, values))
+
+        results = list(queryset[offset : offset + self.page_size + 1])
+        self.page = results[: self.page_size]
+
+        following = None
+        if len(results) > len(self.page):
+            following = self._get_position_from_instance(results[-1], self.ordering)
+
+        if reverse:
+            self.page.reverse()
+            self.has_next = position is not None or offset > 0
+            self.has_previous = following is not None
+            self.next_position = position
+            self.previous_position = following
+        else:
+            self.has_next = following is not None
+            self.has_previous = position is not None or offset > 0
+            self.next_position = following
+            self.previous_position = position
+
+        if (self.has_previous or self.has_next) and self.template is not None:
+            self.display_page_controls = True
+        return self.page
+
+    def get_ordering(self, request, queryset, view):
+        ordering = getattr(view, "cursor_ordering", None) or self.ordering
+        if isinstance(ordering, str):
+            return (ordering,)
+        return tuple(ordering)
+
+    def _get_position_from_instance(self, instance, ordering):
+        values = []
+        for order in ordering:
+            attr = instance
+            for part in order.lstrip("-").split("__"):
+                attr = attr[part] if isinstance(attr, dict) else getattr(attr, part)
+            values.append(attr)
+        return json.dumps(values, default=str)
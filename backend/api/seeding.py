@@ -0,0 +1,887 @@
+"""
+Synthetic club data for local load testing and the performance suite.
+
+seed_synthetic_club() builds one club (an Organization) with its coaches,
+skaters and their singles / solo dance entities, pairs and dance teams,
+synchro teams with full rosters, the PlanningEntityAccess graph around them
+(coaches, collaborators, guardians, observers) and seasons of history:
+yearly plans with macrocycles, weekly plans with planned sessions, session
+logs with program runs and element attempts, goals, programs and competition
+results with detailed protocols.
+
+Rows are streamed into bulk_create in chunks of `batch_size`, so a club of
+any size is built with bounded memory. bulk_create skips model signals:
+element attempt facts are written alongside each batch of logs and daily
+training loads after them, while dashboard sections and performance
+summaries are computed on first read.
+
+Every part of a club draws from its own random stream, keyed by seed, club
+number and stream name, so the same arguments always produce the same rows
+whatever the batch size.
+"""
+
+import random
+from datetime import date, datetime, time, timedelta
+from itertools import islice
+
+from django.contrib.auth.hashers import make_password
+from django.db import transaction
+from django.utils import timezone
+
+from api.models import (
+    User,
+    Organization,
+    OrganizationMembership,
+    Federation,
+    Skater,
+    SinglesEntity,
+    SoloDanceEntity,
+    Team,
+    SynchroTeam,
+    PlanningEntityAccess,
+    AthleteSeason,
+    YearlyPlan,
+    Macrocycle,
+    WeeklyPlan,
+    PlannedSession,
+    Goal,
+    SessionLog,
+    ElementAttemptFact,
+    InjuryLog,
+    Competition,
+    CompetitionResult,
+    SkaterTest,
+    Program,
+    TeamTrip,
+    ItineraryItem,
+    HousingAssignment,
+    Invitation,
+)
+from api.services.content_types import get_content_type
+from api.services.element_facts import build_element_facts
+from api.services.training_load import rebuild_daily_loads
+from api.services.stats import season_bounds
+
+FIRST_NAMES = (
+    "Ava", "Ben", "Chloe", "Daniel", "Emma", "Felix", "Grace", "Hugo", "Isla", "Jack",
+    "Kaia", "Liam", "Maya", "Noah", "Olivia", "Pierre", "Quinn", "Rosa", "Sam", "Tessa",
+    "Uma", "Victor", "Willa", "Xavier", "Yara", "Zoe",
+)  # fmt: skip
+LAST_NAMES = (
+    "Anderson", "Bouchard", "Chen", "Dubois", "Evans", "Fraser", "Gagnon", "Harris",
+    "Ito", "Johnson", "Kowalski", "Lavoie", "Martin", "Nguyen", "O'Brien", "Patel",
+    "Roy", "Singh", "Tremblay", "Wong",
+)  # fmt: skip
+LEVELS = ("STAR 5", "STAR 7", "STAR 9", "STAR 10", "Pre-Novice", "Novice", "Junior", "Senior")
+CITIES = (
+    ("Toronto", "ON"),
+    ("Montreal", "QC"),
+    ("Calgary", "AB"),
+    ("Vancouver", "BC"),
+    ("Halifax", "NS"),
+    ("Winnipeg", "MB"),
+)
+
+# Element codes and (approximate) base values per discipline
+ELEMENTS = {
+    "SINGLES": {
+        "2S": 1.3, "2T": 1.3, "2Lo": 1.7, "2F": 1.8, "2Lz": 2.1, "2A": 3.3, "3S": 4.3,
+        "3T": 4.2, "3Lo": 4.9, "3F": 5.3, "3Lz": 5.9, "CCoSp4": 3.5, "FSSp3": 2.6,
+        "StSq3": 3.3, "ChSq1": 3.0,
+    },
+    "PAIRS": {
+        "3Tw3": 6.2, "2A": 3.3, "3T": 4.2, "3LoTh": 5.0, "3STh": 4.5, "5ALi4": 7.0,
+        "4Li4": 4.5, "PCoSp4": 4.5, "BiDs3": 3.2, "StSq3": 3.3, "ChSq1": 3.0,
+    },
+    "ICE_DANCE": {
+        "TwW4": 7.9, "RoLi4": 5.3, "CuLi4": 5.3, "StaLi4": 5.3, "DiSt3": 10.1,
+        "OFSt3": 7.45, "ChSp1": 1.1, "ChSl1": 1.1, "PSt3": 6.0,
+    },
+    "SYNCHRO": {
+        "I4": 6.0, "B4": 6.0, "W4": 6.0, "L4": 6.0, "ME4": 5.5, "Pa3": 4.5, "TE3": 5.0,
+        "NHE3": 4.5, "AW3": 4.5, "GL3": 5.0,
+    },
+}  # fmt: skip
+SEGMENTS = {
+    "SINGLES": ("Short Program", "Free Skate"),
+    "PAIRS": ("Short Program", "Free Skate"),
+    "ICE_DANCE": ("Rhythm Dance", "Free Dance"),
+    "SYNCHRO": ("Short Program", "Free Skate"),
+}
+# Name each segment is reported under in CompetitionResult.segment_scores
+SEGMENT_NAMES = {
+    "Short Program": "Short",
+    "Free Skate": "Free",
+    "Rhythm Dance": "Rhythm",
+    "Free Dance": "Free",
+}
+CALLS = ("q", "<", "!", "e", "<<")
+WEEKDAYS = ("MONDAY", "TUESDAY", "THURSDAY", "FRIDAY", "SATURDAY")
+PLANNED_TYPES = ("ON_ICE", "ON_ICE", "ON_ICE", "OFF_ICE", "CLASS", "CONDITIONING")
+LOGGED_TYPES = ("ON_ICE", "ON_ICE", "ON_ICE", "OFF_ICE", "CLASS")
+PHASES = (
+    ("General Prep", 0, 90),
+    ("Specific Prep", 91, 200),
+    ("Competition", 201, 364),
+)
+
+
+class SyntheticClub:
+    """
+    What seed_synthetic_club() created. Entity lists hold the saved instances;
+    the high-volume rows (logs, weekly plans, results...) are only counted.
+    """
+
+    def __init__(self, organization, coaches):
+        self.organization = organization
+        self.coaches = coaches
+        self.coach = coaches[0]
+        self.skaters = []
+        self.singles = []
+        self.solo_dance = []
+        self.teams = []
+        self.synchro_teams = []
+        self.competitions = []
+        self.counts = {}
+
+    def count(self, model, rows):
+        self.counts[model.__name__] = self.counts.get(model.__name__, 0) + len(rows)
+
+
+class Owner:
+    """Something that gets seasons, plans and logs: a skater (singles) or a team."""
+
+    def __init__(self, entity, discipline, coach, skater=None):
+        self.entity = entity
+        self.discipline = discipline
+        self.coach = coach
+        self.skater = skater
+        self.content_type_id = get_content_type(entity).id
+        self.seasons = []
+        self.plans = []
+        self.programs = {}  # season name -> [Program]
+
+    def season_kwargs(self):
+        if self.skater is not None:
+            return {"skater": self.skater}
+        return {"planning_entity": self.entity}
+
+
+class ClubSeeder:
+    def __init__(
+        self,
+        coach,
+        skaters,
+        assistant_coaches,
+        seasons,
+        sessions_per_week,
+        seed,
+        club,
+        today,
+        batch_size,
+    ):
+        self.head_coach = coach
+        self.size = skaters
+        self.assistant_coaches = assistant_coaches
+        self.season_count = seasons
+        self.sessions_per_week = sessions_per_week
+        self.today = today
+        self.batch_size = batch_size
+        self.key = f"{seed}:{club}"
+        self.prefix = f"S{seed}C{club}"
+        self.streams = {}
+
+    def random(self, stream):
+        rng = self.streams.get(stream)
+        if rng is None:
+            rng = self.streams[stream] = random.Random(f"{self.key}:{stream}")
+        return rng
+
+    def bulk_chunks(self, model, rows):
+        """bulk_create `rows` (any iterable) batch by batch, yielding each saved batch."""
+        rows = iter(rows)
+        while True:
+            batch = list(islice(rows, self.batch_size))
+            if not batch:
+                return
+            model.objects.bulk_create(batch)
+            self.club.count(model, batch)
+            yield batch
+
+    def bulk(self, model, rows, keep=True):
+        """bulk_create in batches; returns the saved rows unless keep=False."""
+        saved = []
+        for batch in self.bulk_chunks(model, rows):
+            if keep:
+                saved.extend(batch)
+        return saved
+
+    def season_starts(self):
+        """Start dates of the seeded seasons, oldest first; the last one is current."""
+        current = season_bounds(self.today)[0]
+        return [current.replace(year=current.year - n) for n in reversed(range(self.season_count))]
+
+    def name(self, rng):
+        return f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}"
+
+    def users(self, label, count, role):
+        return self.bulk(
+            User,
+            (
+                User(
+                    email=f"{label}{n}.{self.prefix.lower()}@synthetic.example.com",
+                    full_name=self.name(self.random(label)),
+                    role=role,
+                    password=make_password(None),
+                )
+                for n in range(count)
+            ),
+        )
+
+    # --- 1. ORGANIZATION & STAFF ---
+    def create_organization(self):
+        organization = Organization.objects.create(
+            name=f"{self.prefix} Skating Club",
+            organization_type=Organization.OrganizationType.CLUB,
+            subscription_tier=Organization.SubscriptionTier.PRO,
+            primary_contact=self.head_coach,
+            billing_email=self.head_coach.email,
+        )
+        self.club = SyntheticClub(organization, [self.head_coach])
+        self.club.count(Organization, [organization])
+
+        coaches = self.club.coaches
+        coaches += self.users("assistant", self.assistant_coaches, User.Role.COACH)
+        self.bulk(
+            OrganizationMembership,
+            (
+                OrganizationMembership(
+                    organization=organization,
+                    user=coach,
+                    role="ADMIN" if coach is self.head_coach else "COACH",
+                )
+                for coach in coaches
+            ),
+        )
+
+    # --- 2. SKATERS & ENTITIES ---
+    def create_entities(self):
+        club = self.club
+        rng = self.random("entities")
+        federation, _ = Federation.objects.get_or_create(
+            name="Skate Canada", defaults={"code": "CAN", "iso_code": "ca"}
+        )
+
+        club.skaters = self.bulk(
+            Skater,
+            (
+                Skater(
+                    full_name=f"{self.name(rng)} {i:05}",
+                    date_of_birth=date(2004, 1, 1) + timedelta(days=rng.randrange(4000)),
+                    federation=federation,
+                    gender=rng.choice(["FEMALE", "FEMALE", "MALE"]),
+                    home_club=club.organization.name,
+                )
+                for i in range(self.size)
+            ),
+        )
+        club.singles = self.bulk(
+            SinglesEntity,
+            (
+                SinglesEntity(
+                    skater=skater, federation=federation, current_level=rng.choice(LEVELS)
+                )
+                for skater in club.skaters
+            ),
+        )
+        club.solo_dance = self.bulk(
+            SoloDanceEntity,
+            (
+                SoloDanceEntity(skater=skater, federation=federation, current_level="Gold")
+                for skater in club.skaters[::4]
+            ),
+        )
+
+        # Roughly one skater in five skates pairs or dance with a neighbour
+        club.teams = self.bulk(
+            Team,
+            (
+                Team(
+                    team_name=f"{club.skaters[i].full_name} / {club.skaters[i + 1].full_name}",
+                    discipline=rng.choice(Team.Discipline.values),
+                    partner_a=club.skaters[i],
+                    partner_b=club.skaters[i + 1],
+                    federation=federation,
+                    current_level=rng.choice(LEVELS[4:]),
+                )
+                for i in range(0, self.size - 1, 10)
+            ),
+        )
+
+        # Synchro teams of 16, filled in skater order
+        club.synchro_teams = self.bulk(
+            SynchroTeam,
+            (
+                SynchroTeam(
+                    team_name=f"{self.prefix} Synchro {i + 1}",
+                    federation=federation,
+                    level=LEVELS[4 + i % 4],
+                )
+                for i in range(max(1, self.size // 40))
+            ),
+        )
+        Roster = SynchroTeam.roster.through
+        self.bulk(
+            Roster,
+            (
+                Roster(synchroteam=team, skater=skater)
+                for i, team in enumerate(club.synchro_teams)
+                for skater in club.skaters[i * 16 : (i + 1) * 16]
+            ),
+            keep=False,
+        )
+
+        coaches = club.coaches
+        self.owners = (
+            [
+                Owner(entity, "SINGLES", coaches[i % len(coaches)], skater=skater)
+                for i, (skater, entity) in enumerate(zip(club.skaters, club.singles))
+            ]
+            + [
+                Owner(team, team.discipline, coaches[(i * 10) % len(coaches)])
+                for i, team in enumerate(club.teams)
+            ]
+            + [Owner(team, "SYNCHRO", coaches[0]) for team in club.synchro_teams]
+        )
+
+    # --- 3. ACCESS GRAPH ---
+    def create_access(self):
+        """
+        Each skater (and their entities and teams) belongs to one coach, in
+        turn; every fifth skater also has a collaborating coach. The head coach
+        runs synchro with the other coaches as collaborators. Minors get a
+        guardian account on every third skater, teams an observer.
+        """
+        club = self.club
+        coaches = club.coaches
+
+        def access(user, level, entity):
+            return PlanningEntityAccess(
+                user=user,
+                access_level=level,
+                content_type=get_content_type(entity),
+                object_id=entity.pk,
+            )
+
+        solo_dance = {entity.skater_id: entity for entity in club.solo_dance}
+        minors = [
+            skater
+            for skater in club.skaters[::3]
+            if skater.date_of_birth > self.today.replace(year=self.today.year - 18)
+        ]
+        guardians = self.users("guardian", len(minors), User.Role.GUARDIAN)
+        observers = self.users("observer", len(club.teams), User.Role.OBSERVER)
+
+        def rows():
+            for i, (skater, singles) in enumerate(zip(club.skaters, club.singles)):
+                coach = coaches[i % len(coaches)]
+                yield access(coach, "COACH", skater)
+                yield access(coach, "COACH", singles)
+                if skater.pk in solo_dance:
+                    yield access(coach, "COACH", solo_dance[skater.pk])
+                if len(coaches) > 1 and i % 5 == 0:
+                    yield access(coaches[(i + 1) % len(coaches)], "COLLABORATOR", skater)
+            for owner in self.owners[len(club.skaters) :]:
+                yield access(owner.coach, "COACH", owner.entity)
+            for team in club.synchro_teams:
+                for coach in coaches[1:]:
+                    yield access(coach, "COLLABORATOR", team)
+            for guardian, skater in zip(guardians, minors):
+                yield access(guardian, "GUARDIAN", skater)
+            for observer, team in zip(observers, club.teams):
+                yield access(observer, "OBSERVER", team)
+
+        self.bulk(PlanningEntityAccess, rows(), keep=False)
+
+    # --- 4. SEASONS, PLANS & PROGRAMS ---
+    def create_seasons(self):
+        rng = self.random("plans")
+        starts = self.season_starts()
+
+        seasons = self.bulk(
+            AthleteSeason,
+            (
+                AthleteSeason(
+                    season=f"{start.year}-{start.year + 1}",
+                    start_date=start,
+                    end_date=start.replace(year=start.year + 1) - timedelta(days=1),
+                    primary_coach=owner.coach,
+                    is_active=start == starts[-1],
+                    **owner.season_kwargs(),
+                )
+                for owner in self.owners
+                for start in starts
+            ),
+        )
+        for i, owner in enumerate(self.owners):
+            owner.seasons = seasons[i * len(starts) : (i + 1) * len(starts)]
+
+        plans = self.bulk(
+            YearlyPlan,
+            (
+                YearlyPlan(
+                    coach_owner=owner.coach,
+                    planning_entity=owner.entity,
+                    peak_type=rng.choice(["Single Peak", "Double Peak", "Development"]),
+                    primary_season_goal="Qualify for sectionals",
+                    title=f"{season.season} Plan",
+                )
+                for owner in self.owners
+                for season in owner.seasons
+            ),
+        )
+        for i, owner in enumerate(self.owners):
+            owner.plans = plans[i * len(starts) : (i + 1) * len(starts)]
+
+        PlanSeasons = YearlyPlan.athlete_seasons.through
+        self.bulk(
+            PlanSeasons,
+            (
+                PlanSeasons(yearlyplan=plan, athleteseason=season)
+                for owner in self.owners
+                for plan, season in zip(owner.plans, owner.seasons)
+            ),
+            keep=False,
+        )
+        self.bulk(
+            Macrocycle,
+            (
+                Macrocycle(
+                    yearly_plan=plan,
+                    phase_title=title,
+                    phase_start=season.start_date + timedelta(days=first),
+                    phase_end=season.start_date + timedelta(days=last),
+                    phase_focus=f"{title} focus",
+                    technical_focus=", ".join(rng.sample(list(ELEMENTS[owner.discipline]), 2)),
+                )
+                for owner in self.owners
+                for plan, season in zip(owner.plans, owner.seasons)
+                for title, first, last in PHASES
+            ),
+            keep=False,
+        )
+
+        programs = self.bulk(
+            Program,
+            (
+                Program(
+                    planning_entity=owner.entity,
+                    title=f"{category} {season.season}",
+                    season=season.season,
+                    program_category=category,
+                    music_title=f"Piece {rng.randrange(1000)}",
+                    est_base_value=round(sum(values[:7]), 2),
+                    planned_elements=codes[:7],
+                    is_active=season is owner.seasons[-1],
+                )
+                for owner in self.owners
+                for season in owner.seasons
+                for category in SEGMENTS[owner.discipline]
+                for codes in [rng.sample(list(ELEMENTS[owner.discipline]), 7)]
+                for values in [[ELEMENTS[owner.discipline][code] for code in codes]]
+            ),
+        )
+        programs = iter(programs)
+        for owner in self.owners:
+            for season in owner.seasons:
+                owner.programs[season.season] = [next(programs) for _ in SEGMENTS[owner.discipline]]
+
+    # --- 5. WEEKLY PLANS ---
+    # The high-volume rows below are built from raw ids (athlete_season_id=...)
+    # rather than instances, which skips the relation descriptors on every row
+    def weekly_plans(self):
+        rng = self.random("weeks")
+        for owner in self.owners:
+            for season in owner.seasons:
+                week = season.start_date - timedelta(days=season.start_date.weekday())
+                while week <= season.end_date:
+                    yield WeeklyPlan(
+                        athlete_season_id=season.pk,
+                        week_start=week,
+                        theme=rng.choice(["Consistency", "Endurance", "Program runs", "Taper"]),
+                        max_session_hours=rng.choice([8, 10, 12, 14]),
+                        max_session_count=self.sessions_per_week + 2,
+                        session_breakdown={"ON_ICE": self.sessions_per_week, "OFF_ICE": 1},
+                    )
+                    week += timedelta(days=7)
+
+    def planned_sessions(self, weeks, plan_for_season):
+        rng = self.random("planned_sessions")
+        for week in weeks:
+            owner, plan = plan_for_season[week.athlete_season_id]
+            for day in sorted(rng.sample(range(len(WEEKDAYS)), self.sessions_per_week)):
+                session_date = week.week_start + timedelta(days=day)
+                session_type = rng.choice(PLANNED_TYPES)
+                if session_date >= self.today:
+                    status = "PLANNED"
+                else:
+                    status = rng.choice(["COMPLETED"] * 8 + ["MISSED", "CANCELLED"])
+                yield PlannedSession(
+                    weekly_plan_id=week.pk,
+                    yearly_plan_id=plan.pk,
+                    day_of_week=WEEKDAYS[day],
+                    planned_time=time(6 + rng.randrange(12), 0),
+                    planned_duration=rng.choice([45, 60, 60, 90]),
+                    session_type=session_type,
+                    created_by_id=owner.coach.pk,
+                    planned_elements=(
+                        rng.sample(list(ELEMENTS[owner.discipline]), 3)
+                        if session_type == "ON_ICE"
+                        else []
+                    ),
+                    status=status,
+                )
+
+    def create_weeks(self):
+        plan_for_season = {
+            season.pk: (owner, plan)
+            for owner in self.owners
+            for season, plan in zip(owner.seasons, owner.plans)
+        }
+        for weeks in self.bulk_chunks(WeeklyPlan, self.weekly_plans()):
+            self.bulk(PlannedSession, self.planned_sessions(weeks, plan_for_season), keep=False)
+
+    # --- 6. SESSION LOGS ---
+    def protocol_element(self, rng, discipline, code):
+        base_value = ELEMENTS[discipline][code]
+        goe = rng.choice([-3, -2, -1, 0, 0, 1, 1, 2, 2, 3])
+        return {
+            "name": code,
+            "base_value": base_value,
+            "goe": goe,
+            "score": round(base_value * (1 + goe / 10), 2),
+            "calls": [rng.choice(CALLS)] if rng.random() < 0.1 else [],
+            "notes": "",
+        }
+
+    def program_run(self, rng, owner, program):
+        elements = [
+            self.protocol_element(rng, owner.discipline, code) for code in program.planned_elements
+        ]
+        run_type = rng.choice(["Full", "Full", "Half", "Sections"])
+        if run_type != "Full":
+            elements = elements[: len(elements) // 2]
+        return {
+            "id": rng.randrange(10**9, 10**10),
+            "program_id": program.pk,
+            "program_title": program.title,
+            "run_type": run_type,
+            "music": rng.random() < 0.8,
+            "quality": rng.randint(1, 5),
+            "elements": elements,
+            "total_score": round(sum(element["score"] for element in elements), 2),
+        }
+
+    def session_log(self, rng, owner, season, session_date):
+        codes = rng.sample(list(ELEMENTS[owner.discipline]), 3)
+        session_type = rng.choice(LOGGED_TYPES)
+        runs = []
+        if session_type == "ON_ICE" and rng.random() < 0.3:
+            runs = [self.program_run(rng, owner, rng.choice(owner.programs[season.season]))]
+        return SessionLog(
+            session_date=session_date,
+            session_time=time(6 + rng.randrange(12), 0),
+            location="Main Rink",
+            session_type=session_type,
+            author_id=owner.coach.pk,
+            athlete_season_id=season.pk,
+            content_type_id=owner.content_type_id,
+            object_id=owner.entity.pk,
+            energy_stamina=rng.randint(1, 5),
+            session_rating=rng.randint(1, 5),
+            jump_focus=(
+                {code: rng.randint(1, 5) for code in codes} if owner.discipline == "SINGLES" else {}
+            ),
+            program_runs=runs,
+            element_attempts=[
+                {"element_code": code, "attempts": attempts, "successful": rng.randint(0, attempts)}
+                for code in codes
+                for attempts in [rng.randint(3, 12)]
+            ],
+        )
+
+    def session_logs(self):
+        rng = self.random("logs")
+        for owner in self.owners:
+            for season in owner.seasons:
+                week = season.start_date - timedelta(days=season.start_date.weekday())
+                last = min(season.end_date, self.today)
+                while week <= last:
+                    for day in sorted(rng.sample(range(len(WEEKDAYS)), self.sessions_per_week)):
+                        session_date = week + timedelta(days=day)
+                        if season.start_date <= session_date <= last:
+                            yield self.session_log(rng, owner, season, session_date)
+                    week += timedelta(days=7)
+
+    def create_logs(self):
+        skater_ids = {
+            season.pk: season.skater_id for owner in self.owners for season in owner.seasons
+        }
+        for batch in self.bulk_chunks(SessionLog, self.session_logs()):
+            self.bulk(ElementAttemptFact, build_element_facts(batch, skater_ids), keep=False)
+        rows = rebuild_daily_loads([skater.pk for skater in self.club.skaters], self.batch_size)
+        self.club.counts["DailyTrainingLoad"] = rows
+
+    # --- 7. GOALS, INJURIES & TESTS ---
+    def create_goals_and_injuries(self):
+        club = self.club
+        rng = self.random("goals")
+        self.bulk(
+            Goal,
+            (
+                Goal(
+                    title=title,
+                    planning_entity=owner.entity,
+                    assignee_skater=owner.skater,
+                    created_by=owner.coach,
+                    goal_type="Technical",
+                    goal_timeframe="Season",
+                    start_date=season.start_date,
+                    target_date=season.start_date + timedelta(days=rng.randrange(365)),
+                    current_status=(
+                        rng.choice(["IN_PROGRESS", "APPROVED", "COMPLETED", "DRAFT"])
+                        if season is owner.seasons[-1]
+                        else rng.choice(["COMPLETED", "ARCHIVED"])
+                    ),
+                )
+                for owner in self.owners
+                for season in owner.seasons
+                for title in ("Land clean 2A", "Improve spin levels", "Build stamina")
+            ),
+            keep=False,
+        )
+
+        rng = self.random("injuries")
+        self.bulk(
+            InjuryLog,
+            (
+                InjuryLog(
+                    skater=skater,
+                    injury_type=rng.choice(["Sprain", "Strain", "Bruise"]),
+                    body_area=[rng.choice(["Ankle", "Knee", "Hip", "Back"])],
+                    date_of_onset=self.today - timedelta(days=rng.randrange(300)),
+                    severity=rng.choice(["Minor", "Moderate"]),
+                    recovery_status=rng.choice(["Active", "Recovering", "Resolved"]),
+                )
+                for skater in club.skaters[::7]
+            ),
+            keep=False,
+        )
+        self.bulk(
+            SkaterTest,
+            (
+                SkaterTest(
+                    skater=skater,
+                    test_name=rng.choice(["Gold Skills", "Gold Dance", "Gold Artistic"]),
+                    test_date=self.today - timedelta(days=rng.randrange(300)),
+                    status="COMPLETED",
+                    result=rng.choice(["Pass", "Retry", "Honors"]),
+                )
+                for skater in club.skaters[::2]
+            ),
+            keep=False,
+        )
+
+    # --- 8. COMPETITIONS ---
+    def create_competitions(self):
+        club = self.club
+        rng = self.random("competitions")
+        competitions = []
+        for start in self.season_starts():
+            for n in range(6):
+                day = start + timedelta(days=75 + 40 * n)
+                if day > self.today:
+                    break
+                city, province = rng.choice(CITIES)
+                competitions.append(
+                    Competition(
+                        title=f"{city} Invitational {day.year} #{n + 1} ({self.prefix})",
+                        city=city,
+                        province_state=province,
+                        start_date=day,
+                        end_date=day + timedelta(days=2),
+                        created_by=club.coach,
+                    )
+                )
+        club.competitions = self.bulk(Competition, competitions)
+        if not club.competitions:
+            return
+
+        def results():
+            for owner in self.owners:
+                for competition in rng.sample(club.competitions, min(4, len(club.competitions))):
+                    yield self.result(rng, owner, competition)
+
+        self.bulk(CompetitionResult, results(), keep=False)
+
+    def result(self, rng, owner, competition):
+        season = season_bounds(competition.start_date)[0].year
+        programs = owner.programs.get(f"{season}-{season + 1}") or []
+        segments = []
+        protocol = []
+        for segment, program in zip(SEGMENTS[owner.discipline], programs):
+            elements = [
+                self.protocol_element(rng, owner.discipline, code)
+                for code in program.planned_elements
+            ]
+            tes = round(sum(element["score"] for element in elements), 2)
+            pcs = round(rng.uniform(15, 50), 2)
+            segments.append(
+                {
+                    "name": SEGMENT_NAMES[segment],
+                    "score": round(tes + pcs, 2),
+                    "tes": tes,
+                    "pcs": pcs,
+                }
+            )
+            protocol.extend(dict(element, segment=SEGMENT_NAMES[segment]) for element in elements)
+        return CompetitionResult(
+            competition=competition,
+            planning_entity=owner.entity,
+            status="COMPLETED",
+            level=getattr(owner.entity, "current_level", None)
+            or getattr(owner.entity, "level", ""),
+            placement=rng.randint(1, 12),
+            total_score=round(sum(s["score"] for s in segments), 2),
+            planned_base_value=round(sum(p.est_base_value for p in programs), 2),
+            segment_scores=segments,
+            detailed_protocol=protocol,
+        )
+
+    # --- 9. LOGISTICS & INVITES ---
+    def create_logistics(self):
+        club = self.club
+        trips = self.bulk(
+            TeamTrip,
+            (
+                TeamTrip(
+                    team=team,
+                    competition=club.competitions[-1] if club.competitions else None,
+                    title=f"{team.team_name} Sectionals",
+                    start_date=self.today + timedelta(days=30),
+                    end_date=self.today + timedelta(days=33),
+                    hotel_info="Rinkside Hotel",
+                )
+                for team in club.synchro_teams
+            ),
+        )
+        start = timezone.make_aware(datetime.combine(self.today + timedelta(days=30), time(8)))
+        self.bulk(
+            ItineraryItem,
+            (
+                ItineraryItem(
+                    trip=trip,
+                    start_time=start + timedelta(hours=3 * n),
+                    activity=activity,
+                    category=category,
+                )
+                for trip in trips
+                for n, (activity, category) in enumerate(
+                    [("Bus to rink", "TRAVEL"), ("Practice ice", "ICE"), ("Team dinner", "MEAL")]
+                )
+            ),
+            keep=False,
+        )
+        rooms = self.bulk(
+            HousingAssignment,
+            (
+                HousingAssignment(trip=trip, room_number=str(100 + n))
+                for trip in trips
+                for n in range(4)
+            ),
+        )
+        Occupants = HousingAssignment.occupants.through
+        self.bulk(
+            Occupants,
+            (
+                Occupants(housingassignment=room, skater=skater)
+                for i, team in enumerate(club.synchro_teams)
+                for n, room in enumerate(rooms[i * 4 : (i + 1) * 4])
+                for skater in club.skaters[i * 16 + n * 4 : i * 16 + (n + 1) * 4]
+            ),
+            keep=False,
+        )
+
+        # A pending guardian invitation for every tenth skater
+        self.bulk(
+            Invitation,
+            (
+                Invitation(
+                    email=f"parent{skater.pk}.{self.prefix.lower()}@synthetic.example.com",
+                    sender=club.coach,
+                    role="GUARDIAN",
+                    target_entity=skater,
+                    token=f"{self.prefix}-{skater.pk}",
+                    expires_at=timezone.now() + timedelta(days=7),
+                )
+                for skater in club.skaters[::10]
+            ),
+            keep=False,
+        )
+
+    def build(self):
+        with transaction.atomic():
+            self.create_organization()
+            self.create_entities()
+            self.create_access()
+            self.create_seasons()
+            self.create_weeks()
+            self.create_logs()
+            self.create_goals_and_injuries()
+            self.create_competitions()
+            self.create_logistics()
+        return self.club
+
+
+def seed_synthetic_club(
+    coach=None,
+    skaters=200,
+    assistant_coaches=0,
+    seasons=3,
+    sessions_per_week=3,
+    seed=0,
+    club=0,
+    today=None,
+    batch_size=2000,
+):
+    """
+    Creates synthetic club number `club` headed by `coach` (a coach user is
+    created when omitted) and returns a SyntheticClub.
+
+    Sizes scale with `skaters`: one team per ten skaters, one synchro team of
+    16 per forty, and `seasons` seasons of history with `sessions_per_week`
+    planned and logged sessions per week for every skater and team. Skaters
+    are shared out between the head coach and `assistant_coaches`.
+    The same arguments (and `today`) always produce the same rows.
+    """
+    if coach is None:
+        coach, _ = User.objects.get_or_create(
+            email=f"coach.s{seed}c{club}@synthetic.example.com",
+            defaults={
+                "full_name": f"Synthetic Coach {club}",
+                "role": User.Role.COACH,
+                "password": make_password(None),
+            },
+        )
+    seeder = ClubSeeder(
+        coach,
+        skaters=max(1, skaters),
+        assistant_coaches=max(0, assistant_coaches),
+        seasons=max(1, seasons),
+        sessions_per_week=max(0, min(sessions_per_week, len(WEEKDAYS))),
+        seed=seed,
+        club=club,
+        today=today or date.today(),
+        batch_size=max(1, batch_size),
+    )
+    return seeder.build()
@@ -21,7 +21,7 @@ from .planning import (
     GoalSerializer,
     GapAnalysisSerializer,
 )
-from .logs import SessionLogSerializer, InjuryLogSerializer
+from .logs import SessionLogSerializer, SessionLogAthleteSerializer, InjuryLogSerializer
 from .competitions import (
     CompetitionSerializer,
     CompetitionResultSerializer,
@@ -1,5 +1,7 @@
 from rest_framework import serializers
 from api.models import Competition, CompetitionResult, SkaterTest, Program, ProgramAsset
+from api.services import get_model_for_content_type
+from .mixins import PlanningEntityListSerializer
 import json
 
 
@@ -38,8 +40,8 @@ class CompetitionResultSerializer(serializers.ModelSerializer):
         )
 
     def get_planning_entity_type(self, obj):
-        if obj.content_type:
-            return obj.content_type.model_class().__name__
+        if obj.content_type_id:
+            return get_model_for_content_type(obj.content_type_id).__name__
         return "Unknown"
 
     def validate_segment_scores(self, value):
@@ -105,10 +107,11 @@ class ProgramSerializer(serializers.ModelSerializer):
             "planning_entity_type",
             "dashboard_url",  # <--- Added
         )
+        list_serializer_class = PlanningEntityListSerializer
 
     def get_planning_entity_type(self, obj):
-        if obj.content_type:
-            return obj.content_type.model_class().__name__
+        if obj.content_type_id:
+            return get_model_for_content_type(obj.content_type_id).__name__
         return "Unknown"
 
     def get_dashboard_url(self, obj):
@@ -1,5 +1,6 @@
 from rest_framework import serializers
 from api.models import TeamTrip, ItineraryItem, HousingAssignment, Skater
+from .mixins import SparseFieldsMixin
 
 
 class ItineraryItemSerializer(serializers.ModelSerializer):
@@ -45,7 +46,7 @@ class HousingAssignmentSerializer(serializers.ModelSerializer):
         )
 
 
-class TeamTripSerializer(serializers.ModelSerializer):
+class TeamTripSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     itinerary = ItineraryItemSerializer(many=True, read_only=True)
     rooming_list = HousingAssignmentSerializer(many=True, read_only=True)
 
@@ -65,3 +66,4 @@ class TeamTripSerializer(serializers.ModelSerializer):
             "itinerary",
             "rooming_list",
         )
+        expandable_fields = ("itinerary", "rooming_list")
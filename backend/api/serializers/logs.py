@@ -1,9 +1,13 @@
 from rest_framework import serializers
 from api.models import SessionLog, InjuryLog
 from api.services import get_access_role
+from .mixins import SparseFieldsMixin, PlanningEntityListSerializer
 
+# Attendance statuses of a team log (as set by the log session form)
+ATTENDANCE_STATUSES = ("PRESENT", "LATE", "ABSENT")
 
-class SessionLogSerializer(serializers.ModelSerializer):
+
+class SessionLogSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     discipline_name = serializers.SerializerMethodField()
     author_name = serializers.SerializerMethodField()
 
@@ -32,6 +36,8 @@ class SessionLogSerializer(serializers.ModelSerializer):
             "element_attempts",
         )
         read_only_fields = ("author",)
+        list_serializer_class = PlanningEntityListSerializer
+        planning_entity_fields = ("discipline_name",)
 
     def get_discipline_name(self, obj):
         if obj.planning_entity:
@@ -74,6 +80,28 @@ class SessionLogSerializer(serializers.ModelSerializer):
         return super().update(instance, validated_data)
 
 
+class SessionLogAthleteSerializer(serializers.ModelSerializer):
+    """
+    One athlete's entry in a bulk synchro log: attendance, plus the fields
+    that override the practice for that athlete's own log.
+    """
+
+    skater_id = serializers.IntegerField()
+    status = serializers.ChoiceField(choices=ATTENDANCE_STATUSES, default="PRESENT")
+
+    class Meta:
+        model = SessionLog
+        fields = (
+            "skater_id",
+            "status",
+            "session_rating",
+            "energy_stamina",
+            "sentiment_emoji",
+            "coach_notes",
+            "element_attempts",
+        )
+
+
 class InjuryLogSerializer(serializers.ModelSerializer):
     skater = serializers.PrimaryKeyRelatedField(read_only=True)
     skater_name = serializers.SerializerMethodField()
@@ -0,0 +1,99 @@
+from django.db import models
+from rest_framework import permissions, serializers
+
+from api.services import prefetch_planning_entities
+
+
+def requested_fields(request, param="fields"):
+    """Parses ?fields=a,b,c into a set, or None when the client did not ask."""
+    if request is None:
+        return None
+    raw = request.query_params.get(param)
+    if not raw:
+        return None
+    return {name.strip() for name in raw.split(",") if name.strip()}
+
+
+def requested_expansions(request, param="expand"):
+    """
+    Parses ?expand=a,b into a set. An empty ?expand= gives an empty set (expand
+    nothing); None means the client did not send the parameter at all.
+    """
+    if request is None or param not in request.query_params:
+        return None
+    return requested_fields(request, param) or set()
+
+
+class SparseFieldsMixin:
+    """
+    Lets clients trim a response:
+    - ?fields=id,full_name,...  renders only those fields
+    - ?expand=macrocycles,...   heavy fields, listed in Meta.expandable_fields,
+      are only rendered when named in ?expand (or ?fields). Without ?expand
+      they render as before; a bare ?expand= drops them all.
+
+    Dropped fields are removed before rendering, so their nested serializers
+    and method fields never run. Only the top-level serializer (or the child of
+    a top-level list) is trimmed, and only on reads. Nested serializers render
+    in full, including ones built by hand with context["nested"] set.
+    """
+
+    def get_fields(self):
+        fields = super().get_fields()
+        request = self.context.get("request")
+        is_root = self.root is self or (
+            self.parent is self.root and isinstance(self.root, serializers.ListSerializer)
+        )
+        if (
+            not is_root
+            or self.context.get("nested")
+            or request is None
+            or request.method not in permissions.SAFE_METHODS
+        ):
+            return fields
+
+        wanted = requested_fields(request)
+        expand = requested_expansions(request)
+        expandable = getattr(self.Meta, "expandable_fields", ())
+        for name in list(fields):
+            if not _keep_field(name, wanted, expand, expandable):
+                fields.pop(name)
+        return fields
+
+
+def _keep_field(name, wanted, expand, expandable):
+    if wanted:
+        # An explicit ?fields= list wins, heavy fields included
+        return name in wanted
+    return expand is None or name not in expandable or name in expand
+
+
+def field_is_rendered(request, serializer_class, name):
+    """
+    Whether a top-level read with `serializer_class` includes `name`, so views
+    can skip prefetching relations for fields the client dropped.
+    """
+    if request is None or request.method not in permissions.SAFE_METHODS:
+        return True
+    return _keep_field(
+        name,
+        requested_fields(request),
+        requested_expansions(request),
+        getattr(serializer_class.Meta, "expandable_fields", ()),
+    )
+
+
+class PlanningEntityListSerializer(serializers.ListSerializer):
+    """
+    Loads `planning_entity` for every row of a list in one query per content
+    type before rendering. Children can limit this to the fields that read
+    the entity with Meta.planning_entity_fields; if none of those are
+    rendered (e.g. trimmed by ?fields=) nothing is loaded.
+    """
+
+    def to_representation(self, data):
+        rows = list(data.all() if isinstance(data, models.Manager) else data)
+        wanted = getattr(self.child.Meta, "planning_entity_fields", None)
+        if wanted is None or any(name in self.child.fields for name in wanted):
+            prefetch_planning_entities(rows)
+        return super().to_representation(rows)
@@ -10,6 +10,7 @@ from api.models import (
 )
 from django.contrib.contenttypes.models import ContentType
 from api.services import get_access_role
+from .mixins import SparseFieldsMixin, PlanningEntityListSerializer
 
 
 class AthleteSeasonSerializer(serializers.ModelSerializer):
@@ -27,7 +28,7 @@ class MacrocycleSerializer(serializers.ModelSerializer):
         fields = "__all__"
 
 
-class YearlyPlanSerializer(serializers.ModelSerializer):
+class YearlyPlanSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     macrocycles = MacrocycleSerializer(many=True, read_only=True)
     season_info = AthleteSeasonSerializer(
         source="athlete_seasons", many=True, read_only=True
@@ -54,6 +55,14 @@ class YearlyPlanSerializer(serializers.ModelSerializer):
             "dashboard_url",
             "access_level",
         )
+        expandable_fields = ("macrocycles", "season_info")
+        list_serializer_class = PlanningEntityListSerializer
+        planning_entity_fields = (
+            "planning_entity",
+            "discipline_name",
+            "dashboard_url",
+            "access_level",
+        )
 
     def get_planning_entity(self, obj):
         return str(obj.planning_entity)
@@ -86,7 +95,7 @@ class YearlyPlanSerializer(serializers.ModelSerializer):
         if not user:
             return None
 
-        if obj.coach_owner == user:
+        if obj.coach_owner_id == user.pk:
             return "OWNER"
 
         target = obj.planning_entity
@@ -131,6 +140,7 @@ class GoalSerializer(serializers.ModelSerializer):
         )
         # FIX: Ensure internal fields are read-only
         read_only_fields = ("created_by", "updated_by", "content_type", "object_id")
+        list_serializer_class = PlanningEntityListSerializer
 
     def get_created_by_name(self, obj):
         return obj.created_by.full_name if obj.created_by else "System"
@@ -1,5 +1,5 @@
 from rest_framework import serializers
-from django.contrib.contenttypes.models import ContentType
+from django.db import models
 from api.models import (
     Skater,
     AthleteProfile,
@@ -8,18 +8,21 @@ from api.models import (
     Team,
     SynchroTeam,
     Federation,
-    PlanningEntityAccess,
 )
 from .core import FederationSerializer
-from api.services import get_access_role
+from .mixins import SparseFieldsMixin
+from api.services import get_access_role, get_access_index, get_staff_directory, roster_teams
 
 
 # --- HELPERS ---
-def get_entity_staff(entity_obj, role_list):
-    ct = ContentType.objects.get_for_model(entity_obj)
-    access_records = PlanningEntityAccess.objects.filter(
-        content_type=ct, object_id=entity_obj.id, access_level__in=role_list
-    ).select_related("user")
+# Fields that read from the StaffDirectory (planning entities nest team staff)
+STAFF_FIELDS = {"guardians", "collaborators", "observers", "has_guardian", "planning_entities"}
+
+
+def get_entity_staff(entity_obj, role_list, directory=None):
+    # `directory` is the request's StaffDirectory; without one the rows are queried
+    directory = directory or get_staff_directory(None)
+    access_records = directory.records(entity_obj, role_list)
 
     results = []
     for record in access_records:
@@ -41,15 +44,11 @@ def get_visible_planning_entities(user, skater, context):
         return []
 
     # 1. Determine Access Rights
-    has_direct_access = False
-    if user.is_superuser or skater.user_account == user:
-        has_direct_access = True
-    else:
-        ct_skater = ContentType.objects.get_for_model(skater)
-        if PlanningEntityAccess.objects.filter(
-            user=user, content_type=ct_skater, object_id=skater.id
-        ).exists():
-            has_direct_access = True
+    is_owner = user.is_superuser or (
+        skater.user_account_id is not None and skater.user_account_id == user.pk
+    )
+    index = get_access_index(user) if not is_owner else None
+    has_direct_access = is_owner or index.direct_role_for(skater) is not None
 
     # 2. Add Personal Disciplines
     if has_direct_access:
@@ -66,27 +65,13 @@ def get_visible_planning_entities(user, skater, context):
     teams = list(skater.teams_as_partner_a.all()) + list(
         skater.teams_as_partner_b.all()
     )
-    ct_team = ContentType.objects.get_for_model(Team)
     for team in teams:
-        if (
-            user.is_superuser
-            or skater.user_account == user
-            or PlanningEntityAccess.objects.filter(
-                user=user, content_type=ct_team, object_id=team.id
-            ).exists()
-        ):
+        if is_owner or index.direct_role_for(team) is not None:
             entities.append(GenericPlanningEntitySerializer(team, context=context).data)
 
     # 4. Add Synchro
-    ct_synchro = ContentType.objects.get_for_model(SynchroTeam)
     for team in skater.synchro_teams.all():
-        if (
-            user.is_superuser
-            or skater.user_account == user
-            or PlanningEntityAccess.objects.filter(
-                user=user, content_type=ct_synchro, object_id=team.id
-            ).exists()
-        ):
+        if is_owner or index.direct_role_for(team) is not None:
             entities.append(GenericPlanningEntitySerializer(team, context=context).data)
 
     return entities
@@ -156,7 +141,7 @@ class SoloDanceEntitySerializer(serializers.ModelSerializer):
         return "Solo Dance"
 
 
-class TeamSerializer(serializers.ModelSerializer):
+class TeamSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     federation = FederationSerializer(read_only=True)
     federation_id = serializers.PrimaryKeyRelatedField(
         queryset=Federation.objects.all(),
@@ -200,15 +185,22 @@ class TeamSerializer(serializers.ModelSerializer):
             "observers",
             "access_level",
         )
+        expandable_fields = ("collaborators", "observers")
 
     def get_name(self, obj):
         return obj.get_discipline_display()
 
     def get_collaborators(self, obj):
-        return get_entity_staff(obj, ["COLLABORATOR", "MANAGER", "COACH"])
+        return get_entity_staff(
+            obj,
+            ["COLLABORATOR", "MANAGER", "COACH"],
+            get_staff_directory(self.context.get("request")),
+        )
 
     def get_observers(self, obj):
-        return get_entity_staff(obj, ["VIEWER", "OBSERVER"])
+        return get_entity_staff(
+            obj, ["VIEWER", "OBSERVER"], get_staff_directory(self.context.get("request"))
+        )
 
     def get_access_level(self, obj):
         user = self.context.get("request").user
@@ -217,7 +209,7 @@ class TeamSerializer(serializers.ModelSerializer):
         return get_access_role(user, obj)
 
 
-class SynchroTeamSerializer(serializers.ModelSerializer):
+class SynchroTeamSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     federation = FederationSerializer(read_only=True)
     federation_id = serializers.PrimaryKeyRelatedField(
         queryset=Federation.objects.all(),
@@ -261,6 +253,7 @@ class SynchroTeamSerializer(serializers.ModelSerializer):
             "name",
             "current_level",
         )
+        expandable_fields = ("roster", "collaborators", "observers")
 
     def get_name(self, obj):
         return obj.team_name
@@ -269,10 +262,16 @@ class SynchroTeamSerializer(serializers.ModelSerializer):
         return obj.level
 
     def get_collaborators(self, obj):
-        return get_entity_staff(obj, ["COLLABORATOR", "MANAGER", "COACH"])
+        return get_entity_staff(
+            obj,
+            ["COLLABORATOR", "MANAGER", "COACH"],
+            get_staff_directory(self.context.get("request")),
+        )
 
     def get_observers(self, obj):
-        return get_entity_staff(obj, ["VIEWER", "OBSERVER"])
+        return get_entity_staff(
+            obj, ["VIEWER", "OBSERVER"], get_staff_directory(self.context.get("request"))
+        )
 
     def get_access_level(self, obj):
         user = self.context.get("request").user
@@ -288,15 +287,17 @@ class SynchroTeamSerializer(serializers.ModelSerializer):
 
 class GenericPlanningEntitySerializer(serializers.Serializer):
     def to_representation(self, instance):
+        # Rendered inside another response: never trimmed by ?fields= / ?expand=
+        context = {**self.context, "nested": True}
         data = None
         if isinstance(instance, SinglesEntity):
-            data = SinglesEntitySerializer(instance, context=self.context).data
+            data = SinglesEntitySerializer(instance, context=context).data
         elif isinstance(instance, SoloDanceEntity):
-            data = SoloDanceEntitySerializer(instance, context=self.context).data
+            data = SoloDanceEntitySerializer(instance, context=context).data
         elif isinstance(instance, Team):
-            data = TeamSerializer(instance, context=self.context).data
+            data = TeamSerializer(instance, context=context).data
         elif isinstance(instance, SynchroTeam):
-            data = SynchroTeamSerializer(instance, context=self.context).data
+            data = SynchroTeamSerializer(instance, context=context).data
 
         if data is None:
             data = {"id": instance.id, "name": str(instance)}
@@ -335,7 +336,7 @@ class SkaterUpdateSerializer(serializers.ModelSerializer):
         return instance
 
 
-class SkaterSerializer(serializers.ModelSerializer):
+class SkaterSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     planning_entities = serializers.SerializerMethodField()
     gender = serializers.CharField(source="get_gender_display", read_only=True)
     federation = FederationSerializer(read_only=True)
@@ -369,6 +370,13 @@ class SkaterSerializer(serializers.ModelSerializer):
             "has_guardian",
             "access_level",
         )
+        expandable_fields = (
+            "planning_entities",
+            "synchro_teams",
+            "guardians",
+            "collaborators",
+            "observers",
+        )
 
     def get_planning_entities(self, obj):
         return get_visible_planning_entities(
@@ -378,14 +386,18 @@ class SkaterSerializer(serializers.ModelSerializer):
     def get_user_account_email(self, obj):
         return obj.user_account.email if obj.user_account else None
 
-    def get_guardians(self, obj):
-        from django.contrib.contenttypes.models import ContentType
-
-        ct = ContentType.objects.get_for_model(obj)
-        access_records = PlanningEntityAccess.objects.filter(
-            content_type=ct, object_id=obj.id, access_level="GUARDIAN"
-        ).select_related("user")
+    def to_representation(self, instance):
+        # One staff lookup for the skater and, when rendered, every team it is on
+        entities = []
+        if STAFF_FIELDS.intersection(self.fields):
+            entities.append(instance)
+        if "planning_entities" in self.fields:
+            entities += roster_teams([instance])
+        get_staff_directory(self.context.get("request")).load(entities)
+        return super().to_representation(instance)
 
+    def get_guardians(self, obj):
+        directory = get_staff_directory(self.context.get("request"))
         return [
             {
                 "id": record.id,
@@ -393,22 +405,16 @@ class SkaterSerializer(serializers.ModelSerializer):
                 "full_name": record.user.full_name,
                 "email": record.user.email,
             }
-            for record in access_records
+            for record in directory.guardians(obj)
         ]
 
     def get_has_guardian(self, obj):
-        return len(self.get_guardians(obj)) > 0
+        return bool(get_staff_directory(self.context.get("request")).guardians(obj))
 
     def get_collaborators(self, obj):
-        ct = ContentType.objects.get_for_model(obj)
-        access_records = PlanningEntityAccess.objects.filter(
-            content_type=ct,
-            object_id=obj.id,
-            access_level__in=["COLLABORATOR", "MANAGER", "COACH"],
-        ).select_related("user")
-
+        directory = get_staff_directory(self.context.get("request"))
         results = []
-        for record in access_records:
+        for record in directory.collaborators(obj):
             if obj.user_account and record.user == obj.user_account:
                 continue
 
@@ -424,13 +430,9 @@ class SkaterSerializer(serializers.ModelSerializer):
         return results
 
     def get_observers(self, obj):
-        ct = ContentType.objects.get_for_model(obj)
-        access_records = PlanningEntityAccess.objects.filter(
-            content_type=ct, object_id=obj.id, access_level__in=["VIEWER", "OBSERVER"]
-        ).select_related("user")
-
+        directory = get_staff_directory(self.context.get("request"))
         results = []
-        for record in access_records:
+        for record in directory.observers(obj):
             results.append(
                 {
                     "id": record.id,
@@ -446,6 +448,19 @@ class SkaterSerializer(serializers.ModelSerializer):
         return get_access_role(self.context.get("request").user, obj)
 
 
+class RosterListSerializer(serializers.ListSerializer):
+    """
+    Loads the staff of every team on the page into the request's StaffDirectory
+    in one query, before the nested Team / SynchroTeam serializers ask for it.
+    Expects skaters loaded with prefetch_roster().
+    """
+
+    def to_representation(self, data):
+        skaters = list(data.all() if isinstance(data, models.Manager) else data)
+        get_staff_directory(self.context.get("request")).load(roster_teams(skaters))
+        return super().to_representation(skaters)
+
+
 class RosterSkaterSerializer(serializers.ModelSerializer):
     planning_entities = serializers.SerializerMethodField()
     federation = FederationSerializer(read_only=True)
@@ -464,6 +479,7 @@ class RosterSkaterSerializer(serializers.ModelSerializer):
             "access_level",
             "is_active",  # <--- ADDED BACK
         )
+        list_serializer_class = RosterListSerializer
 
     def get_planning_entities(self, obj):
         return get_visible_planning_entities(
@@ -0,0 +1,82 @@
+# Import everything to expose it at api.services
+from .content_types import (
+    PLANNING_ENTITY_MODELS,
+    get_content_type,
+    get_content_type_id,
+    get_model_for_content_type,
+    warm_content_types,
+)
+from .access import (
+    AccessIndex,
+    get_access_index,
+    clear_access_index,
+    get_access_role,
+    get_accessible_skaters,
+)
+from .planning_alerts import collect_planning_alerts
+from .dashboard_cache import (
+    DASHBOARD_SECTIONS,
+    get_dashboard_sections,
+    get_dashboard_users,
+    invalidate_dashboard,
+    invalidate_dashboard_users,
+)
+from .agenda import build_agenda
+from .weekly_plans import MAX_RANGE_WEEKS, week_starts, get_week_plans
+from .stats import (
+    ResultColumns,
+    compute_stats,
+    load_owner_columns,
+    load_owner_volume,
+)
+from .performance import (
+    summary_payload,
+    build_performance_summaries,
+    get_performance_summaries,
+    refresh_results,
+    refresh_volume,
+    delete_performance_summary,
+)
+from .generic_relations import prefetch_planning_entities
+from .roster import prefetch_roster, roster_teams
+from .staff import (
+    StaffDirectory,
+    get_staff_directory,
+    COLLABORATOR_ROLES,
+    OBSERVER_ROLES,
+    GUARDIAN_ROLES,
+)
+from .instrumentation import (
+    fingerprint,
+    install_serializer_timer,
+    endpoint_stats,
+    EndpointStats,
+    RequestMetrics,
+)
+from .element_consistency import (
+    ROLLING_WEEKS,
+    element_consistency,
+    get_consistency_weeks,
+    invalidate_consistency_weeks,
+    clear_consistency_cache,
+)
+from .element_facts import (
+    MAX_SERIES_WEEKS,
+    parse_element_attempts,
+    parse_program_runs,
+    build_element_facts,
+    sync_element_facts,
+    element_success_series,
+)
+from .training_load import (
+    ACWR_LOW,
+    ACWR_HIGH,
+    MAX_LOAD_DAYS,
+    compute_daily_loads,
+    refresh_daily_loads,
+    rebuild_daily_loads,
+    load_curve,
+    get_roster_load,
+)
+from .compliance import MAX_COMPLIANCE_DAYS, planned_vs_logged, compliance_report
+from .session_logs import bulk_create_session_logs
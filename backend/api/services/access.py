@@ -0,0 +1,183 @@
+from django.db.models import Q
+from api.models import (
+    PlanningEntityAccess,
+    Skater,
+    SinglesEntity,
+    SoloDanceEntity,
+    Team,
+    SynchroTeam,
+)
+from .content_types import get_content_type
+
+
+class AccessIndex:
+    """
+    Every (content type id, object id) -> role mapping for a single user.
+
+    Built once with a handful of bulk queries:
+    1. Skater profiles linked to the user (identity -> "SKATER")
+    2. All PlanningEntityAccess rows for the user (direct roles)
+    3. Partners of the Teams the user has access to (inherited skater roles)
+    4. Rosters of the SynchroTeams the user has access to (inherited skater roles)
+
+    Precedence matches the original per-call lookup: identity, then direct
+    access, then Team inheritance, then Synchro inheritance. When several rows
+    compete, the oldest access row (lowest pk) wins.
+    """
+
+    def __init__(self, user):
+        self.user = user
+        self.roles = {}
+        self.direct = {}
+        self._build()
+
+    def _build(self):
+        ct_skater = get_content_type(Skater)
+        ct_team = get_content_type(Team)
+        ct_synchro = get_content_type(SynchroTeam)
+
+        # 1. Identity (Am I this skater?)
+        for skater_id in Skater.objects.filter(user_account=self.user).values_list(
+            "id", flat=True
+        ):
+            self.roles[(ct_skater.id, skater_id)] = "SKATER"
+
+        # 2. Direct Access
+        team_rows = []
+        synchro_rows = []
+        access_rows = (
+            PlanningEntityAccess.objects.filter(user=self.user)
+            .order_by("id")
+            .values_list("content_type_id", "object_id", "access_level")
+        )
+        for ct_id, object_id, level in access_rows:
+            self.direct.setdefault((ct_id, object_id), level)
+            self.roles.setdefault((ct_id, object_id), level)
+            if ct_id == ct_team.id:
+                team_rows.append((object_id, level))
+            elif ct_id == ct_synchro.id:
+                synchro_rows.append((object_id, level))
+
+        # 3. Indirect Access (Teams -> Partners)
+        if team_rows:
+            partners = {
+                team_id: (partner_a_id, partner_b_id)
+                for team_id, partner_a_id, partner_b_id in Team.objects.filter(
+                    id__in=[team_id for team_id, _ in team_rows]
+                ).values_list("id", "partner_a_id", "partner_b_id")
+            }
+            for team_id, level in team_rows:
+                for skater_id in partners.get(team_id, ()):
+                    if skater_id:
+                        self.roles.setdefault((ct_skater.id, skater_id), level)
+
+        # 4. Indirect Access (Synchro -> Roster)
+        if synchro_rows:
+            rosters = {}
+            memberships = SynchroTeam.roster.through.objects.filter(
+                synchroteam_id__in=[team_id for team_id, _ in synchro_rows]
+            ).values_list("synchroteam_id", "skater_id")
+            for team_id, skater_id in memberships:
+                rosters.setdefault(team_id, []).append(skater_id)
+            for team_id, level in synchro_rows:
+                for skater_id in rosters.get(team_id, ()):
+                    self.roles.setdefault((ct_skater.id, skater_id), level)
+
+    def _key(self, entity):
+        return (get_content_type(entity).id, entity.pk)
+
+    def role_for(self, entity):
+        """Effective role on the entity, including identity and inherited roles."""
+        return self.roles.get(self._key(entity))
+
+    def direct_role_for(self, entity):
+        """Role granted by a PlanningEntityAccess row on exactly this entity."""
+        return self.direct.get(self._key(entity))
+
+
+def get_access_index(user):
+    """
+    Returns the AccessIndex for this user, building it on first use.
+    The index is memoized on the user instance, which DRF keeps for the whole
+    request, so permissions, views and serializers all share one build.
+    """
+    index = getattr(user, "_access_index", None)
+    if index is None:
+        index = AccessIndex(user)
+        user._access_index = index
+    return index
+
+
+def clear_access_index(user):
+    """Drops the memoized index after access rows change mid-request."""
+    user.__dict__.pop("_access_index", None)
+
+
+def get_access_role(user, entity):
+    """
+    Determines the specific role (OWNER, COLLABORATOR, VIEWER, GUARDIAN, MANAGER)
+    a user has on a specific entity (Skater/Team).
+    """
+    if not user or not user.is_authenticated:
+        return None
+
+    if user.is_superuser:
+        return "COACH"
+
+    if entity is None:
+        return None
+
+    return get_access_index(user).role_for(entity)
+
+
+def get_accessible_skaters(user, filter_mode="ALL"):
+    """
+    Returns QuerySet of ALL skaters (Active + Archived).
+    Sorted by Active First, then Name.
+    """
+    if user.role == "SKATER":
+        # Skaters only see themselves (Active only? Or should they see archived self? Usually active)
+        return Skater.objects.filter(user_account=user)
+
+    access = PlanningEntityAccess.objects.filter(user=user)
+    if filter_mode == "OPERATIONAL":
+        access = access.exclude(access_level__in=["VIEWER", "OBSERVER"])
+
+    def entity_ids(model):
+        ct = get_content_type(model)
+        return access.filter(content_type=ct).values("object_id")
+
+    # One subquery per content type, OR-ed into a single statement so the
+    # query count does not grow with the number of access rows.
+    team_ids = entity_ids(Team)
+    query = (
+        Q(id__in=entity_ids(Skater))
+        | Q(
+            id__in=SinglesEntity.objects.filter(
+                id__in=entity_ids(SinglesEntity)
+            ).values("skater_id")
+        )
+        | Q(
+            id__in=SoloDanceEntity.objects.filter(
+                id__in=entity_ids(SoloDanceEntity)
+            ).values("skater_id")
+        )
+        | Q(id__in=Team.objects.filter(id__in=team_ids).values("partner_a_id"))
+        | Q(
+            id__in=Team.objects.filter(
+                id__in=team_ids, partner_b__isnull=False
+            ).values("partner_b_id")
+        )
+        | Q(
+            id__in=SynchroTeam.roster.through.objects.filter(
+                synchroteam_id__in=entity_ids(SynchroTeam)
+            ).values("skater_id")
+        )
+    )
+
+    if user.role == "COACH":
+        linked = Skater.objects.filter(user_account=user).order_by("full_name")
+        query |= Q(id__in=linked.values("id")[:1])
+
+    # FIX: Removed is_active=True filter, added ordering
+    return Skater.objects.filter(query).order_by("-is_active", "full_name")
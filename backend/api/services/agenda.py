@@ -0,0 +1,145 @@
+from datetime import date, timedelta
+
+from django.db.models import Case, When, Q, OuterRef, Subquery, IntegerField, CharField
+
+from api.models import (
+    SkaterTest,
+    CompetitionResult,
+    SinglesEntity,
+    SoloDanceEntity,
+    Team,
+    SynchroTeam,
+)
+from .content_types import get_content_type
+from .access import get_access_role
+
+
+def _entity_value(model, field, output_field):
+    return Subquery(
+        model.objects.filter(id=OuterRef("object_id")).values(field)[:1],
+        output_field=output_field,
+    )
+
+
+def build_agenda(user, skaters, teams, synchro_teams, today=None):
+    """
+    Upcoming tests and competitions (next two weeks) for a coach's entities.
+
+    Competition attendance is resolved in a single query: results are matched
+    to the coach's entity ids per content type, and the display name / skater
+    id are annotated from the entity tables instead of loading each result's
+    planning_entity.
+    """
+    today = today or date.today()
+    two_weeks = today + timedelta(days=14)
+    agenda_items = []
+
+    # 1. Tests (Skater only)
+    upcoming_tests = (
+        SkaterTest.objects.filter(test_date__range=(today, two_weeks), skater__in=skaters)
+        .select_related("skater")
+        .order_by("test_date")
+    )
+    for t in upcoming_tests:
+        agenda_items.append(
+            {
+                "type": "Test",
+                "title": t.test_name,
+                "who": t.skater.full_name,
+                "date": t.test_date,
+                "is_shared": get_access_role(user, t.skater) == "COLLABORATOR",
+                "link": f"#/skater/{t.skater.id}?tab=tests",
+            }
+        )
+
+    # 2. Competitions the coach's entities are entered in
+    ct_singles = get_content_type(SinglesEntity)
+    ct_solo = get_content_type(SoloDanceEntity)
+    ct_team = get_content_type(Team)
+    ct_synchro = get_content_type(SynchroTeam)
+
+    entity_query = (
+        Q(
+            content_type=ct_singles,
+            object_id__in=SinglesEntity.objects.filter(skater__in=skaters).values("id"),
+        )
+        | Q(
+            content_type=ct_solo,
+            object_id__in=SoloDanceEntity.objects.filter(skater__in=skaters).values("id"),
+        )
+        | Q(content_type=ct_team, object_id__in=teams.values("id"))
+        | Q(content_type=ct_synchro, object_id__in=synchro_teams.values("id"))
+    )
+
+    results = (
+        CompetitionResult.objects.filter(
+            entity_query, competition__start_date__range=(today, two_weeks)
+        )
+        .annotate(
+            entity_name=Case(
+                When(
+                    content_type=ct_singles,
+                    then=_entity_value(SinglesEntity, "skater__full_name", CharField()),
+                ),
+                When(
+                    content_type=ct_solo,
+                    then=_entity_value(SoloDanceEntity, "skater__full_name", CharField()),
+                ),
+                When(
+                    content_type=ct_team,
+                    then=_entity_value(Team, "team_name", CharField()),
+                ),
+                default=_entity_value(SynchroTeam, "team_name", CharField()),
+            ),
+            entity_skater_id=Case(
+                When(
+                    content_type=ct_singles,
+                    then=_entity_value(SinglesEntity, "skater_id", IntegerField()),
+                ),
+                When(
+                    content_type=ct_solo,
+                    then=_entity_value(SoloDanceEntity, "skater_id", IntegerField()),
+                ),
+                default=None,
+            ),
+        )
+        .order_by("competition__start_date", "competition_id", "id")
+        .values(
+            "competition_id",
+            "competition__title",
+            "competition__start_date",
+            "content_type_id",
+            "object_id",
+            "entity_name",
+            "entity_skater_id",
+        )
+    )
+
+    # 3. Group by competition
+    competitions = {}
+    for r in results:
+        comp = competitions.get(r["competition_id"])
+        if comp is None:
+            if r["entity_skater_id"]:
+                link = f"#/skater/{r['entity_skater_id']}?tab=competitions"
+            elif r["content_type_id"] == ct_team.id:
+                link = f"#/team/{r['object_id']}?tab=competitions"
+            else:
+                link = f"#/synchro/{r['object_id']}?tab=competitions"
+            comp = competitions[r["competition_id"]] = {
+                "type": "Competition",
+                "title": r["competition__title"],
+                "who": [],
+                "date": r["competition__start_date"],
+                "is_shared": False,
+                "link": link,
+            }
+        if r["entity_name"] not in comp["who"]:
+            comp["who"].append(r["entity_name"])
+
+    for comp in competitions.values():
+        comp["who"] = ", ".join(comp["who"])
+        agenda_items.append(comp)
+
+    agenda_items.sort(key=lambda x: x["date"])
+    return agenda_items
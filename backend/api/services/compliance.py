@@ -0,0 +1,174 @@
+from collections import defaultdict
+from datetime import date, timedelta
+
+from django.db.models import (
+    Case,
+    Count,
+    DateField,
+    ExpressionWrapper,
+    F,
+    IntegerField,
+    OuterRef,
+    Q,
+    Subquery,
+    Sum,
+    Value,
+    When,
+)
+from django.db.models.functions import Coalesce
+
+from api.models import PlannedSession, SessionLog
+from .training_load import DAY_NAMES
+
+# A planned session is done by a log of this type (SessionLog has fewer types)
+LOG_TYPES = {
+    PlannedSession.SessionType.ON_ICE: SessionLog.SessionType.ON_ICE,
+    PlannedSession.SessionType.OFF_ICE: SessionLog.SessionType.OFF_ICE,
+    PlannedSession.SessionType.CONDITIONING: SessionLog.SessionType.OFF_ICE,
+    PlannedSession.SessionType.CLASS: SessionLog.SessionType.CLASS,
+    PlannedSession.SessionType.COMPETITION: SessionLog.SessionType.COMPETITION,
+}
+# Planned but never logged, so they say nothing about compliance
+UNTRACKED_TYPES = [PlannedSession.SessionType.REST, PlannedSession.SessionType.TRAVEL]
+
+# A whole season (July to June) plus the partial weeks at either end
+MAX_COMPLIANCE_DAYS = 371
+
+
+def _monday(day):
+    return day - timedelta(days=day.weekday())
+
+
+def _planned_date():
+    offset = Case(
+        *[When(day_of_week=day, then=Value(i)) for i, day in enumerate(DAY_NAMES)],
+        output_field=IntegerField(),
+    )
+    return ExpressionWrapper(F("weekly_plan__week_start") + offset, output_field=DateField())
+
+
+def _log_type():
+    return Case(
+        *[When(session_type=planned, then=Value(logged)) for planned, logged in LOG_TYPES.items()],
+        default=Value(SessionLog.SessionType.OTHER),
+    )
+
+
+def planned_vs_logged(season_ids, start, end):
+    """
+    Planned sessions of these seasons between `start` and `end`, grouped by
+    (season, day, type), each group matched to the logs of the same season,
+    day and type in one query. Rows are
+    (athlete_season_id, date, session_type, planned, minutes, logged, marked),
+    `marked` counting the sessions the coach set to COMPLETED.
+    """
+    logged = (
+        SessionLog.objects.filter(
+            athlete_season_id=OuterRef("weekly_plan__athlete_season_id"),
+            session_date=OuterRef("session_date"),
+            session_type=OuterRef("log_type"),
+        )
+        .order_by()
+        .values("athlete_season_id")
+        .annotate(count=Count("id"))
+        .values("count")
+    )
+    return (
+        PlannedSession.objects.filter(
+            weekly_plan__athlete_season_id__in=season_ids,
+            weekly_plan__week_start__range=(_monday(start), end),
+        )
+        .exclude(status=PlannedSession.Status.CANCELLED)
+        .exclude(session_type__in=UNTRACKED_TYPES)
+        .annotate(session_date=_planned_date(), log_type=_log_type())
+        .filter(session_date__range=(start, end))
+        .values("weekly_plan__athlete_season_id", "session_date", "session_type", "log_type")
+        .annotate(
+            planned=Count("id"),
+            minutes=Sum("planned_duration"),
+            logged=Coalesce(Subquery(logged), 0),
+            marked=Count("id", filter=Q(status=PlannedSession.Status.COMPLETED)),
+        )
+        .order_by()
+        .values_list(
+            "weekly_plan__athlete_season_id",
+            "session_date",
+            "session_type",
+            "planned",
+            "minutes",
+            "logged",
+            "marked",
+        )
+    )
+
+
+def _counts():
+    return {"planned": 0, "due": 0, "completed": 0, "planned_minutes": 0, "completed_minutes": 0}
+
+
+def _finish(counts):
+    counts["missed"] = counts["due"] - counts["completed"]
+    counts["completion"] = round(counts["completed"] / counts["due"], 3) if counts["due"] else None
+    counts["completed_minutes"] = round(counts["completed_minutes"])
+    return counts
+
+
+def compliance_report(season_ids, start, end, today=None):
+    """
+    Completion of the planned sessions of these seasons between `start` and
+    `end`: in total, per week (Monday to Sunday, also split by session type),
+    per session type and per season. Only sessions up to `today` are due;
+    later ones count as planned but not yet missed. Completed minutes credit
+    the planned duration of the sessions that were done.
+    """
+    today = today or date.today()
+    totals = _counts()
+    weeks = defaultdict(_counts)
+    week_types = defaultdict(lambda: defaultdict(_counts))
+    types = defaultdict(_counts)
+    seasons = defaultdict(_counts)
+
+    rows = planned_vs_logged(season_ids, start, end)
+    for season_id, day, session_type, planned, minutes, logged, marked in rows:
+        # Done when logged or marked COMPLETED; a log completes one session at most
+        completed = min(planned, max(logged, marked))
+        week = _monday(day)
+        due = day <= today
+        for counts in (
+            totals,
+            weeks[week],
+            week_types[week][session_type],
+            types[session_type],
+            seasons[season_id],
+        ):
+            counts["planned"] += planned
+            counts["planned_minutes"] += minutes
+            if due:
+                counts["due"] += planned
+                counts["completed"] += completed
+                counts["completed_minutes"] += minutes * completed / planned
+
+    week_list = []
+    week = _monday(start)
+    while week <= end:
+        week_list.append(
+            {
+                "week_start": week,
+                **_finish(weeks.get(week, _counts())),
+                "session_types": {
+                    session_type: _finish(counts)
+                    for session_type, counts in sorted(week_types.get(week, {}).items())
+                },
+            }
+        )
+        week += timedelta(days=7)
+
+    return {
+        "totals": _finish(totals),
+        "weeks": week_list,
+        "session_types": [
+            {"session_type": session_type, **_finish(counts)}
+            for session_type, counts in sorted(types.items())
+        ],
+        "seasons": {season_id: _finish(counts) for season_id, counts in seasons.items()},
+    }
@@ -0,0 +1,102 @@
+from django.contrib.contenttypes.models import ContentType
+from django.db import DatabaseError
+
+from api.models import (
+    Skater,
+    SinglesEntity,
+    SoloDanceEntity,
+    Team,
+    SynchroTeam,
+)
+
+# Everything that can sit behind a (content_type, object_id) planning entity link
+PLANNING_ENTITY_MODELS = (Skater, SinglesEntity, SoloDanceEntity, Team, SynchroTeam)
+
+
+class ContentTypeRegistry:
+    """
+    Model class <-> ContentType lookups in plain dicts.
+
+    The planning entity types are loaded together in one query by warm(), on
+    the first lookup that misses (no database access at import or startup);
+    any other model is resolved through Django's ContentType cache on first
+    use and remembered. reset() forgets everything, e.g. after a migrate,
+    where ids may have changed.
+    """
+
+    def __init__(self):
+        self.by_model = {}
+        self.by_id = {}
+        self.warmed = False
+
+    def _add(self, model, ct):
+        self.by_model[model] = ct
+        self.by_id[ct.id] = (ct, model)
+
+    def warm(self):
+        for model, ct in ContentType.objects.get_for_models(*PLANNING_ENTITY_MODELS).items():
+            self._add(model, ct)
+        self.warmed = True
+
+    def reset(self):
+        self.by_model.clear()
+        self.by_id.clear()
+        self.warmed = False
+
+    def content_type(self, model):
+        """ContentType for a model class or instance."""
+        if not isinstance(model, type):
+            model = type(model)
+        model = model._meta.concrete_model
+        ct = self.by_model.get(model)
+        if ct is None and not self.warmed:
+            self.warm()
+            ct = self.by_model.get(model)
+        if ct is None:
+            ct = ContentType.objects.get_for_model(model)
+            self._add(model, ct)
+        return ct
+
+    def model(self, content_type_id):
+        """Model class for a ContentType id (None when the model no longer exists)."""
+        entry = self.by_id.get(content_type_id)
+        if entry is None and not self.warmed:
+            self.warm()
+            entry = self.by_id.get(content_type_id)
+        if entry is None:
+            ct = ContentType.objects.get_for_id(content_type_id)
+            model = ct.model_class()
+            self.by_id[ct.id] = (ct, model)
+            if model is not None:
+                self.by_model[model] = ct
+            return model
+        return entry[1]
+
+
+content_types = ContentTypeRegistry()
+
+
+def get_content_type(model):
+    """ContentType for a model class or instance, without a query once warm."""
+    return content_types.content_type(model)
+
+
+def get_content_type_id(model):
+    return content_types.content_type(model).id
+
+
+def get_model_for_content_type(content_type_id):
+    """Model class behind a content_type_id; no query for planning entity types."""
+    return content_types.model(content_type_id)
+
+
+def warm_content_types(**kwargs):
+    """
+    Reloads the planning entity content types (connected to post_migrate).
+    Safe to call before the tables exist: the registry then fills in lazily.
+    """
+    content_types.reset()
+    try:
+        content_types.warm()
+    except DatabaseError:
+        content_types.reset()
@@ -0,0 +1,152 @@
+import uuid
+from datetime import date
+
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Q
+
+from api.models import (
+    PlanningEntityAccess,
+    Skater,
+    SinglesEntity,
+    SoloDanceEntity,
+    Team,
+    SynchroTeam,
+)
+from .content_types import get_content_type
+
+DASHBOARD_SECTIONS = ("injuries", "planning", "goals", "activity", "agenda")
+
+# Keys are dated, so a day's worth of caching is the most a section can live
+DASHBOARD_CACHE_TIMEOUT = 60 * 60 * 24
+
+
+def _version_key(user_id, section):
+    return f"dashboard:{user_id}:{section}:version"
+
+
+def _section_key(user_id, section, today, version):
+    return f"dashboard:{user_id}:{section}:{today.isoformat()}:{version}"
+
+
+def get_dashboard_sections(user, builders, today=None):
+    """
+    Returns {section: payload} for the coach dashboard, building only the
+    sections missing from the cache.
+
+    Each section is stored under a key that embeds the day and a per-section
+    version token. Invalidation swaps the token instead of deleting the data,
+    so a build that raced a write can only ever land under a retired key.
+    """
+    today = today or date.today()
+
+    # 1. Current version token for every section
+    version_keys = {section: _version_key(user.pk, section) for section in builders}
+    versions = cache.get_many(version_keys.values())
+    new_versions = {}
+    for section, key in version_keys.items():
+        if key not in versions:
+            new_versions[key] = uuid.uuid4().hex
+    if new_versions:
+        cache.set_many(new_versions, DASHBOARD_CACHE_TIMEOUT * 2)
+        versions.update(new_versions)
+
+    # 2. Cached payloads
+    keys = {
+        section: _section_key(user.pk, section, today, versions[version_keys[section]])
+        for section in builders
+    }
+    cached = cache.get_many(keys.values())
+
+    # 3. Build whatever is missing
+    sections = {}
+    missing = {}
+    for section, key in keys.items():
+        if key in cached:
+            sections[section] = cached[key]
+        else:
+            sections[section] = builders[section]()
+            missing[key] = sections[section]
+    if missing:
+        cache.set_many(missing, DASHBOARD_CACHE_TIMEOUT)
+
+    return sections
+
+
+def _skater_access_query(skater_ids):
+    """PlanningEntityAccess rows that put any of these skaters on a dashboard."""
+    ct = get_content_type
+    return (
+        Q(content_type=ct(Skater), object_id__in=skater_ids)
+        | Q(
+            content_type=ct(SinglesEntity),
+            object_id__in=SinglesEntity.objects.filter(skater_id__in=skater_ids).values("id"),
+        )
+        | Q(
+            content_type=ct(SoloDanceEntity),
+            object_id__in=SoloDanceEntity.objects.filter(skater_id__in=skater_ids).values("id"),
+        )
+        | Q(
+            content_type=ct(Team),
+            object_id__in=Team.objects.filter(
+                Q(partner_a_id__in=skater_ids) | Q(partner_b_id__in=skater_ids)
+            ).values("id"),
+        )
+        | Q(
+            content_type=ct(SynchroTeam),
+            object_id__in=SynchroTeam.roster.through.objects.filter(
+                skater_id__in=skater_ids
+            ).values("synchroteam_id"),
+        )
+    )
+
+
+def get_dashboard_users(refs):
+    """
+    Returns the ids of every user whose dashboard shows one of the given
+    planning entities. `refs` is an iterable of (model class, pk) pairs.
+
+    Skater-level entities (Skater, Singles, Solo Dance) reach anyone with access
+    to the skater through any discipline, team or synchro roster, plus the
+    skater's own account. Teams and Synchro Teams only reach their direct staff.
+    """
+    skater_query = Q()
+    entity_query = Q()
+    for model, pk in refs:
+        if model is None or pk is None:
+            continue
+        if model is Skater:
+            skater_query |= Q(id=pk)
+        elif model is SinglesEntity:
+            skater_query |= Q(singles_entities__id=pk)
+        elif model is SoloDanceEntity:
+            skater_query |= Q(solodance_entities__id=pk)
+        elif model in (Team, SynchroTeam):
+            entity_query |= Q(content_type=get_content_type(model), object_id=pk)
+
+    user_ids = set()
+    if skater_query:
+        skater_ids = Skater.objects.filter(skater_query).values("id")
+        entity_query |= _skater_access_query(skater_ids)
+        user_ids.update(
+            Skater.objects.filter(skater_query, user_account__isnull=False).values_list(
+                "user_account_id", flat=True
+            )
+        )
+    if entity_query:
+        user_ids.update(
+            PlanningEntityAccess.objects.filter(entity_query).values_list("user_id", flat=True)
+        )
+    return user_ids
+
+
+def invalidate_dashboard_users(user_ids, sections=DASHBOARD_SECTIONS):
+    """Retires the cached sections for these users once the transaction commits."""
+    keys = [_version_key(user_id, section) for user_id in user_ids for section in sections]
+    if keys:
+        transaction.on_commit(lambda: cache.delete_many(keys))
+
+
+def invalidate_dashboard(refs, sections=DASHBOARD_SECTIONS):
+    """Invalidates the given sections for everyone who can see the entities."""
+    invalidate_dashboard_users(get_dashboard_users(refs), sections)
@@ -0,0 +1,207 @@
+import uuid
+from datetime import timedelta
+
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Sum
+from django.db.models.functions import TruncWeek
+
+from api.models import ElementAttemptFact
+
+# Weeks summed by the rolling columns (the week itself and the 3 before it)
+ROLLING_WEEKS = 4
+# Rolling success rate moving less than this over the range is "flat"
+TREND_THRESHOLD = 0.05
+
+# Weeks are only rebuilt after a write to them; the timeout just bounds memory
+# (retired weeks are never read again)
+CONSISTENCY_CACHE_TIMEOUT = 60 * 60 * 24 * 30
+_VERSION_KEY = "element-consistency:version"
+
+SOURCES = {
+    ElementAttemptFact.Source.PRACTICE: "practice",
+    ElementAttemptFact.Source.PROGRAM_RUN: "program_runs",
+}
+
+
+def week_start(day):
+    return day - timedelta(days=day.weekday())
+
+
+def _week_version_key(skater_id, week):
+    return f"element-consistency:{skater_id}:{week.isoformat()}:version"
+
+
+def _week_versions(skater_id, weeks):
+    """
+    {week: version} for a skater's weeks: the global token plus the week's own
+    token, both read in one get_many and created on first use.
+    """
+    keys = {week: _week_version_key(skater_id, week) for week in weeks}
+    tokens = cache.get_many([_VERSION_KEY, *keys.values()])
+    new_tokens = {
+        key: uuid.uuid4().hex for key in [_VERSION_KEY, *keys.values()] if key not in tokens
+    }
+    if new_tokens:
+        cache.set_many(new_tokens, None)
+        tokens.update(new_tokens)
+    return {week: f"{tokens[_VERSION_KEY]}:{tokens[key]}" for week, key in keys.items()}
+
+
+def _week_key(version, skater_id, week):
+    return f"element-consistency:{version}:{skater_id}:{week.isoformat()}"
+
+
+def invalidate_consistency_weeks(skater_dates):
+    """
+    Retires the cached weeks for (skater_id, date) pairs once the transaction
+    commits. Each week's version token is swapped rather than the week deleted,
+    so a read that raced the write can only ever store its (stale) week under a
+    retired key. Other weeks stay cached.
+    """
+    weeks = {(skater_id, week_start(day)) for skater_id, day in skater_dates if skater_id}
+    if not weeks:
+        return
+
+    def bump():
+        cache.set_many(
+            {_week_version_key(skater_id, week): uuid.uuid4().hex for skater_id, week in weeks},
+            None,
+        )
+
+    transaction.on_commit(bump)
+
+
+def clear_consistency_cache():
+    """Retires every cached week (after a full rebuild of the facts)."""
+    cache.set(_VERSION_KEY, uuid.uuid4().hex, None)
+
+
+def _load_weeks(skater_id, weeks):
+    """
+    {week: {element_code: {source: [attempts, successful]}}} for `weeks`,
+    aggregated in one query over the span they cover.
+    """
+    buckets = {week: {} for week in weeks}
+    rows = (
+        ElementAttemptFact.objects.filter(
+            skater_id=skater_id,
+            session_date__range=(min(weeks), max(weeks) + timedelta(days=6)),
+        )
+        .annotate(week=TruncWeek("session_date"))
+        .values("week", "element_code", "source")
+        .annotate(attempts=Sum("attempts"), successful=Sum("successful"))
+        .order_by()
+    )
+    for row in rows:
+        if row["week"] in buckets:
+            bucket = buckets[row["week"]].setdefault(row["element_code"], {})
+            bucket[SOURCES[row["source"]]] = [row["attempts"], row["successful"]]
+    return buckets
+
+
+def get_consistency_weeks(skater_id, weeks):
+    """
+    Weekly element buckets for a skater, from the cache where possible.
+    Only weeks missing from the cache are aggregated, and then stored.
+    """
+    versions = _week_versions(skater_id, weeks)
+    keys = {week: _week_key(versions[week], skater_id, week) for week in weeks}
+    cached = cache.get_many(keys.values())
+
+    data = {week: cached[key] for week, key in keys.items() if key in cached}
+    missing = [week for week in weeks if week not in data]
+    if missing:
+        built = _load_weeks(skater_id, missing)
+        cache.set_many(
+            {keys[week]: bucket for week, bucket in built.items()}, CONSISTENCY_CACHE_TIMEOUT
+        )
+        data.update(built)
+    return data
+
+
+def _rate(successful, attempts):
+    return round(successful / attempts, 3) if attempts else None
+
+
+def _totals(by_source):
+    attempts = sum(counts[0] for counts in by_source.values())
+    successful = sum(counts[1] for counts in by_source.values())
+    return attempts, successful
+
+
+def element_consistency(skater_id, start, end, codes=None):
+    """
+    Per element: weekly attempts and success rate (split by practice and
+    program runs), a rolling ROLLING_WEEKS-week success rate and the trend
+    of that rolling rate across the range. Weeks run Monday to Sunday;
+    `start` and `end` are widened to whole weeks.
+    """
+    first = week_start(start)
+    weeks = []
+    week = first - timedelta(weeks=ROLLING_WEEKS - 1)
+    while week <= end:
+        weeks.append(week)
+        week += timedelta(days=7)
+
+    buckets = get_consistency_weeks(skater_id, weeks)
+    elements = sorted({code for bucket in buckets.values() for code in bucket})
+    if codes:
+        elements = [code for code in elements if code in codes]
+
+    results = []
+    for code in elements:
+        series = []
+        window = []
+        for week in weeks:
+            by_source = buckets[week].get(code, {})
+            attempts, successful = _totals(by_source)
+            window = (window + [(attempts, successful)])[-ROLLING_WEEKS:]
+            if week < first:
+                continue
+            rolling_attempts = sum(a for a, _ in window)
+            rolling_successful = sum(s for _, s in window)
+            series.append(
+                {
+                    "week_start": week,
+                    "attempts": attempts,
+                    "successful": successful,
+                    "success_rate": _rate(successful, attempts),
+                    **{
+                        name: {
+                            "attempts": by_source.get(name, [0, 0])[0],
+                            "successful": by_source.get(name, [0, 0])[1],
+                        }
+                        for name in SOURCES.values()
+                    },
+                    "rolling_attempts": rolling_attempts,
+                    "rolling_success_rate": _rate(rolling_successful, rolling_attempts),
+                }
+            )
+
+        attempts = sum(week["attempts"] for week in series)
+        if not attempts:
+            continue
+        successful = sum(week["successful"] for week in series)
+        rolling = [
+            week["rolling_success_rate"]
+            for week in series
+            if week["rolling_success_rate"] is not None
+        ]
+        change = round(rolling[-1] - rolling[0], 3) if len(rolling) > 1 else None
+        if change is None or abs(change) < TREND_THRESHOLD:
+            direction = "flat"
+        else:
+            direction = "up" if change > 0 else "down"
+        results.append(
+            {
+                "element_code": code,
+                "attempts": attempts,
+                "successful": successful,
+                "success_rate": _rate(successful, attempts),
+                "trend": {"change": change, "direction": direction},
+                "weeks": series,
+            }
+        )
+    results.sort(key=lambda element: (-element["attempts"], element["element_code"]))
+    return results
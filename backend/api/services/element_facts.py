@@ -0,0 +1,202 @@
+from datetime import timedelta
+
+from django.db.models import Sum
+from django.db.models.functions import TruncWeek
+
+from api.models import AthleteSeason, ElementAttemptFact, SkatingElement
+from .element_consistency import invalidate_consistency_weeks
+
+# Longest element time series served at once
+MAX_SERIES_WEEKS = 104
+
+
+def _count(value):
+    try:
+        return max(0, int(value))
+    except (TypeError, ValueError):
+        return 0
+
+
+def parse_element_attempts(entries):
+    """
+    {element_code: (attempts, successful)} from a log's element_attempts JSON.
+    Repeated codes are summed; malformed entries and empty codes are skipped,
+    and successes are capped at attempts.
+    """
+    totals = {}
+    for entry in entries or ():
+        if not isinstance(entry, dict):
+            continue
+        code = str(entry.get("element_code") or "").strip()
+        attempts = _count(entry.get("attempts"))
+        if not code or not attempts:
+            continue
+        successful = min(_count(entry.get("successful")), attempts)
+        previous = totals.get(code, (0, 0))
+        totals[code] = (previous[0] + attempts, previous[1] + successful)
+    return totals
+
+
+def element_ids(codes):
+    """SkatingElement id per abbreviation (active elements win, then lowest id)."""
+    ids = {}
+    for code, pk in (
+        SkatingElement.objects.filter(abbreviation__in=set(codes))
+        .order_by("-is_active", "id")
+        .values_list("abbreviation", "id")
+    ):
+        ids.setdefault(code, pk)
+    return ids
+
+
+def _goe(element):
+    """An element's GOE from a program run: `goe` (number) or `goe_grade` ("+2")."""
+    for key in ("goe", "goe_grade"):
+        try:
+            return float(element[key])
+        except (KeyError, TypeError, ValueError):
+            continue
+    return None
+
+
+def parse_program_runs(runs):
+    """
+    {element_code: (attempts, successful)} across a log's program_runs JSON.
+    Every listed element is an attempt; it counts as successful when its GOE
+    is zero or better. Elements without a name or GOE are skipped.
+    """
+    totals = {}
+    for run in runs or ():
+        if not isinstance(run, dict):
+            continue
+        for element in run.get("elements") or ():
+            if not isinstance(element, dict):
+                continue
+            code = str(element.get("name") or "").strip()
+            goe = _goe(element)
+            if not code or goe is None:
+                continue
+            previous = totals.get(code, (0, 0))
+            totals[code] = (previous[0] + 1, previous[1] + (goe >= 0))
+    return totals
+
+
+def build_element_facts(logs, skater_ids=None):
+    """
+    Unsaved ElementAttemptFact rows for `logs`, from both element_attempts
+    (PRACTICE) and program_runs (PROGRAM_RUN).
+    `skater_ids` maps athlete_season_id -> skater_id (None for team seasons);
+    missing seasons are loaded.
+    """
+    Source = ElementAttemptFact.Source
+    parsed = [
+        (log, source, totals)
+        for log in logs
+        for source, totals in (
+            (Source.PRACTICE, parse_element_attempts(log.element_attempts)),
+            (Source.PROGRAM_RUN, parse_program_runs(log.program_runs)),
+        )
+        if totals
+    ]
+    if not parsed:
+        return []
+
+    skater_ids = dict(skater_ids or {})
+    missing = {log.athlete_season_id for log, _, _ in parsed} - set(skater_ids)
+    if missing:
+        skater_ids.update(
+            AthleteSeason.objects.filter(id__in=missing).values_list("id", "skater_id")
+        )
+    elements = element_ids({code for _, _, totals in parsed for code in totals})
+
+    return [
+        ElementAttemptFact(
+            session_log_id=log.pk,
+            session_date=log.session_date,
+            source=source,
+            skater_id=skater_ids[log.athlete_season_id],
+            content_type_id=log.content_type_id,
+            object_id=log.object_id,
+            element_code=code,
+            element_id=elements.get(code),
+            attempts=attempts,
+            successful=successful,
+        )
+        for log, source, totals in parsed
+        for code, (attempts, successful) in totals.items()
+    ]
+
+
+def sync_element_facts(logs, skater_ids=None):
+    """
+    Replaces the facts of `logs` with ones built from their current JSON, and
+    drops the cached consistency weeks they fall in (before and after).
+    """
+    old = ElementAttemptFact.objects.filter(session_log_id__in=[log.pk for log in logs])
+    weeks = set(old.values_list("skater_id", "session_date").distinct())
+    old.delete()
+    facts = build_element_facts(logs, skater_ids)
+    ElementAttemptFact.objects.bulk_create(facts)
+    weeks.update((fact.skater_id, fact.session_date) for fact in facts)
+    invalidate_consistency_weeks(weeks)
+    return len(facts)
+
+
+def _rate(successful, attempts):
+    return round(successful / attempts, 3) if attempts else None
+
+
+def element_success_series(skater_id, start, end, codes=None):
+    """
+    Weekly attempts, successes and success rate per element for a skater,
+    aggregated in the database. Every week from `start` to `end` is present
+    (zeros where nothing was logged); elements are ordered by volume.
+    """
+    facts = ElementAttemptFact.objects.filter(skater_id=skater_id, session_date__range=(start, end))
+    if codes:
+        facts = facts.filter(element_code__in=codes)
+    rows = (
+        facts.annotate(week=TruncWeek("session_date"))
+        .values("element_code", "week")
+        .annotate(attempts=Sum("attempts"), successful=Sum("successful"))
+        .order_by()
+    )
+
+    first_week = start - timedelta(days=start.weekday())
+    weeks = []
+    week = first_week
+    while week <= end:
+        weeks.append(week)
+        week += timedelta(days=7)
+
+    by_code = {}
+    for row in rows:
+        by_code.setdefault(row["element_code"], {})[row["week"]] = (
+            row["attempts"],
+            row["successful"],
+        )
+
+    elements = []
+    for code, by_week in by_code.items():
+        attempts = sum(a for a, _ in by_week.values())
+        successful = sum(s for _, s in by_week.values())
+        elements.append(
+            {
+                "element_code": code,
+                "attempts": attempts,
+                "successful": successful,
+                "success_rate": _rate(successful, attempts),
+                "series": [
+                    {
+                        "week_start": week,
+                        "attempts": week_attempts,
+                        "successful": week_successful,
+                        "success_rate": _rate(week_successful, week_attempts),
+                    }
+                    for week in weeks
+                    for week_attempts, week_successful in [by_week.get(week, (0, 0))]
+                ],
+            }
+        )
+    elements.sort(key=lambda element: (-element["attempts"], element["element_code"]))
+    return elements
@@ -0,0 +1,53 @@
+from collections import defaultdict
+
+from api.models import SinglesEntity, SoloDanceEntity
+from .content_types import get_model_for_content_type
+
+# Loaded alongside each entity type: serializers and __str__ read the skater
+ENTITY_SELECT_RELATED = {
+    SinglesEntity: ("skater",),
+    SoloDanceEntity: ("skater",),
+}
+
+
+def prefetch_planning_entities(instances, field="planning_entity"):
+    """
+    Resolves a GenericForeignKey for a whole page of rows at once.
+
+    Rows are grouped by content type and each group is loaded with one query
+    (with ENTITY_SELECT_RELATED applied), then cached on the rows so
+    `obj.planning_entity` no longer queries per row. Rows whose entity is
+    already cached are left alone. Returns the rows as a list.
+    """
+    instances = list(instances)
+    if not instances:
+        return instances
+
+    gfk = instances[0]._meta.get_field(field)
+    ct_attname = instances[0]._meta.get_field(gfk.ct_field).attname
+
+    def ref(obj):
+        return (getattr(obj, ct_attname), getattr(obj, gfk.fk_field))
+
+    ids_by_ct = defaultdict(set)
+    for obj in instances:
+        ct_id, object_id = ref(obj)
+        if ct_id and object_id is not None and not gfk.is_cached(obj):
+            ids_by_ct[ct_id].add(object_id)
+
+    entities = {}
+    for ct_id, ids in ids_by_ct.items():
+        model = get_model_for_content_type(ct_id)
+        if model is None:
+            continue
+        queryset = model._base_manager.filter(pk__in=ids).select_related(
+            *ENTITY_SELECT_RELATED.get(model, ())
+        )
+        for entity in queryset:
+            entities[(ct_id, entity.pk)] = entity
+
+    for obj in instances:
+        entity = entities.get(ref(obj))
+        if entity is not None:
+            gfk.set_cached_value(obj, entity)
+    return instances
@@ -0,0 +1,202 @@
+import re
+import threading
+import time
+from collections import Counter, defaultdict, deque
+from contextvars import ContextVar
+
+from rest_framework.serializers import BaseSerializer
+
+# Requests kept per endpoint for the percentiles
+WINDOW = 200
+# A statement run this many times in one request is reported as a likely N+1
+DUPLICATE_THRESHOLD = 3
+# Longest SQL kept per duplicate fingerprint
+SQL_PREVIEW = 300
+
+_IN_LIST = re.compile(r"\((?:\s*%s\s*,)+\s*%s\s*\)")
+_STRING = re.compile(r"'(?:[^']|'')*'")
+_NUMBER = re.compile(r"\b\d+(?:\.\d+)?\b")
+_SPACE = re.compile(r"\s+")
+
+
+def fingerprint(sql):
+    """SQL with literals and IN (...) lists collapsed, so repeats of one statement match."""
+    sql = _STRING.sub("?", sql)
+    sql = _NUMBER.sub("?", sql)
+    sql = _IN_LIST.sub("(...)", sql)
+    return _SPACE.sub(" ", sql).strip()
+
+
+class RequestMetrics:
+    """Queries and timings of one request, filled in while it runs."""
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.queries = 0
+        self.db_ms = 0.0
+        self.serializer_ms = 0.0
+        self.fingerprints = Counter()
+        self.samples = {}
+        self._serializer_depth = 0
+
+    def __call__(self, execute, sql, params, many, context):
+        """connection.execute_wrapper hook."""
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.db_ms += (time.perf_counter() - start) * 1000
+            self.queries += 1
+            key = fingerprint(sql)
+            self.fingerprints[key] += 1
+            self.samples.setdefault(key, sql[:SQL_PREVIEW])
+
+    def duplicates(self):
+        return [
+            {"count": count, "sql": self.samples[key]}
+            for key, count in self.fingerprints.most_common()
+            if count >= DUPLICATE_THRESHOLD
+        ]
+
+    def finish(self, method, route, view, status):
+        return {
+            "method": method,
+            "route": route,
+            "view": view,
+            "status": status,
+            "queries": self.queries,
+            "duplicate_queries": sum(
+                count - 1 for count in self.fingerprints.values() if count > 1
+            ),
+            "duplicates": self.duplicates(),
+            "db_ms": round(self.db_ms, 2),
+            "serializer_ms": round(self.serializer_ms, 2),
+            "total_ms": round((time.perf_counter() - self.started) * 1000, 2),
+        }
+
+
+_current = ContextVar("api_request_metrics", default=None)
+
+
+def start_request_metrics():
+    metrics = RequestMetrics()
+    return metrics, _current.set(metrics)
+
+
+def end_request_metrics(token):
+    _current.reset(token)
+
+
+# --- SERIALIZER TIMING ---
+_serializer_timer_installed = False
+
+
+def install_serializer_timer():
+    """
+    Times `serializer.data` for instrumented requests.
+
+    Every serializer's .data goes through BaseSerializer.data, so wrapping it
+    once covers all of them. Only the outermost call is timed: a nested
+    `SomeSerializer(obj).data` inside a method field is already counted.
+    """
+    global _serializer_timer_installed
+    if _serializer_timer_installed:
+        return
+    original = BaseSerializer.data.fget
+
+    def timed_data(serializer):
+        metrics = _current.get()
+        if metrics is None or metrics._serializer_depth:
+            return original(serializer)
+        metrics._serializer_depth += 1
+        start = time.perf_counter()
+        try:
+            return original(serializer)
+        finally:
+            metrics._serializer_depth -= 1
+            metrics.serializer_ms += (time.perf_counter() - start) * 1000
+
+    BaseSerializer.data = property(timed_data)
+    _serializer_timer_installed = True
+
+
+# --- ROLLING AGGREGATE ---
+def _percentile(values, fraction):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+class EndpointStats:
+    """Recent requests per (method, route), shared by the threads of this process."""
+
+    def __init__(self, window=WINDOW):
+        self.window = window
+        self._lock = threading.Lock()
+        self._reset()
+
+    def _reset(self):
+        self._samples = defaultdict(lambda: deque(maxlen=self.window))
+        self._totals = Counter()
+        self._slow = Counter()
+        self._duplicates = {}
+
+    def record(self, sample, slow=False):
+        key = (sample["method"], sample["route"])
+        with self._lock:
+            self._samples[key].append(
+                (
+                    sample["total_ms"],
+                    sample["db_ms"],
+                    sample["serializer_ms"],
+                    sample["queries"],
+                    sample["duplicate_queries"],
+                )
+            )
+            self._totals[key] += 1
+            if slow:
+                self._slow[key] += 1
+            if sample["duplicates"]:
+                self._duplicates[key] = sample["duplicates"][:5]
+
+    def clear(self):
+        with self._lock:
+            self._reset()
+
+    def snapshot(self):
+        """Per-endpoint summary of the window, slowest p95 first."""
+        with self._lock:
+            items = [
+                (key, list(samples), self._totals[key], self._slow[key], self._duplicates.get(key))
+                for key, samples in self._samples.items()
+            ]
+
+        rows = []
+        for (method, route), samples, total, slow, duplicates in items:
+            total_ms, db_ms, serializer_ms, queries, duplicate_queries = zip(*samples)
+            rows.append(
+                {
+                    "method": method,
+                    "route": route,
+                    "requests": total,
+                    "slow_requests": slow,
+                    "window": len(samples),
+                    "total_ms": {
+                        "p50": _percentile(total_ms, 0.5),
+                        "p95": _percentile(total_ms, 0.95),
+                        "max": max(total_ms),
+                    },
+                    "db_ms_avg": round(sum(db_ms) / len(samples), 2),
+                    "serializer_ms_avg": round(sum(serializer_ms) / len(samples), 2),
+                    "queries": {
+                        "avg": round(sum(queries) / len(samples), 1),
+                        "max": max(queries),
+                    },
+                    "duplicate_queries_max": max(duplicate_queries),
+                    "last_duplicates": duplicates or [],
+                }
+            )
+        rows.sort(key=lambda row: row["total_ms"]["p95"], reverse=True)
+        return rows
+
+
+endpoint_stats = EndpointStats()
@@ -0,0 +1,190 @@
+from collections import defaultdict
+from datetime import date
+
+from django.db import transaction
+
+from api.models import (
+    EntityPerformanceSummary,
+    Skater,
+    SinglesEntity,
+    SoloDanceEntity,
+    Team,
+    SynchroTeam,
+)
+from .content_types import get_content_type
+from .stats import (
+    ResultColumns,
+    compute_stats,
+    load_owner_columns,
+    load_owner_volume,
+    season_bounds,
+)
+
+SUMMARY_MODELS = (Skater, Team, SynchroTeam)
+
+
+def summary_payload(summary):
+    """The stats endpoint response for a summary row."""
+    return {
+        "overall": summary.overall,
+        "segments": summary.segments,
+        "volume": summary.volume,
+        "season_name": summary.season_name,
+        "history": summary.history,
+    }
+
+
+def _apply_results(summary, frame, today):
+    stats = compute_stats(frame, today=today)
+    summary.overall = stats["overall"]
+    summary.segments = stats["segments"]
+    summary.history = stats["history"]
+    summary.season_start = season_bounds(today)[0]
+    summary.last_competition_id = frame.competition_ids[-1] if len(frame) else None
+
+
+def _apply_volume(summary, volume, season_names):
+    summary.volume = volume.get(summary.object_id, 0)
+    summary.season_name = season_names.get(summary.object_id, "Current")
+
+
+def build_performance_summaries(model, ids, today=None):
+    """Computes (and saves) summaries for the given ids from scratch."""
+    today = today or date.today()
+    ids = list(ids)
+    ct = get_content_type(model)
+    existing = {
+        s.object_id: s
+        for s in EntityPerformanceSummary.objects.filter(content_type=ct, object_id__in=ids)
+    }
+    columns = load_owner_columns(model, ids)
+    volume, season_names = load_owner_volume(model, ids)
+
+    summaries = {}
+    for pk in ids:
+        summary = existing.get(pk) or EntityPerformanceSummary(content_type=ct, object_id=pk)
+        _apply_results(summary, columns.get(pk) or ResultColumns(), today)
+        _apply_volume(summary, volume, season_names)
+        summaries[pk] = summary
+
+    # Two first reads can race to create the same row; either result is current
+    EntityPerformanceSummary.objects.bulk_create(
+        [s for s in summaries.values() if s.pk is None], ignore_conflicts=True
+    )
+    EntityPerformanceSummary.objects.bulk_update(
+        [s for pk, s in summaries.items() if pk in existing],
+        [
+            "overall",
+            "segments",
+            "history",
+            "volume",
+            "season_name",
+            "season_start",
+            "last_competition",
+        ],
+    )
+    return summaries
+
+
+def get_performance_summaries(model, ids, today=None):
+    """
+    {id: EntityPerformanceSummary} for Skaters, Teams or SynchroTeams.
+
+    A single read when every row exists and was computed this season; missing
+    or stale rows are rebuilt on the way.
+    """
+    today = today or date.today()
+    ids = list(ids)
+    season_start = season_bounds(today)[0]
+    summaries = {
+        s.object_id: s
+        for s in EntityPerformanceSummary.objects.filter(
+            content_type=get_content_type(model), object_id__in=ids
+        )
+    }
+    stale = [pk for pk in ids if pk not in summaries or summaries[pk].season_start != season_start]
+    if stale:
+        summaries.update(build_performance_summaries(model, stale, today=today))
+    return summaries
+
+
+# --- INCREMENTAL UPDATES ---
+def summary_owners(refs):
+    """
+    {model: {ids}} of the summaries affected by the given planning entities.
+    `refs` is an iterable of (model class, pk) pairs.
+
+    Singles / Solo Dance results count towards their skater, Team results
+    towards the team and both partners.
+    """
+    owners = defaultdict(set)
+    lookups = defaultdict(set)
+    for model, pk in refs:
+        if model is None or pk is None:
+            continue
+        if model in SUMMARY_MODELS:
+            owners[model].add(pk)
+        if model in (SinglesEntity, SoloDanceEntity, Team):
+            lookups[model].add(pk)
+
+    for model, ids in lookups.items():
+        fields = ("partner_a_id", "partner_b_id") if model is Team else ("skater_id",)
+        for row in model.objects.filter(id__in=ids).values_list(*fields):
+            owners[Skater].update(skater_id for skater_id in row if skater_id)
+    return owners
+
+
+def _existing_summaries(model, ids):
+    return EntityPerformanceSummary.objects.filter(
+        content_type=get_content_type(model), object_id__in=ids
+    )
+
+
+def refresh_results(refs, today=None):
+    """
+    Recomputes PB/SB, history and last competition for summaries affected by a
+    result change, once the transaction commits. Summaries that have not been
+    built yet are left alone; they are computed on first read.
+    """
+    owners = summary_owners(refs)
+
+    def refresh():
+        for model, ids in owners.items():
+            summaries = list(_existing_summaries(model, ids))
+            if not summaries:
+                continue
+            columns = load_owner_columns(model, [s.object_id for s in summaries])
+            for summary in summaries:
+                _apply_results(
+                    summary,
+                    columns.get(summary.object_id) or ResultColumns(),
+                    today or date.today(),
+                )
+            EntityPerformanceSummary.objects.bulk_update(
+                summaries, ["overall", "segments", "history", "season_start", "last_competition"]
+            )
+
+    if owners:
+        transaction.on_commit(refresh)
+
+
+def refresh_volume(refs):
+    """Recounts session volume (and season name) for the affected summaries on commit."""
+    owners = summary_owners(refs)
+
+    def refresh():
+        for model, ids in owners.items():
+            summaries = list(_existing_summaries(model, ids))
+            if not summaries:
+                continue
+            volume, season_names = load_owner_volume(model, [s.object_id for s in summaries])
+            for summary in summaries:
+                _apply_volume(summary, volume, season_names)
+            EntityPerformanceSummary.objects.bulk_update(summaries, ["volume", "season_name"])
+
+    if owners:
+        transaction.on_commit(refresh)
+
+
+def delete_performance_summary(model, pk):
+    _existing_summaries(model, [pk]).delete()
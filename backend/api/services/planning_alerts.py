@@ -0,0 +1,149 @@
+from collections import defaultdict
+from datetime import date, timedelta
+
+from django.db.models import Exists, OuterRef, Q
+
+from api.models import AthleteSeason, YearlyPlan, WeeklyPlan, Team, SynchroTeam
+from .content_types import get_content_type
+from .access import get_access_role
+
+
+def _alert(name, entity_id, issue, is_shared, link):
+    return {
+        "skater": name,
+        "id": entity_id,
+        "issue": issue,
+        "is_shared": is_shared,
+        "link": link,
+    }
+
+
+def collect_planning_alerts(user, skaters, teams, synchro_teams, today=None):
+    """
+    Builds the "No Plan" / "Unplanned Week" alerts for every entity a coach works with.
+
+    Runs a fixed number of queries regardless of roster size:
+    1. All active seasons of the given skaters, teams and synchro teams, annotated
+       with an Exists() subquery telling whether a YearlyPlan covers them
+    2. One WeeklyPlan fetch for the current week_start across those seasons
+
+    Rules (unchanged from the dashboard):
+    - A season without a YearlyPlan raises "No Plan" ("No Team Plan" for teams)
+    - A planned season whose current week has no theme raises "Unplanned Week"
+    - Skater seasons whose date range excludes today are skipped
+    """
+    today = today or date.today()
+    start_of_week = today - timedelta(days=today.weekday())
+
+    skaters = list(skaters)
+    teams = list(teams)
+    synchro_teams = list(synchro_teams)
+
+    ct_team = get_content_type(Team)
+    ct_synchro = get_content_type(SynchroTeam)
+
+    season_query = Q()
+    if skaters:
+        season_query |= Q(skater__in=[s.id for s in skaters])
+    if teams:
+        season_query |= Q(content_type=ct_team, object_id__in=[t.id for t in teams])
+    if synchro_teams:
+        season_query |= Q(content_type=ct_synchro, object_id__in=[t.id for t in synchro_teams])
+    if not season_query:
+        return []
+
+    # --- 1. Seasons + "has a plan" flag in one query ---
+    has_plan = Exists(
+        YearlyPlan.athlete_seasons.through.objects.filter(athleteseason_id=OuterRef("pk"))
+    )
+    seasons = list(
+        AthleteSeason.objects.filter(season_query, is_active=True)
+        .annotate(has_plan=has_plan)
+        .order_by("id")
+    )
+
+    skater_seasons = defaultdict(list)
+    entity_seasons = defaultdict(list)
+    for season in seasons:
+        if season.skater_id:
+            skater_seasons[season.skater_id].append(season)
+        if season.content_type_id:
+            entity_seasons[(season.content_type_id, season.object_id)].append(season)
+
+    # --- 2. Current week themes in one query ---
+    planned_ids = [s.id for s in seasons if s.has_plan]
+    week_themes = {}
+    if planned_ids:
+        week_themes = dict(
+            WeeklyPlan.objects.filter(
+                athlete_season_id__in=planned_ids, week_start=start_of_week
+            ).values_list("athlete_season_id", "theme")
+        )
+
+    def is_unplanned(season):
+        return not week_themes.get(season.id)
+
+    alerts = []
+
+    # A. Skaters
+    for skater in skaters:
+        is_shared = get_access_role(user, skater) == "COLLABORATOR"
+        for season in skater_seasons.get(skater.id, []):
+            if not season.has_plan:
+                alerts.append(
+                    _alert(
+                        skater.full_name,
+                        skater.id,
+                        f"No Plan for {season.season}",
+                        is_shared,
+                        f"#/skater/{skater.id}?tab=yearly",
+                    )
+                )
+                continue
+            if (
+                season.start_date
+                and season.end_date
+                and not (season.start_date <= today <= season.end_date)
+            ):
+                continue
+            if is_unplanned(season):
+                alerts.append(
+                    _alert(
+                        skater.full_name,
+                        skater.id,
+                        "Unplanned Week",
+                        is_shared,
+                        f"#/skater/{skater.id}?tab=weekly",
+                    )
+                )
+
+    # B. Teams / C. Synchro
+    for ct, prefix, team_list in (
+        (ct_team, "team", teams),
+        (ct_synchro, "synchro", synchro_teams),
+    ):
+        for team in team_list:
+            is_shared = get_access_role(user, team) == "COLLABORATOR"
+            for season in entity_seasons.get((ct.id, team.id), []):
+                if not season.has_plan:
+                    alerts.append(
+                        _alert(
+                            team.team_name,
+                            team.id,
+                            "No Team Plan",
+                            is_shared,
+                            f"#/{prefix}/{team.id}?tab=yearly",
+                        )
+                    )
+                elif is_unplanned(season):
+                    alerts.append(
+                        _alert(
+                            team.team_name,
+                            team.id,
+                            "Unplanned Week",
+                            is_shared,
+                            f"#/{prefix}/{team.id}?tab=weekly",
+                        )
+                    )
+
+    return alerts
@@ -0,0 +1,46 @@
+from django.db.models import Prefetch
+
+from api.models import (
+    Skater,
+    SinglesEntity,
+    SoloDanceEntity,
+    Team,
+    SynchroTeam,
+)
+
+
+def prefetch_roster(queryset):
+    """
+    Loads everything RosterSkaterSerializer touches for a page of skaters:
+    federations, singles / solo dance entities, teams on either side (with
+    both partners) and synchro teams (with their rosters). The query count is
+    fixed however many skaters are on the page.
+    """
+    partners = Team.objects.select_related(
+        "federation", "partner_a__federation", "partner_b__federation"
+    )
+    synchro = SynchroTeam.objects.select_related("federation").prefetch_related(
+        Prefetch("roster", queryset=Skater.objects.select_related("federation"))
+    )
+    return queryset.select_related("federation").prefetch_related(
+        Prefetch("singles_entities", queryset=SinglesEntity.objects.select_related("federation")),
+        Prefetch(
+            "solodance_entities", queryset=SoloDanceEntity.objects.select_related("federation")
+        ),
+        Prefetch("teams_as_partner_a", queryset=partners),
+        Prefetch("teams_as_partner_b", queryset=partners),
+        Prefetch("synchro_teams", queryset=synchro),
+    )
+
+
+def roster_teams(skaters):
+    """Every Team and SynchroTeam reachable from the (prefetched) skaters."""
+    teams = {}
+    for skater in skaters:
+        for team in (
+            list(skater.teams_as_partner_a.all())
+            + list(skater.teams_as_partner_b.all())
+            + list(skater.synchro_teams.all())
+        ):
+            teams[(type(team), team.pk)] = team
+    return list(teams.values())
@@ -0,0 +1,32 @@
+from api.models import ElementAttemptFact, SessionLog, Skater
+from .dashboard_cache import invalidate_dashboard
+from .element_consistency import invalidate_consistency_weeks
+from .element_facts import build_element_facts
+from .performance import refresh_volume
+from .training_load import refresh_daily_loads
+
+
+def bulk_create_session_logs(logs, skater_ids, entity_refs=()):
+    """
+    Inserts `logs` with bulk_create and does what api.signals does for each
+    saved log, once for the whole batch: element facts, daily training load,
+    the dashboards' activity section and session volume.
+    `skater_ids` maps athlete_season_id -> skater_id (None for team seasons);
+    `entity_refs` are the (model, pk) planning entities the logs belong to.
+    Call inside the transaction that should own the rows.
+    """
+    logs = SessionLog.objects.bulk_create(logs)
+
+    facts = ElementAttemptFact.objects.bulk_create(build_element_facts(logs, skater_ids))
+    invalidate_consistency_weeks((fact.skater_id, fact.session_date) for fact in facts)
+    refresh_daily_loads({(log.athlete_season_id, log.session_date) for log in logs})
+
+    refs = list(entity_refs)
+    refs += [
+        (Skater, skater_ids[season_id])
+        for season_id in {log.athlete_season_id for log in logs}
+        if skater_ids.get(season_id)
+    ]
+    invalidate_dashboard(refs, ["activity"])
+    refresh_volume(refs)
+    return logs
@@ -0,0 +1,73 @@
+from django.db.models import Q
+
+from api.models import PlanningEntityAccess
+from .content_types import get_content_type
+
+COLLABORATOR_ROLES = ("COLLABORATOR", "MANAGER", "COACH")
+OBSERVER_ROLES = ("VIEWER", "OBSERVER")
+GUARDIAN_ROLES = ("GUARDIAN",)
+
+
+class StaffDirectory:
+    """
+    PlanningEntityAccess rows (with their users) grouped by entity.
+
+    Entities are loaded in bulk with load(); anything asked for that was not
+    loaded yet is fetched on the spot. Either way each entity is queried at
+    most once, and collaborators, observers and guardians are all answered
+    from the same rows.
+    """
+
+    def __init__(self):
+        self.rows = {}
+
+    def _key(self, entity):
+        return (get_content_type(entity).id, entity.pk)
+
+    def load(self, entities):
+        """Fetches the rows for every entity not loaded yet, in one query."""
+        missing = {}
+        for entity in entities:
+            key = self._key(entity)
+            if key not in self.rows:
+                missing.setdefault(key[0], set()).add(key[1])
+        if not missing:
+            return
+
+        query = Q()
+        for ct_id, ids in missing.items():
+            query |= Q(content_type_id=ct_id, object_id__in=ids)
+            for object_id in ids:
+                self.rows[(ct_id, object_id)] = []
+        for record in (
+            PlanningEntityAccess.objects.filter(query).select_related("user").order_by("id")
+        ):
+            self.rows[(record.content_type_id, record.object_id)].append(record)
+
+    def records(self, entity, roles):
+        self.load([entity])
+        return [r for r in self.rows[self._key(entity)] if r.access_level in roles]
+
+    def collaborators(self, entity):
+        return self.records(entity, COLLABORATOR_ROLES)
+
+    def observers(self, entity):
+        return self.records(entity, OBSERVER_ROLES)
+
+    def guardians(self, entity):
+        return self.records(entity, GUARDIAN_ROLES)
+
+
+def get_staff_directory(request):
+    """
+    Returns the StaffDirectory for this request, creating it on first use, so
+    every serializer rendering the response shares one set of lookups.
+    Without a request a fresh (unshared) directory is returned.
+    """
+    if request is None:
+        return StaffDirectory()
+    directory = getattr(request, "_staff_directory", None)
+    if directory is None:
+        directory = StaffDirectory()
+        request._staff_directory = directory
+    return directory
@@ -0,0 +1,272 @@
+from collections import defaultdict
+from datetime import date
+
+from django.db.models import Count, Q
+
+from api.models import (
+    CompetitionResult,
+    SessionLog,
+    AthleteSeason,
+    Skater,
+    SinglesEntity,
+    SoloDanceEntity,
+    Team,
+)
+from .content_types import get_content_type
+
+RESULT_COLUMNS = (
+    "content_type_id",
+    "object_id",
+    "competition_id",
+    "competition__title",
+    "competition__start_date",
+    "total_score",
+    "planned_base_value",
+    "segment_scores",
+)
+
+
+def season_bounds(today):
+    """July 1st -> June 30th season containing `today`."""
+    start_year = today.year if today.month >= 7 else today.year - 1
+    return date(start_year, 7, 1), date(start_year + 1, 6, 30)
+
+
+def _to_float(value):
+    return float(value or 0)
+
+
+def _segments(raw):
+    if not raw or not isinstance(raw, list):
+        return []
+    return [
+        (
+            seg.get("name", "Unknown"),
+            _to_float(seg.get("score")),
+            _to_float(seg.get("tes")),
+            _to_float(seg.get("pcs")),
+        )
+        for seg in raw
+    ]
+
+
+class ResultColumns:
+    """
+    Completed results as parallel columns (one entry per result, in date order).
+
+    Scores are converted to float once when the columns are built; segments are
+    flattened into their own columns, pointing back at the result they belong to.
+    """
+
+    def __init__(self):
+        self.competition_ids = []
+        self.dates = []
+        self.names = []
+        self.totals = []
+        self.tes = []
+        self.planned_bv = []
+        self.seg_row = []
+        self.seg_name = []
+        self.seg_score = []
+        self.seg_tes = []
+        self.seg_pcs = []
+
+    def __len__(self):
+        return len(self.dates)
+
+    def append(
+        self, competition_id, title, start_date, total_score, planned_base_value, segment_scores
+    ):
+        row = len(self.dates)
+        segments = _segments(segment_scores)
+        self.competition_ids.append(competition_id)
+        self.dates.append(start_date)
+        self.names.append(title)
+        self.totals.append(_to_float(total_score))
+        self.planned_bv.append(_to_float(planned_base_value))
+        self.tes.append(sum(seg[2] for seg in segments))
+        for name, score, tes, pcs in segments:
+            self.seg_row.append(row)
+            self.seg_name.append(name)
+            self.seg_score.append(score)
+            self.seg_tes.append(tes)
+            self.seg_pcs.append(pcs)
+
+
+def completed_results(query=None):
+    """Completed results matching `query`, as value tuples in competition order."""
+    results = CompetitionResult.objects.filter(status=CompetitionResult.Status.COMPLETED)
+    if query is not None:
+        results = results.filter(query)
+    return results.order_by("competition__start_date", "id").values_list(*RESULT_COLUMNS)
+
+
+def load_result_columns(query=None, owners=None):
+    """
+    {key: ResultColumns} built from a single query.
+
+    By default each result is keyed by its (content_type_id, object_id). Pass
+    `owners` ({(content_type_id, object_id): [key, ...]}) to collect results
+    under other keys instead, e.g. every skater on a team.
+    """
+    columns = defaultdict(ResultColumns)
+    for ct_id, object_id, *values in completed_results(query):
+        ref = (ct_id, object_id)
+        for key in owners.get(ref, ()) if owners is not None else (ref,):
+            columns[key].append(*values)
+    return columns
+
+
+def entity_query(refs):
+    """Q matching the given (model or content type id, object id) pairs."""
+    ids_by_ct = defaultdict(set)
+    for model, pk in refs:
+        if pk is None:
+            continue
+        ct_id = model if isinstance(model, int) else get_content_type(model).id
+        ids_by_ct[ct_id].add(pk)
+    query = Q(pk__in=[])
+    for ct_id, ids in ids_by_ct.items():
+        query |= Q(content_type_id=ct_id, object_id__in=ids)
+    return query
+
+
+def _empty_stat():
+    return {"score": 0.0, "comp": "N/A", "date": None}
+
+
+def _best(scores, rows, in_season, frame):
+    """
+    PB / SB for one score column. Ties keep the earliest result, and scores of
+    zero never count, matching the original running-max comparison.
+    """
+    pb = sb = None
+    pb_score = sb_score = 0.0
+    for i, score in enumerate(scores):
+        row = rows[i] if rows is not None else i
+        if score > pb_score:
+            pb, pb_score = row, score
+        if score > sb_score and in_season[row]:
+            sb, sb_score = row, score
+
+    def stat(row, score):
+        if row is None:
+            return _empty_stat()
+        return {"score": score, "comp": frame.names[row], "date": frame.dates[row]}
+
+    return {"pb": stat(pb, pb_score), "sb": stat(sb, sb_score)}
+
+
+def compute_stats(frame, today=None):
+    """
+    PB / SB overall and per segment plus the score history for one entity.
+
+    Returns {"overall", "segments", "history"} with the same shape the stats
+    endpoints have always returned.
+    """
+    season_start, season_end = season_bounds(today or date.today())
+    in_season = [season_start <= d <= season_end for d in frame.dates]
+
+    history = [
+        {
+            "date": frame.dates[i],
+            "name": frame.names[i],
+            "total_score": frame.totals[i],
+            "tes": frame.tes[i],
+            "planned_bv": frame.planned_bv[i],
+            "pcs_approx": frame.totals[i] - frame.tes[i],
+        }
+        for i in range(len(frame))
+    ]
+
+    # Split the segment columns by name, keeping first-seen order
+    by_name = {}
+    for i, name in enumerate(frame.seg_name):
+        by_name.setdefault(name, []).append(i)
+
+    segments = {}
+    for name, idx in by_name.items():
+        rows = [frame.seg_row[i] for i in idx]
+        segments[name] = {
+            "total": _best([frame.seg_score[i] for i in idx], rows, in_season, frame),
+            "tes": _best([frame.seg_tes[i] for i in idx], rows, in_season, frame),
+            "pcs": _best([frame.seg_pcs[i] for i in idx], rows, in_season, frame),
+        }
+
+    return {
+        "overall": _best(frame.totals, None, in_season, frame),
+        "segments": segments,
+        "history": history,
+    }
+
+
+def skater_entity_owners(skater_ids):
+    """{(content_type_id, object_id): [skater_id, ...]} for every entity the skaters compete as."""
+    owners = defaultdict(list)
+    for model, skater_field in (
+        (SinglesEntity, "skater_id"),
+        (SoloDanceEntity, "skater_id"),
+        (Team, "partner_a_id"),
+        (Team, "partner_b_id"),
+    ):
+        ct_id = get_content_type(model).id
+        for entity_id, skater_id in model.objects.filter(
+            **{f"{skater_field}__in": skater_ids}
+        ).values_list("id", skater_field):
+            owners[(ct_id, entity_id)].append(skater_id)
+    return owners
+
+
+def load_owner_columns(model, ids):
+    """
+    {id: ResultColumns} for Skaters, Teams or SynchroTeams, from one result query.
+
+    A skater's columns cover every entity they compete as (singles, solo dance
+    and either side of a team).
+    """
+    ids = list(ids)
+    if model is Skater:
+        owners = skater_entity_owners(ids)
+        if not owners:
+            return {}
+        return load_result_columns(entity_query(owners), owners=owners)
+    ct_id = get_content_type(model).id
+    owners = {(ct_id, pk): [pk] for pk in ids}
+    return load_result_columns(Q(content_type_id=ct_id, object_id__in=ids), owners=owners)
+
+
+def load_owner_volume(model, ids):
+    """
+    ({id: session count}, {id: season name}) for Skaters, Teams or SynchroTeams.
+
+    Skaters count sessions in their active seasons and are named after the
+    latest active season; teams count every session logged in their seasons.
+    """
+    ids = list(ids)
+    if model is Skater:
+        volume = (
+            SessionLog.objects.filter(
+                athlete_season__skater_id__in=ids, athlete_season__is_active=True
+            )
+            .values_list("athlete_season__skater_id")
+            .annotate(total=Count("id"))
+            .values_list("athlete_season__skater_id", "total")
+        )
+        season_names = (
+            AthleteSeason.objects.filter(skater_id__in=ids, is_active=True)
+            .order_by("id")
+            .values_list("skater_id", "season")
+        )
+        return dict(volume), dict(season_names)
+    # By season, not by the log's own entity: athlete logs from a team practice
+    # point at the team too, but belong to the skaters' seasons
+    ct = get_content_type(model)
+    volume = (
+        SessionLog.objects.filter(
+            athlete_season__content_type=ct, athlete_season__object_id__in=ids
+        )
+        .values_list("athlete_season__object_id")
+        .annotate(total=Count("id"))
+        .values_list("athlete_season__object_id", "total")
+    )
+    return dict(volume), {}
@@ -0,0 +1,235 @@
+import math
+from collections import defaultdict
+from datetime import timedelta
+
+from django.db.models import Q
+
+from api.models import AthleteSeason, DailyTrainingLoad, PlannedSession, SessionLog
+
+# SessionLog has no duration: a log takes the planned_duration of the matching
+# PlannedSession (same season, day and type, else any session planned that day)
+# and falls back to this
+DEFAULT_SESSION_MINUTES = 60
+# session_rating is 1-5; session-RPE uses the 0-10 scale
+RPE_PER_RATING = 2
+
+ACUTE_DAYS = 7
+CHRONIC_DAYS = 28
+# ACWR bands (Gabbett): below is underload, above is overload
+ACWR_LOW = 0.8
+ACWR_HIGH = 1.5
+MAX_LOAD_DAYS = 182
+# Per-day series returned for each skater of a roster (the latest day has all metrics)
+CURVE_KEYS = ("load", "acwr")
+
+DAY_NAMES = [day for day, _ in PlannedSession.DayOfWeek.choices]
+
+
+def _monday(day):
+    return day - timedelta(days=day.weekday())
+
+
+def planned_day(week_start, day_of_week):
+    """The date a PlannedSession falls on, from its week's start and its day."""
+    return week_start + timedelta(days=DAY_NAMES.index(day_of_week))
+
+
+def _planned_minutes(season_days):
+    """{(season_id, date): [(session_type, minutes)]} for the planned sessions of those days."""
+    if not season_days:
+        return {}
+    queryset = PlannedSession.objects.filter(
+        weekly_plan__athlete_season_id__in={season_id for season_id, _ in season_days},
+        weekly_plan__week_start__in={_monday(day) for _, day in season_days},
+    )
+    planned = defaultdict(list)
+    for season_id, week, day_name, session_type, minutes in (
+        queryset.exclude(status=PlannedSession.Status.CANCELLED)
+        .order_by("weekly_plan__week_start", "planned_time", "id")
+        .values_list(
+            "weekly_plan__athlete_season_id",
+            "weekly_plan__week_start",
+            "day_of_week",
+            "session_type",
+            "planned_duration",
+        )
+    ):
+        day = planned_day(week, day_name)
+        if (season_id, day) in season_days:
+            planned[(season_id, day)].append((session_type, minutes))
+    return planned
+
+
+def _session_minutes(session_type, planned):
+    """Pops the planned session a log stands for off `planned`; returns its minutes."""
+    for i, (planned_type, minutes) in enumerate(planned):
+        if planned_type == session_type:
+            planned.pop(i)
+            return minutes or DEFAULT_SESSION_MINUTES
+    if planned:
+        return planned.pop(0)[1] or DEFAULT_SESSION_MINUTES
+    return DEFAULT_SESSION_MINUTES
+
+
+def compute_daily_loads(logs):
+    """
+    {(skater_id, date): (sessions, minutes, load)} for log rows given as
+    (skater_id, athlete_season_id, session_date, session_type, session_rating).
+    """
+    logs = sorted(logs, key=lambda row: (row[1], row[2]))
+    planned = _planned_minutes({(season_id, day) for _, season_id, day, _, _ in logs})
+
+    days = {}
+    for skater_id, season_id, day, session_type, rating in logs:
+        minutes = _session_minutes(session_type, planned.get((season_id, day), []))
+        rpe = max(0, min(10, (rating or 0) * RPE_PER_RATING))
+        sessions, total_minutes, load = days.get((skater_id, day), (0, 0, 0))
+        days[(skater_id, day)] = (sessions + 1, total_minutes + minutes, load + minutes * rpe)
+    return days
+
+
+def _log_rows(query):
+    return (
+        SessionLog.objects.filter(query, athlete_season__skater__isnull=False)
+        .order_by()
+        .values_list(
+            "athlete_season__skater_id",
+            "athlete_season_id",
+            "session_date",
+            "session_type",
+            "session_rating",
+        )
+    )
+
+
+def refresh_daily_loads(season_days):
+    """
+    Recomputes the DailyTrainingLoad rows touched by logs on (athlete_season_id,
+    date) pairs: each affected skater-day is rebuilt from all of that skater's
+    logs on that day. Team seasons (no skater) are ignored.
+    """
+    season_ids = {season_id for season_id, _ in season_days}
+    skater_of = dict(
+        AthleteSeason.objects.filter(id__in=season_ids, skater__isnull=False).values_list(
+            "id", "skater_id"
+        )
+    )
+    skater_days = {
+        (skater_of[season_id], day) for season_id, day in season_days if season_id in skater_of
+    }
+    if not skater_days:
+        return
+
+    rows = _log_rows(
+        Q(
+            athlete_season__skater_id__in={skater_id for skater_id, _ in skater_days},
+            session_date__in={day for _, day in skater_days},
+        )
+    )
+    days = compute_daily_loads(row for row in rows if (row[0], row[2]) in skater_days)
+
+    # Days left without logs lose their row; the rest are upserted in one
+    # statement, so concurrent refreshes of a day cannot trip unique_daily_load
+    emptied = Q()
+    for skater_id, day in skater_days - days.keys():
+        emptied |= Q(skater_id=skater_id, date=day)
+    if emptied:
+        DailyTrainingLoad.objects.filter(emptied).delete()
+    DailyTrainingLoad.objects.bulk_create(
+        [
+            DailyTrainingLoad(
+                skater_id=skater_id, date=day, sessions=sessions, minutes=minutes, load=load
+            )
+            for (skater_id, day), (sessions, minutes, load) in days.items()
+        ],
+        update_conflicts=True,
+        unique_fields=["skater", "date"],
+        update_fields=["sessions", "minutes", "load"],
+    )
+
+
+def rebuild_daily_loads(skater_ids, batch_size=2000):
+    """Replaces every DailyTrainingLoad row of these skaters. Returns rows written."""
+    skater_ids = list(skater_ids)
+    DailyTrainingLoad.objects.filter(skater_id__in=skater_ids).delete()
+    days = compute_daily_loads(_log_rows(Q(athlete_season__skater_id__in=skater_ids)))
+    rows = [
+        DailyTrainingLoad(skater_id=skater_id, date=day, sessions=s, minutes=m, load=load)
+        for (skater_id, day), (s, m, load) in days.items()
+    ]
+    DailyTrainingLoad.objects.bulk_create(rows, batch_size=batch_size)
+    return len(rows)
+
+
+# --- METRICS ---
+def _round(value, digits=2):
+    return None if value is None else round(value, digits)
+
+
+def load_curve(daily, start, end):
+    """
+    Day-by-day metrics from {date: load} (which must reach CHRONIC_DAYS - 1
+    days before `start`):
+    - acute: load of the last ACUTE_DAYS days
+    - chronic: average ACUTE_DAYS-day load over the last CHRONIC_DAYS days
+    - acwr: acute / chronic
+    - monotony: mean / standard deviation of the daily loads in the acute week
+    - strain: acute x monotony
+    """
+    first = start - timedelta(days=CHRONIC_DAYS - 1)
+    loads = [daily.get(first + timedelta(days=i), 0) for i in range((end - first).days + 1)]
+    curve = []
+    for i in range(CHRONIC_DAYS - 1, len(loads)):
+        week = loads[i - ACUTE_DAYS + 1 : i + 1]
+        acute = sum(week)
+        chronic = sum(loads[i - CHRONIC_DAYS + 1 : i + 1]) * ACUTE_DAYS / CHRONIC_DAYS
+        mean = acute / ACUTE_DAYS
+        sd = math.sqrt(sum((load - mean) ** 2 for load in week) / ACUTE_DAYS)
+        monotony = mean / sd if sd else None
+        curve.append(
+            {
+                "date": first + timedelta(days=i),
+                "load": loads[i],
+                "acute": acute,
+                "chronic": _round(chronic, 1),
+                "acwr": _round(acute / chronic) if chronic else None,
+                "monotony": _round(monotony),
+                "strain": _round(acute * monotony, 0) if monotony is not None else None,
+            }
+        )
+    return curve
+
+
+def load_flag(acwr):
+    if acwr is None:
+        return None
+    if acwr > ACWR_HIGH:
+        return "overload"
+    if acwr < ACWR_LOW:
+        return "underload"
+    return "ok"
+
+
+def get_roster_load(skater_ids, start, end):
+    """
+    {skater_id: {"latest": metrics on `end` with a flag, "curve": {"load": [...],
+    "acwr": [...]}}} for every skater, from one query over DailyTrainingLoad.
+    The curve lists one value per day from `start` to `end`.
+    """
+    daily = defaultdict(dict)
+    for skater_id, day, load in DailyTrainingLoad.objects.filter(
+        skater_id__in=skater_ids,
+        date__range=(start - timedelta(days=CHRONIC_DAYS - 1), end),
+    ).values_list("skater_id", "date", "load"):
+        daily[skater_id][day] = load
+
+    roster = {}
+    for skater_id in skater_ids:
+        curve = load_curve(daily.get(skater_id, {}), start, end)
+        latest = dict(curve[-1])
+        latest["flag"] = load_flag(latest["acwr"])
+        roster[skater_id] = {
+            "latest": latest,
+            "curve": {key: [day[key] for day in curve] for key in CURVE_KEYS},
+        }
+    return roster
@@ -0,0 +1,34 @@
+from datetime import timedelta
+
+from api.models import WeeklyPlan
+
+MAX_RANGE_WEEKS = 26
+
+
+def week_starts(start, weeks):
+    """Consecutive week_start dates beginning at `start`."""
+    return [start + timedelta(weeks=i) for i in range(weeks)]
+
+
+def get_week_plans(seasons, starts):
+    """
+    Returns {(season_id, week_start): WeeklyPlan} for every season x week.
+
+    Existing plans come from a single query; missing weeks are filled with
+    unsaved placeholders (id None) so reads never write. A row is only created
+    when the week is first edited.
+    """
+    season_ids = [season.id for season in seasons]
+    plans = {
+        (plan.athlete_season_id, plan.week_start): plan
+        for plan in WeeklyPlan.objects.filter(
+            athlete_season_id__in=season_ids, week_start__in=starts
+        )
+    }
+    for season in seasons:
+        for start in starts:
+            if (season.id, start) not in plans:
+                plans[(season.id, start)] = WeeklyPlan(
+                    athlete_season=season, week_start=start, theme=""
+                )
+    return plans
@@ -0,0 +1,399 @@
+from datetime import timedelta
+
+from django.db.models.signals import post_save, post_delete, pre_save, pre_delete, m2m_changed
+from django.dispatch import receiver
+
+from api.models import (
+    InjuryLog,
+    Goal,
+    SessionLog,
+    ElementAttemptFact,
+    WeeklyPlan,
+    PlannedSession,
+    SkaterTest,
+    Competition,
+    CompetitionResult,
+    AthleteSeason,
+    YearlyPlan,
+    PlanningEntityAccess,
+    Skater,
+    SinglesEntity,
+    SoloDanceEntity,
+    Team,
+    SynchroTeam,
+)
+from api.services.dashboard_cache import (
+    DASHBOARD_SECTIONS,
+    invalidate_dashboard,
+    invalidate_dashboard_users,
+)
+from api.services.content_types import get_model_for_content_type
+from api.services.element_consistency import invalidate_consistency_weeks
+from api.services.element_facts import sync_element_facts
+from api.services.training_load import planned_day, refresh_daily_loads
+from api.services.performance import (
+    refresh_results,
+    refresh_volume,
+    delete_performance_summary,
+)
+
+
+# --- HELPERS ---
+def _generic_ref(content_type_id, object_id):
+    if not content_type_id:
+        return (None, None)
+    return (get_model_for_content_type(content_type_id), object_id)
+
+
+def _season_refs(season_ids):
+    refs = []
+    for skater_id, ct_id, object_id in AthleteSeason.objects.filter(id__in=season_ids).values_list(
+        "skater_id", "content_type_id", "object_id"
+    ):
+        refs.append((Skater, skater_id))
+        refs.append(_generic_ref(ct_id, object_id))
+    return refs
+
+
+def _ignore(kwargs):
+    # Fixture loading saves raw rows; there is nothing cached for them yet
+    return kwargs.get("raw", False)
+
+
+# Removals are handled before the rows go, while the links still resolve
+M2M_ACTIONS = ("post_add", "pre_remove", "pre_clear")
+
+
+# --- DASHBOARD SECTIONS ---
+@receiver([post_save, post_delete], sender=InjuryLog)
+def injury_changed(sender, instance, **kwargs):
+    if not _ignore(kwargs):
+        invalidate_dashboard([(Skater, instance.skater_id)], ["injuries"])
+
+
+@receiver([post_save, post_delete], sender=Goal)
+def goal_changed(sender, instance, **kwargs):
+    if not _ignore(kwargs):
+        refs = [
+            (Skater, instance.assignee_skater_id),
+            _generic_ref(instance.content_type_id, instance.object_id),
+        ]
+        invalidate_dashboard(refs, ["goals"])
+
+
+@receiver([post_save, post_delete], sender=SessionLog)
+def session_log_changed(sender, instance, **kwargs):
+    if not _ignore(kwargs):
+        refs = _season_refs([instance.athlete_season_id])
+        refs.append(_generic_ref(instance.content_type_id, instance.object_id))
+        invalidate_dashboard(refs, ["activity"])
+
+
+@receiver([post_save, post_delete], sender=WeeklyPlan)
+def weekly_plan_changed(sender, instance, **kwargs):
+    if not _ignore(kwargs):
+        invalidate_dashboard(_season_refs([instance.athlete_season_id]), ["planning"])
+
+
+@receiver([post_save, post_delete], sender=AthleteSeason)
+def athlete_season_changed(sender, instance, **kwargs):
+    if not _ignore(kwargs):
+        refs = [
+            (Skater, instance.skater_id),
+            _generic_ref(instance.content_type_id, instance.object_id),
+        ]
+        invalidate_dashboard(refs, ["planning", "activity"])
+
+
+@receiver([post_save, post_delete], sender=YearlyPlan)
+def yearly_plan_changed(sender, instance, **kwargs):
+    if not _ignore(kwargs):
+        invalidate_dashboard(
+            [_generic_ref(instance.content_type_id, instance.object_id)], ["planning"]
+        )
+
+
+@receiver(m2m_changed, sender=YearlyPlan.athlete_seasons.through)
+def yearly_plan_seasons_changed(sender, instance, action, pk_set, **kwargs):
+    if action not in M2M_ACTIONS:
+        return
+    if isinstance(instance, YearlyPlan):
+        refs = [_generic_ref(instance.content_type_id, instance.object_id)]
+        if pk_set:
+            refs += _season_refs(pk_set)
+    else:
+        refs = _season_refs([instance.pk])
+    invalidate_dashboard(refs, ["planning"])
+
+
+@receiver([post_save, post_delete], sender=SkaterTest)
+def skater_test_changed(sender, instance, **kwargs):
+    if not _ignore(kwargs):
+        invalidate_dashboard([(Skater, instance.skater_id)], ["agenda"])
+
+
+@receiver([post_save, post_delete], sender=CompetitionResult)
+def competition_result_changed(sender, instance, **kwargs):
+    if not _ignore(kwargs):
+        invalidate_dashboard(
+            [_generic_ref(instance.content_type_id, instance.object_id)], ["agenda"]
+        )
+
+
+@receiver(post_save, sender=Competition)
+def competition_changed(sender, instance, created, **kwargs):
+    # A new competition has no results yet, so it is on nobody's agenda
+    if created or _ignore(kwargs):
+        return
+    refs = [
+        _generic_ref(ct_id, object_id)
+        for ct_id, object_id in instance.results.values_list("content_type_id", "object_id")
+    ]
+    invalidate_dashboard(refs, ["agenda"])
+
+
+# --- ACCESS & ROSTER CHANGES (every section) ---
+@receiver([post_save, post_delete], sender=PlanningEntityAccess)
+def access_changed(sender, instance, **kwargs):
+    if not _ignore(kwargs):
+        invalidate_dashboard_users([instance.user_id], DASHBOARD_SECTIONS)
+
+
+@receiver([post_save, pre_delete], sender=Skater)
+@receiver([post_save, pre_delete], sender=SinglesEntity)
+@receiver([post_save, pre_delete], sender=SoloDanceEntity)
+@receiver([post_save, pre_delete], sender=Team)
+@receiver([post_save, pre_delete], sender=SynchroTeam)
+def planning_entity_changed(sender, instance, **kwargs):
+    if _ignore(kwargs):
+        return
+    refs = [(sender, instance.pk)]
+    if sender is Team:
+        refs += [(Skater, instance.partner_a_id), (Skater, instance.partner_b_id)]
+    invalidate_dashboard(refs, DASHBOARD_SECTIONS)
+
+
+@receiver(m2m_changed, sender=SynchroTeam.roster.through)
+def synchro_roster_changed(sender, instance, action, pk_set, **kwargs):
+    if action not in M2M_ACTIONS:
+        return
+    if isinstance(instance, SynchroTeam):
+        refs = [(SynchroTeam, instance.pk)] + [(Skater, pk) for pk in pk_set or ()]
+    else:
+        refs = [(Skater, instance.pk)] + [(SynchroTeam, pk) for pk in pk_set or ()]
+    invalidate_dashboard(refs, DASHBOARD_SECTIONS)
+
+
+# --- PERFORMANCE SUMMARIES ---
+@receiver([post_save, post_delete], sender=CompetitionResult)
+def result_summary_changed(sender, instance, **kwargs):
+    if not _ignore(kwargs):
+        refresh_results([_generic_ref(instance.content_type_id, instance.object_id)])
+
+
+@receiver(post_save, sender=Competition)
+def competition_summary_changed(sender, instance, created, **kwargs):
+    # Title / date changes show up in every entered entity's history
+    if created or _ignore(kwargs):
+        return
+    refresh_results(
+        [
+            _generic_ref(ct_id, object_id)
+            for ct_id, object_id in instance.results.values_list("content_type_id", "object_id")
+        ]
+    )
+
+
+@receiver([post_save, post_delete], sender=SessionLog)
+def session_log_summary_changed(sender, instance, **kwargs):
+    if not _ignore(kwargs):
+        refs = _season_refs([instance.athlete_season_id])
+        refs.append(_generic_ref(instance.content_type_id, instance.object_id))
+        refresh_volume(refs)
+
+
+@receiver([post_save, post_delete], sender=AthleteSeason)
+def athlete_season_summary_changed(sender, instance, **kwargs):
+    # Activating / archiving a season changes the skater's volume and season name
+    if not _ignore(kwargs):
+        refresh_volume([(Skater, instance.skater_id)])
+
+
+@receiver(pre_save, sender=Team)
+def team_partners_changing(sender, instance, **kwargs):
+    # Remember the partners, in case the save drops one (and the team's results)
+    instance._previous_partners = ()
+    if instance.pk and not instance._state.adding and not _ignore(kwargs):
+        instance._previous_partners = (
+            Team.objects.filter(pk=instance.pk)
+            .values_list("partner_a_id", "partner_b_id")
+            .first()
+            or ()
+        )
+
+
+@receiver(post_save, sender=Team)
+def team_summary_changed(sender, instance, created, **kwargs):
+    if not created and not _ignore(kwargs):
+        previous = getattr(instance, "_previous_partners", ())
+        refresh_results([(Team, instance.pk)] + [(Skater, pk) for pk in previous])
+
+
+@receiver(post_delete, sender=Skater)
+@receiver(post_delete, sender=Team)
+@receiver(post_delete, sender=SynchroTeam)
+def planning_entity_summary_deleted(sender, instance, **kwargs):
+    delete_performance_summary(sender, instance.pk)
+
+
+# --- ELEMENT ATTEMPT FACTS ---
+# Fields of a SessionLog that its ElementAttemptFact rows are built from
+ELEMENT_FACT_FIELDS = {
+    "element_attempts",
+    "program_runs",
+    "session_date",
+    "athlete_season",
+    "athlete_season_id",
+    "content_type",
+    "content_type_id",
+    "object_id",
+}
+
+
+@receiver(post_save, sender=SessionLog)
+def session_log_facts_changed(sender, instance, created, update_fields=None, **kwargs):
+    # Deletes cascade; a save that leaves the source fields alone changes nothing.
+    # Fixtures are loaded raw: backfill_element_facts rebuilds the facts afterwards
+    if _ignore(kwargs):
+        return
+    if update_fields is not None and not ELEMENT_FACT_FIELDS & set(update_fields):
+        return
+    if created and not (instance.element_attempts or instance.program_runs):
+        return
+    sync_element_facts([instance])
+
+
+@receiver(pre_delete, sender=SessionLog)
+def session_log_facts_deleted(sender, instance, **kwargs):
+    # The facts go with the log; their cached weeks have to go too
+    if _ignore(kwargs) or not (instance.element_attempts or instance.program_runs):
+        return
+    invalidate_consistency_weeks(
+        ElementAttemptFact.objects.filter(session_log_id=instance.pk)
+        .values_list("skater_id", "session_date")
+        .distinct()
+    )
+
+
+# --- TRAINING LOAD ---
+# Fields of a SessionLog that its day's DailyTrainingLoad is computed from
+TRAINING_LOAD_FIELDS = {
+    "session_date",
+    "athlete_season",
+    "athlete_season_id",
+    "session_type",
+    "session_rating",
+}
+
+
+def _load_unchanged(update_fields):
+    return update_fields is not None and not TRAINING_LOAD_FIELDS & set(update_fields)
+
+
+@receiver(pre_save, sender=SessionLog)
+def session_log_load_moving(sender, instance, update_fields=None, **kwargs):
+    # Remember the day the log counted towards, in case the save moves it
+    instance._load_day = None
+    if _ignore(kwargs) or _load_unchanged(update_fields):
+        return
+    if instance.pk and not instance._state.adding:
+        instance._load_day = (
+            SessionLog.objects.filter(pk=instance.pk)
+            .values_list("athlete_season_id", "session_date")
+            .first()
+        )
+
+
+@receiver([post_save, post_delete], sender=SessionLog)
+def session_log_load_changed(sender, instance, update_fields=None, **kwargs):
+    # Fixtures are loaded raw: rebuild_training_load rebuilds the rows afterwards
+    if _ignore(kwargs) or _load_unchanged(update_fields):
+        return
+    days = {(instance.athlete_season_id, instance.session_date)}
+    previous = getattr(instance, "_load_day", None)
+    if previous:
+        days.add(previous)
+    refresh_daily_loads(days)
+
+
+# Logs take their minutes from the sessions planned on their day, so planning
+# changes reach the DailyTrainingLoad of that day too
+PLANNED_LOAD_FIELDS = {
+    "weekly_plan",
+    "weekly_plan_id",
+    "day_of_week",
+    "planned_time",
+    "planned_duration",
+    "session_type",
+    "status",
+}
+
+
+def _planned_unchanged(update_fields):
+    return update_fields is not None and not PLANNED_LOAD_FIELDS & set(update_fields)
+
+
+@receiver(pre_save, sender=PlannedSession)
+def planned_session_load_moving(sender, instance, update_fields=None, **kwargs):
+    # Remember the day the session was planned on, in case the save moves it
+    instance._load_day = None
+    if _ignore(kwargs) or _planned_unchanged(update_fields):
+        return
+    if instance.pk and not instance._state.adding:
+        previous = (
+            PlannedSession.objects.filter(pk=instance.pk)
+            .values_list("weekly_plan__athlete_season_id", "weekly_plan__week_start", "day_of_week")
+            .first()
+        )
+        if previous:
+            season_id, week_start, day_of_week = previous
+            instance._load_day = (season_id, planned_day(week_start, day_of_week))
+
+
+@receiver([post_save, post_delete], sender=PlannedSession)
+def planned_session_load_changed(sender, instance, update_fields=None, **kwargs):
+    if _ignore(kwargs) or _planned_unchanged(update_fields):
+        return
+    plan = instance.weekly_plan
+    days = {(plan.athlete_season_id, planned_day(plan.week_start, instance.day_of_week))}
+    previous = getattr(instance, "_load_day", None)
+    if previous:
+        days.add(previous)
+    refresh_daily_loads(days)
+
+
+@receiver(pre_save, sender=WeeklyPlan)
+def weekly_plan_load_moving(sender, instance, **kwargs):
+    instance._load_week = None
+    if instance.pk and not instance._state.adding and not _ignore(kwargs):
+        instance._load_week = (
+            WeeklyPlan.objects.filter(pk=instance.pk)
+            .values_list("athlete_season_id", "week_start")
+            .first()
+        )
+
+
+@receiver(post_save, sender=WeeklyPlan)
+def weekly_plan_load_changed(sender, instance, created, **kwargs):
+    # Moving a plan to another week or season moves its sessions with it
+    previous = getattr(instance, "_load_week", None)
+    current = (instance.athlete_season_id, instance.week_start)
+    if created or _ignore(kwargs) or previous is None or previous == current:
+        return
+    refresh_daily_loads(
+        {
+            (season_id, week_start + timedelta(days=offset))
+            for season_id, week_start in (previous, current)
+            for offset in range(7)
+        }
+    )
@@ -0,0 +1,124 @@
+import logging
+
+from celery import shared_task
+from django.conf import settings
+from django.core.mail import EmailMultiAlternatives, get_connection
+from django.utils import timezone
+
+from api.models import Invitation, Skater
+from api.services import prefetch_planning_entities
+
+logger = logging.getLogger(__name__)
+
+# Invitations rendered and sent per task
+INVITE_EMAIL_BATCH_SIZE = 25
+# Retries of a batch's failed messages, backing off 30s, 60s, 120s...
+INVITE_EMAIL_MAX_RETRIES = 5
+INVITE_EMAIL_RETRY_DELAY = 30
+
+
+def queue_invitation_emails(invitation_ids):
+    """Splits invitations into batches and hands each to the worker."""
+    invitation_ids = [str(pk) for pk in invitation_ids]
+    for start in range(0, len(invitation_ids), INVITE_EMAIL_BATCH_SIZE):
+        batch = invitation_ids[start : start + INVITE_EMAIL_BATCH_SIZE]
+        try:
+            send_invitation_emails.delay(batch)
+        except Exception:
+            # Broker down: the rows stay QUEUED and the sender can see it
+            logger.exception("Could not queue invitation emails %s", batch)
+
+
+def build_invitation_message(invite):
+    target = invite.target_entity
+    base_url = settings.FRONTEND_URL.rstrip("/")
+    accept_link = f"{base_url}/#/accept-invite/{invite.token}"
+
+    display_role = invite.role.replace("_", " ").title()
+    if invite.role == "ATHLETE" and not isinstance(target, Skater):
+        display_role = "Team Member"
+
+    html_message = f"""
+    <div style="font-family: sans-serif; max-width: 600px; margin: 0 auto; padding: 20px; border: 1px solid #eee; border-radius: 8px;">
+        <h2 style="color: #2563eb;">Welcome to SkatePlan!</h2>
+        <p>Hello,</p>
+        <p>Your coach <strong>{invite.sender.full_name}</strong> has invited you to join their roster on SkatePlan.</p>
+        <p><strong>Role:</strong> {display_role}</p>
+        <p><strong>Team/Athlete:</strong> {str(target)}</p>
+        <br>
+        <a href="{accept_link}" style="background-color: #2563eb; color: white; padding: 12px 24px; text-decoration: none; border-radius: 4px; font-weight: bold; display: inline-block;">Accept Invitation</a>
+        <br><br>
+        <p style="font-size: 12px; color: #666;">Or copy this link: <br> <a href="{accept_link}">{accept_link}</a></p>
+    </div>
+    """
+
+    message = EmailMultiAlternatives(
+        subject=f"Invitation to join {str(target)}",
+        body=f"Accept at: {accept_link}",
+        from_email=settings.DEFAULT_FROM_EMAIL,
+        to=[invite.email],
+    )
+    message.attach_alternative(html_message, "text/html")
+    return message
+
+
+@shared_task(bind=True, max_retries=INVITE_EMAIL_MAX_RETRIES)
+def send_invitation_emails(self, invitation_ids):
+    """
+    Sends the emails for a batch of invitations over one backend connection.
+
+    Each invitation's email_status/email_attempts is updated as it goes.
+    Messages that fail are retried with exponential backoff; once retries
+    run out they are marked FAILED with the last error.
+    """
+    invites = prefetch_planning_entities(
+        Invitation.objects.filter(
+            pk__in=invitation_ids, email_status=Invitation.EmailStatus.QUEUED
+        ).select_related("sender"),
+        field="target_entity",
+    )
+    if not invites:
+        return {"sent": 0, "failed": 0}
+
+    failed = []
+    connection = get_connection()
+    try:
+        connection.open()
+    except Exception as exc:
+        # No connection: every message in the batch failed this attempt
+        logger.warning("Could not open the email connection: %s", exc)
+        for invite in invites:
+            invite.email_attempts += 1
+            invite.email_error = str(exc)[:255]
+        failed = list(invites)
+    else:
+        try:
+            for invite in invites:
+                invite.email_attempts += 1
+                try:
+                    connection.send_messages([build_invitation_message(invite)])
+                except Exception as exc:
+                    logger.warning("Invitation email to %s failed: %s", invite.email, exc)
+                    invite.email_error = str(exc)[:255]
+                    failed.append(invite)
+                else:
+                    invite.email_status = Invitation.EmailStatus.SENT
+                    invite.email_error = ""
+                    invite.email_sent_at = timezone.now()
+        finally:
+            connection.close()
+
+    out_of_retries = self.request.retries >= self.max_retries
+    if failed and out_of_retries:
+        for invite in failed:
+            invite.email_status = Invitation.EmailStatus.FAILED
+    Invitation.objects.bulk_update(
+        invites, ["email_status", "email_attempts", "email_error", "email_sent_at"]
+    )
+
+    if failed and not out_of_retries:
+        raise self.retry(
+            args=[[str(invite.pk) for invite in failed]],
+            countdown=INVITE_EMAIL_RETRY_DELAY * 2**self.request.retries,
+        )
+    return {"sent": len(invites) - len(failed), "failed": len(failed)}
@@ -15,3 +15,15 @@ def user_factory(db):
         password = kwargs.pop("password", "password123")
         return User.objects.create_user(email=email, password=password, **kwargs)
     return create_user
+
+@pytest.fixture(autouse=True)
+def locmem_cache(settings):
+    # Tests run without Redis; keep the dashboard cache in process
+    settings.CACHES = {
+        "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}
+    }
+    from django.core.cache import cache
+
+    cache.clear()
+    yield cache
+    cache.clear()
@@ -0,0 +1,116 @@
+import pytest
+from datetime import date
+from api.models import (
+    Skater,
+    SinglesEntity,
+    Team,
+    SynchroTeam,
+    PlanningEntityAccess,
+)
+from api.services import get_access_role, get_access_index
+
+
+def make_skater(name):
+    return Skater.objects.create(full_name=name, date_of_birth=date(2010, 1, 1))
+
+
+@pytest.mark.django_db
+def test_access_index_resolves_direct_and_inherited_roles(user_factory):
+    """Direct, Team-inherited and Synchro-inherited roles resolve from one index."""
+    coach = user_factory(email="coach@example.com", full_name="Coach", role="COACH")
+    direct = make_skater("Direct Skater")
+    partner_a = make_skater("Partner A")
+    partner_b = make_skater("Partner B")
+    synchro_member = make_skater("Synchro Member")
+    stranger = make_skater("Stranger")
+
+    singles = SinglesEntity.objects.create(skater=direct)
+    team = Team.objects.create(
+        team_name="A/B", discipline="PAIRS", partner_a=partner_a, partner_b=partner_b
+    )
+    synchro = SynchroTeam.objects.create(team_name="Nexxice", level="Senior")
+    synchro.roster.add(synchro_member)
+
+    PlanningEntityAccess.objects.create(user=coach, access_level="COACH", planning_entity=direct)
+    PlanningEntityAccess.objects.create(user=coach, access_level="COACH", planning_entity=singles)
+    PlanningEntityAccess.objects.create(
+        user=coach, access_level="COLLABORATOR", planning_entity=team
+    )
+    PlanningEntityAccess.objects.create(user=coach, access_level="VIEWER", planning_entity=synchro)
+
+    assert get_access_role(coach, direct) == "COACH"
+    assert get_access_role(coach, singles) == "COACH"
+    assert get_access_role(coach, team) == "COLLABORATOR"
+    assert get_access_role(coach, partner_a) == "COLLABORATOR"
+    assert get_access_role(coach, partner_b) == "COLLABORATOR"
+    assert get_access_role(coach, synchro_member) == "VIEWER"
+    assert get_access_role(coach, stranger) is None
+
+    # Inherited roles are not direct grants
+    index = get_access_index(coach)
+    assert index.direct_role_for(partner_a) is None
+    assert index.direct_role_for(team) == "COLLABORATOR"
+
+
+@pytest.mark.django_db
+def test_access_index_identity_and_query_count(user_factory, django_assert_num_queries):
+    """A linked skater is "SKATER"; repeated lookups reuse the memoized index."""
+    athlete = user_factory(email="athlete@example.com", full_name="Athlete")
+    skaters = [make_skater(f"Skater {i}") for i in range(10)]
+    own = skaters[0]
+    own.user_account = athlete
+    own.save()
+
+    get_access_role(athlete, own)
+    with django_assert_num_queries(0):
+        assert get_access_role(athlete, own) == "SKATER"
+        for skater in skaters[1:]:
+            assert get_access_role(athlete, skater) is None
+
+
+@pytest.mark.django_db
+def test_accessible_skaters_is_a_single_query(user_factory, django_assert_num_queries):
+    """Skaters reachable through every entity type come back in one ordered query."""
+    coach = user_factory(email="club@example.com", full_name="Club Coach", role="COACH")
+    observed = make_skater("Observed Only")
+    PlanningEntityAccess.objects.create(
+        user=coach, access_level="OBSERVER", planning_entity=observed
+    )
+
+    expected = []
+    for i in range(5):
+        skater = make_skater(f"Singles {i}")
+        entity = SinglesEntity.objects.create(skater=skater)
+        PlanningEntityAccess.objects.create(
+            user=coach, access_level="COACH", planning_entity=entity
+        )
+        expected.append(skater)
+
+    partner_a, partner_b = make_skater("Pair A"), make_skater("Pair B")
+    team = Team.objects.create(
+        team_name="Pair", discipline="PAIRS", partner_a=partner_a, partner_b=partner_b
+    )
+    PlanningEntityAccess.objects.create(user=coach, access_level="COACH", planning_entity=team)
+    expected += [partner_a, partner_b]
+
+    synchro = SynchroTeam.objects.create(team_name="Team Unique", level="Junior")
+    members = [make_skater(f"Member {i}") for i in range(8)]
+    synchro.roster.add(*members)
+    PlanningEntityAccess.objects.create(user=coach, access_level="COACH", planning_entity=synchro)
+    expected += members
+
+    archived = expected[0]
+    archived.is_active = False
+    archived.save()
+
+    from api.services import get_accessible_skaters
+
+    # Warm the ContentType cache, as any earlier request would have
+    list(get_accessible_skaters(coach))
+    with django_assert_num_queries(1):
+        skaters = list(get_accessible_skaters(coach, filter_mode="OPERATIONAL"))
+
+    active = sorted((s for s in expected if s.is_active), key=lambda s: s.full_name)
+    assert [s.id for s in skaters] == [s.id for s in active] + [archived.id]
+    assert observed in get_accessible_skaters(coach, filter_mode="ALL")
+    assert observed not in skaters
@@ -0,0 +1,79 @@
+import pytest
+from datetime import date, timedelta
+from api.models import (
+    Skater,
+    SinglesEntity,
+    Team,
+    SynchroTeam,
+    Competition,
+    CompetitionResult,
+    SkaterTest,
+    PlanningEntityAccess,
+)
+from api.services import build_agenda, get_accessible_skaters, get_access_index
+
+TODAY = date(2025, 1, 15)
+
+
+def make_competition(title, days_ahead):
+    start = TODAY + timedelta(days=days_ahead)
+    return Competition.objects.create(
+        title=title, city="Ottawa", province_state="ON", start_date=start, end_date=start
+    )
+
+
+@pytest.mark.django_db
+def test_agenda_resolves_attendees_in_fixed_queries(user_factory, django_assert_num_queries):
+    coach = user_factory(email="coach@example.com", full_name="Coach", role="COACH")
+    sectionals = make_competition("Sectionals", 5)
+    far_away = make_competition("Nationals", 30)
+    make_competition("Empty Invitational", 3)
+
+    # A big field where only some entries belong to the coach
+    entries = []
+    for i in range(20):
+        skater = Skater.objects.create(full_name=f"Skater {i:02}", date_of_birth=date(2010, 1, 1))
+        entity = SinglesEntity.objects.create(skater=skater)
+        CompetitionResult.objects.create(
+            competition=sectionals, planning_entity=entity, level="Junior"
+        )
+        entries.append((skater, entity))
+    for skater, entity in entries[:3]:
+        PlanningEntityAccess.objects.create(
+            user=coach, access_level="COACH", planning_entity=entity
+        )
+    CompetitionResult.objects.create(
+        competition=far_away, planning_entity=entries[0][1], level="Junior"
+    )
+
+    team = Team.objects.create(
+        team_name="Pair", discipline="PAIRS", partner_a=entries[0][0], partner_b=entries[1][0]
+    )
+    PlanningEntityAccess.objects.create(user=coach, access_level="COACH", planning_entity=team)
+    CompetitionResult.objects.create(competition=sectionals, planning_entity=team, level="Junior")
+
+    synchro = SynchroTeam.objects.create(team_name="Nexxice", level="Senior")
+    PlanningEntityAccess.objects.create(user=coach, access_level="COACH", planning_entity=synchro)
+    provincials = make_competition("Provincials", 1)
+    CompetitionResult.objects.create(
+        competition=provincials, planning_entity=synchro, level="Senior"
+    )
+
+    SkaterTest.objects.create(skater=entries[2][0], test_name="Gold Skills", test_date=TODAY)
+
+    skaters = get_accessible_skaters(coach, filter_mode="OPERATIONAL")
+    teams = Team.objects.filter(id=team.id)
+    synchro_teams = SynchroTeam.objects.filter(id=synchro.id)
+    get_access_index(coach)
+
+    build_agenda(coach, skaters, teams, synchro_teams, today=TODAY)
+    with django_assert_num_queries(2):
+        agenda = build_agenda(coach, skaters, teams, synchro_teams, today=TODAY)
+
+    assert [(a["type"], a["title"], a["who"]) for a in agenda] == [
+        ("Test", "Gold Skills", "Skater 02"),
+        ("Competition", "Provincials", "Nexxice"),
+        ("Competition", "Sectionals", "Skater 00, Skater 01, Skater 02, Pair"),
+    ]
+    assert agenda[1]["link"] == f"#/synchro/{synchro.id}?tab=competitions"
+    assert agenda[2]["link"] == f"#/skater/{entries[0][0].id}?tab=competitions"
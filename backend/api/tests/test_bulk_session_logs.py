@@ -0,0 +1,153 @@
+import pytest
+from datetime import date
+from api.models import (
+    Skater,
+    SynchroTeam,
+    AthleteSeason,
+    SessionLog,
+    ElementAttemptFact,
+    DailyTrainingLoad,
+    PlanningEntityAccess,
+)
+
+PRACTICE = {
+    "session_date": "2025-10-07",
+    "session_type": "ON_ICE",
+    "location": "Rink A",
+    "session_rating": 3,
+    "coach_notes": "Wheel drills",
+    "element_attempts": [{"element_code": "Wh", "attempts": 4, "successful": 3}],
+}
+
+
+@pytest.fixture
+def synchro(user_factory):
+    coach = user_factory(email="coach@example.com", full_name="Coach", role="COACH")
+    team = SynchroTeam.objects.create(team_name="Northern Lights", level="Junior")
+    PlanningEntityAccess.objects.create(user=coach, access_level="COACH", planning_entity=team)
+    team_season = AthleteSeason.objects.create(planning_entity=team, season="2025-2026")
+    skaters = []
+    for i in range(16):
+        skater = Skater.objects.create(full_name=f"Skater {i:02}", date_of_birth=date(2008, 1, 1))
+        team.roster.add(skater)
+        skaters.append(skater)
+    # Half the roster already has an active season
+    seasons = {
+        skater.id: AthleteSeason.objects.create(skater=skater, season="2025-2026")
+        for skater in skaters[::2]
+    }
+    return coach, team, team_season, skaters, seasons
+
+
+def url(team):
+    return f"/api/synchro/{team.id}/logs/bulk/"
+
+
+@pytest.mark.django_db
+def test_bulk_log_writes_team_and_athlete_logs(
+    api_client, synchro, django_capture_on_commit_callbacks
+):
+    coach, team, team_season, skaters, seasons = synchro
+    first, second, absent = skaters[:3]
+    athletes = [{"skater_id": skater.id} for skater in skaters[3:]]
+    athletes += [
+        {
+            "skater_id": first.id,
+            "session_rating": 5,
+            "element_attempts": [{"element_code": "2A", "attempts": 6, "successful": 5}],
+        },
+        {"skater_id": second.id, "status": "LATE", "coach_notes": "Missed warm-up"},
+        {"skater_id": absent.id, "status": "ABSENT"},
+    ]
+
+    api_client.force_authenticate(coach)
+    with django_capture_on_commit_callbacks(execute=True):
+        response = api_client.post(url(team), {**PRACTICE, "athletes": athletes}, format="json")
+    assert response.status_code == 201, response.data
+    assert len(response.data["athlete_logs"]) == 15
+    assert response.data["created_seasons"] == 8
+
+    team_log = SessionLog.objects.get(athlete_season=team_season)
+    assert team_log.author == coach
+    assert team_log.element_attempts == PRACTICE["element_attempts"]
+    assert {row["id"]: row["status"] for row in team_log.attendance}[absent.id] == "ABSENT"
+    assert response.data["team_log"]["attendance"] == team_log.attendance
+
+    logs = {
+        log.athlete_season.skater_id: log
+        for log in SessionLog.objects.filter(athlete_season__skater__isnull=False).select_related(
+            "athlete_season"
+        )
+    }
+    assert absent.id not in logs
+    assert logs[first.id].athlete_season_id == seasons[first.id].id
+    assert (logs[first.id].session_rating, logs[second.id].session_rating) == (5, 3)
+    assert logs[second.id].coach_notes == "Missed warm-up"
+    assert logs[skaters[3].id].coach_notes == "Wheel drills"
+    assert logs[skaters[3].id].element_attempts == []
+    assert logs[second.id].planning_entity == team
+    assert AthleteSeason.objects.get(skater=second).is_active
+
+    # What the post_save signals would have done for each log
+    facts = ElementAttemptFact.objects.values_list("skater_id", "element_code", "attempts")
+    assert sorted(facts, key=str) == sorted([(None, "Wh", 4), (first.id, "2A", 6)], key=str)
+    loads = dict(DailyTrainingLoad.objects.values_list("skater_id", "load"))
+    assert len(loads) == 15 and loads[first.id] == 60 * 10
+
+
+@pytest.mark.django_db
+def test_bulk_log_counts_once_towards_team_volume(
+    api_client, synchro, django_capture_on_commit_callbacks
+):
+    coach, team, team_season, skaters, seasons = synchro
+    api_client.force_authenticate(coach)
+    stats = f"/api/synchro/{team.id}/stats/"
+    assert api_client.get(stats).data["volume"] == 0
+
+    with django_capture_on_commit_callbacks(execute=True):
+        api_client.post(
+            url(team),
+            {**PRACTICE, "athletes": [{"skater_id": skater.id} for skater in skaters]},
+            format="json",
+        )
+    assert api_client.get(stats).data["volume"] == 1
+    assert api_client.get(f"/api/skaters/{skaters[0].id}/stats/").data["volume"] == 1
+
+
+@pytest.mark.django_db
+def test_bulk_log_query_count_does_not_grow_with_roster(
+    api_client, synchro, django_assert_max_num_queries
+):
+    coach, team, team_season, skaters, seasons = synchro
+    api_client.force_authenticate(coach)
+
+    with django_assert_max_num_queries(25):
+        response = api_client.post(
+            url(team),
+            {**PRACTICE, "athletes": [{"skater_id": skater.id} for skater in skaters]},
+            format="json",
+        )
+    assert response.status_code == 201
+    assert SessionLog.objects.count() == 17
+
+
+@pytest.mark.django_db
+def test_bulk_log_is_all_or_nothing(api_client, synchro, user_factory):
+    coach, team, team_season, skaters, seasons = synchro
+    stranger = Skater.objects.create(full_name="Stranger", date_of_birth=date(2008, 1, 1))
+    api_client.force_authenticate(coach)
+
+    for athletes in (
+        [{"skater_id": skaters[0].id}, {"skater_id": stranger.id}],
+        [{"skater_id": skaters[0].id}, {"skater_id": skaters[0].id}],
+        [{"skater_id": skaters[0].id, "status": "SICK"}],
+    ):
+        response = api_client.post(url(team), {**PRACTICE, "athletes": athletes}, format="json")
+        assert response.status_code == 400
+    assert not SessionLog.objects.exists()
+
+    viewer = user_factory(email="viewer@example.com", full_name="Viewer", role="COACH")
+    PlanningEntityAccess.objects.create(user=viewer, access_level="VIEWER", planning_entity=team)
+    api_client.force_authenticate(viewer)
+    response = api_client.post(url(team), {**PRACTICE, "athletes": []}, format="json")
+    assert response.status_code == 403
@@ -0,0 +1,164 @@
+import pytest
+from datetime import date, timedelta
+from api.models import (
+    Skater,
+    SinglesEntity,
+    SynchroTeam,
+    AthleteSeason,
+    WeeklyPlan,
+    PlannedSession,
+    SessionLog,
+    PlanningEntityAccess,
+)
+from api.services import compliance_report
+
+MONDAY = date(2025, 10, 6)
+RANGE = {"start": "2025-10-01", "end": "2025-10-19"}
+
+
+def plan(season, week_start, *sessions):
+    week = WeeklyPlan.objects.create(athlete_season=season, week_start=week_start)
+    for day, session_type, minutes, *status in sessions:
+        PlannedSession.objects.create(
+            weekly_plan=week,
+            day_of_week=day,
+            session_type=session_type,
+            planned_duration=minutes,
+            status=status[0] if status else "PLANNED",
+        )
+
+
+def log(season, entity, day, session_type="ON_ICE"):
+    SessionLog.objects.create(
+        athlete_season=season, planning_entity=entity, session_date=day, session_type=session_type
+    )
+
+
+@pytest.fixture
+def coach(user_factory):
+    return user_factory(email="coach@example.com", full_name="Coach", role="COACH")
+
+
+@pytest.fixture
+def skater_season(coach):
+    skater = Skater.objects.create(full_name="Alex", date_of_birth=date(2010, 1, 1))
+    PlanningEntityAccess.objects.create(user=coach, access_level="COACH", planning_entity=skater)
+    singles = SinglesEntity.objects.create(skater=skater)
+    season = AthleteSeason.objects.create(skater=skater, season="2025-2026")
+
+    plan(
+        season,
+        MONDAY,
+        ("MONDAY", "ON_ICE", 60),
+        ("MONDAY", "ON_ICE", 60),  # Only one of the two was logged
+        ("WEDNESDAY", "CONDITIONING", 45),  # Logged as off-ice
+        ("THURSDAY", "REST", 0),
+        ("FRIDAY", "CLASS", 60, "CANCELLED"),
+        ("SATURDAY", "OFF_ICE", 30, "COMPLETED"),  # Marked done, never logged
+    )
+    plan(
+        season,
+        MONDAY + timedelta(days=7),
+        ("TUESDAY", "ON_ICE", 90),  # Logged as the wrong type
+        ("FRIDAY", "ON_ICE", 90),
+    )
+    log(season, singles, MONDAY)
+    log(season, singles, MONDAY + timedelta(days=2), "OFF_ICE")
+    log(season, singles, MONDAY + timedelta(days=8), "OFF_ICE")
+    # Unplanned: does not complete anything
+    log(season, singles, MONDAY + timedelta(days=3))
+    return skater, singles, season
+
+
+@pytest.mark.django_db
+def test_report_matches_logs_by_day_and_type(skater_season):
+    skater, singles, season = skater_season
+    today = MONDAY + timedelta(days=10)
+    report = compliance_report([season.id], date(2025, 10, 1), date(2025, 10, 19), today=today)
+
+    assert report["totals"] == {
+        "planned": 6,
+        "due": 5,  # Friday of the second week is still to come
+        "completed": 3,
+        "missed": 2,
+        "completion": 0.6,
+        "planned_minutes": 375,
+        "completed_minutes": 135,
+    }
+    empty, first, second = report["weeks"]
+    assert (empty["week_start"], empty["planned"], empty["completion"]) == (
+        date(2025, 9, 29),
+        0,
+        None,
+    )
+    assert (first["planned"], first["completed"], first["completion"]) == (4, 3, 0.75)
+    assert first["session_types"]["ON_ICE"]["completion"] == 0.5
+    assert (second["due"], second["completed"], second["completion"]) == (1, 0, 0.0)
+
+    by_type = {row["session_type"]: row for row in report["session_types"]}
+    assert set(by_type) == {"ON_ICE", "CONDITIONING", "OFF_ICE"}
+    assert (by_type["ON_ICE"]["planned"], by_type["ON_ICE"]["completed"]) == (4, 1)
+    assert report["seasons"][season.id]["completed"] == 3
+
+
+@pytest.mark.django_db
+def test_roster_compliance_endpoint(api_client, coach, skater_season, user_factory):
+    skater, singles, season = skater_season
+    api_client.force_authenticate(coach)
+
+    response = api_client.get("/api/dashboard/compliance/", RANGE)
+    assert response.status_code == 200
+    (athlete,) = response.data["athletes"]
+    assert (athlete["skater_id"], athlete["name"], athlete["completion"]) == (
+        skater.id,
+        "Alex",
+        0.5,
+    )
+    assert [week["planned"] for week in response.data["weeks"]] == [0, 4, 2]
+
+    assert (
+        api_client.get("/api/dashboard/compliance/", {**RANGE, "skaters": "0"}).data["athletes"]
+        == []
+    )
+    assert (
+        api_client.get("/api/dashboard/compliance/", {**RANGE, "skaters": "x"}).status_code == 400
+    )
+    too_long = {"start": "2025-01-01", "end": "2026-06-30"}
+    assert api_client.get("/api/dashboard/compliance/", too_long).status_code == 400
+
+    other = user_factory(email="other@example.com", full_name="Other", role="COACH")
+    api_client.force_authenticate(other)
+    assert api_client.get("/api/dashboard/compliance/", RANGE).data["athletes"] == []
+
+
+@pytest.mark.django_db
+def test_synchro_compliance_covers_team_and_roster(
+    api_client, coach, django_assert_max_num_queries
+):
+    team = SynchroTeam.objects.create(team_name="Northern Lights", level="Junior")
+    PlanningEntityAccess.objects.create(user=coach, access_level="COACH", planning_entity=team)
+    team_season = AthleteSeason.objects.create(planning_entity=team, season="2025-2026")
+    plan(team_season, MONDAY, ("MONDAY", "ON_ICE", 120), ("TUESDAY", "ON_ICE", 120))
+    log(team_season, team, MONDAY)
+
+    for i in range(16):
+        skater = Skater.objects.create(full_name=f"Skater {i:02}", date_of_birth=date(2008, 1, 1))
+        team.roster.add(skater)
+        singles = SinglesEntity.objects.create(skater=skater)
+        season = AthleteSeason.objects.create(skater=skater, season="2025-2026")
+        plan(season, MONDAY, ("WEDNESDAY", "OFF_ICE", 60))
+        if i % 2:
+            log(season, singles, MONDAY + timedelta(days=2), "OFF_ICE")
+
+    api_client.force_authenticate(coach)
+    with django_assert_max_num_queries(8):
+        response = api_client.get(f"/api/synchro/{team.id}/compliance/", RANGE)
+    assert response.status_code == 200
+    assert response.data["totals"]["planned"] == 18
+    assert response.data["totals"]["completed"] == 9
+    athletes = {row["name"]: row for row in response.data["athletes"]}
+    assert len(athletes) == 17
+    assert athletes["Northern Lights"]["skater_id"] is None
+    assert athletes["Northern Lights"]["completion"] == 0.5
+    # Least compliant first
+    assert response.data["athletes"][0]["completion"] == 0.0
@@ -0,0 +1,71 @@
+import pytest
+from datetime import date
+from django.contrib.contenttypes.models import ContentType
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from api.models import (
+    Skater,
+    SinglesEntity,
+    Team,
+    SynchroTeam,
+    Competition,
+    CompetitionResult,
+    PlanningEntityAccess,
+)
+from api.services import (
+    PLANNING_ENTITY_MODELS,
+    get_content_type,
+    get_model_for_content_type,
+    warm_content_types,
+)
+from api.services.content_types import content_types
+
+
+@pytest.mark.django_db
+def test_registry_resolves_both_ways_without_queries(django_assert_num_queries):
+    warm_content_types()
+    ct_team = ContentType.objects.get(app_label="api", model="team")
+    skater = Skater(full_name="Alex", date_of_birth=date(2010, 1, 1))
+
+    with django_assert_num_queries(0):
+        assert get_content_type(Team) == ct_team
+        assert get_content_type(skater).model == "skater"
+        assert get_model_for_content_type(ct_team.id) is Team
+        for model in PLANNING_ENTITY_MODELS:
+            assert get_model_for_content_type(get_content_type(model).id) is model
+
+
+@pytest.mark.django_db
+def test_registry_warms_on_first_lookup(django_assert_num_queries):
+    content_types.reset()
+    ContentType.objects.clear_cache()
+    with django_assert_num_queries(1):
+        assert get_content_type(Team).model == "team"
+    with django_assert_num_queries(0):
+        for model in PLANNING_ENTITY_MODELS:
+            assert get_model_for_content_type(get_content_type(model).id) is model
+
+
+@pytest.mark.django_db
+def test_result_list_has_no_per_row_content_type_lookup(api_client, user_factory):
+    coach = user_factory(email="coach@example.com", full_name="Coach", role="COACH")
+    skater = Skater.objects.create(full_name="Alex", date_of_birth=date(2010, 1, 1))
+    PlanningEntityAccess.objects.create(user=coach, access_level="COACH", planning_entity=skater)
+    singles = SinglesEntity.objects.create(skater=skater)
+    for i in range(5):
+        start = date(2024, 10, i + 1)
+        competition = Competition.objects.create(
+            title=f"Comp {i}", city="Ottawa", province_state="ON", start_date=start, end_date=start
+        )
+        CompetitionResult.objects.create(
+            competition=competition, planning_entity=singles, level="Junior"
+        )
+    synchro = SynchroTeam.objects.create(team_name="Nexxice", level="Senior")
+    assert get_model_for_content_type(get_content_type(synchro).id) is SynchroTeam
+
+    api_client.force_authenticate(coach)
+    with CaptureQueriesContext(connection) as ctx:
+        response = api_client.get(f"/api/skaters/{skater.id}/results/")
+    assert response.status_code == 200
+    assert {r["planning_entity_type"] for r in response.json()} == {"SinglesEntity"}
+    assert not any("django_content_type" in q["sql"] for q in ctx.captured_queries)
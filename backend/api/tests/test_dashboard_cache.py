@@ -0,0 +1,63 @@
+import pytest
+from datetime import date
+from api.models import Skater, InjuryLog, Goal, PlanningEntityAccess
+
+
+@pytest.fixture
+def coach_with_skater(user_factory):
+    coach = user_factory(email="coach@example.com", full_name="Coach", role="COACH")
+    skater = Skater.objects.create(full_name="Skater", date_of_birth=date(2010, 1, 1))
+    PlanningEntityAccess.objects.create(user=coach, access_level="COACH", planning_entity=skater)
+    return coach, skater
+
+
+@pytest.mark.django_db
+def test_dashboard_is_served_from_cache(api_client, coach_with_skater, django_assert_num_queries):
+    coach, skater = coach_with_skater
+    api_client.force_authenticate(coach)
+
+    first = api_client.get("/api/dashboard/stats/")
+    assert first.status_code == 200
+
+    with django_assert_num_queries(0):
+        second = api_client.get("/api/dashboard/stats/")
+    assert second.json() == first.json()
+
+
+@pytest.mark.django_db(transaction=True)
+def test_signals_invalidate_only_the_affected_section(
+    api_client, coach_with_skater, user_factory, django_assert_max_num_queries
+):
+    coach, skater = coach_with_skater
+    other = user_factory(email="other@example.com", full_name="Other", role="COACH")
+    api_client.force_authenticate(coach)
+    assert api_client.get("/api/dashboard/stats/").json()["red_flags"]["injuries"] == []
+
+    InjuryLog.objects.create(
+        skater=skater,
+        injury_type="Sprain",
+        date_of_onset=date.today(),
+        recovery_status="Active",
+    )
+
+    # Only the injuries section is rebuilt
+    with django_assert_max_num_queries(3):
+        data = api_client.get("/api/dashboard/stats/").json()
+    assert [i["injury"] for i in data["red_flags"]["injuries"]] == ["Sprain"]
+
+    Goal.objects.create(
+        title="Double Axel",
+        planning_entity=skater,
+        assignee_skater=skater,
+        target_date=date.today(),
+        current_status="IN_PROGRESS",
+    )
+    data = api_client.get("/api/dashboard/stats/").json()
+    assert [g["title"] for g in data["red_flags"]["due_soon_goals"]] == ["Double Axel"]
+
+    # Gaining access resets every section for the new user only
+    api_client.force_authenticate(other)
+    assert api_client.get("/api/dashboard/stats/").json()["red_flags"]["injuries"] == []
+    PlanningEntityAccess.objects.create(user=other, access_level="COACH", planning_entity=skater)
+    data = api_client.get("/api/dashboard/stats/").json()
+    assert [i["injury"] for i in data["red_flags"]["injuries"]] == ["Sprain"]
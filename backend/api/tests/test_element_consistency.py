@@ -0,0 +1,112 @@
+import pytest
+from datetime import date
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from api.models import (
+    Skater,
+    SinglesEntity,
+    AthleteSeason,
+    SessionLog,
+    PlanningEntityAccess,
+)
+
+URL_PARAMS = {"end": "2025-10-26", "weeks": 3}
+
+
+@pytest.fixture
+def skater_logs(user_factory):
+    coach = user_factory(email="coach@example.com", full_name="Coach", role="COACH")
+    skater = Skater.objects.create(full_name="Alex", date_of_birth=date(2010, 1, 1))
+    PlanningEntityAccess.objects.create(user=coach, access_level="COACH", planning_entity=skater)
+    singles = SinglesEntity.objects.create(skater=skater)
+    season = AthleteSeason.objects.create(skater=skater, season="2025-2026")
+
+    def log(day, attempts, successful, goes=()):
+        return SessionLog.objects.create(
+            athlete_season=season,
+            planning_entity=singles,
+            session_date=day,
+            element_attempts=[
+                {"element_code": "3Lz", "attempts": attempts, "successful": successful}
+            ],
+            program_runs=[{"elements": [{"name": "3Lz", "goe_grade": goe} for goe in goes]}],
+        )
+
+    logs = [
+        log(date(2025, 9, 22), 10, 2),  # Only inside the rolling window
+        log(date(2025, 10, 6), 8, 4, goes=["+1", "-2"]),
+        log(date(2025, 10, 21), 10, 9, goes=["0"]),
+    ]
+    return coach, skater, logs
+
+
+def fact_queries(ctx):
+    return [q["sql"] for q in ctx.captured_queries if "api_elementattemptfact" in q["sql"]]
+
+
+@pytest.mark.django_db
+def test_weekly_and_rolling_rates(api_client, skater_logs):
+    coach, skater, logs = skater_logs
+    api_client.force_authenticate(coach)
+
+    data = api_client.get(f"/api/skaters/{skater.id}/element-consistency/", URL_PARAMS).json()
+    assert data["rolling_weeks"] == 4
+    (lutz,) = data["elements"]
+    assert (lutz["attempts"], lutz["successful"]) == (21, 15)
+
+    first, empty, last = lutz["weeks"]
+    assert first["week_start"] == "2025-10-06"
+    assert first["practice"] == {"attempts": 8, "successful": 4}
+    assert first["program_runs"] == {"attempts": 2, "successful": 1}
+    assert first["success_rate"] == 0.5
+    # Rolling window reaches back to the week of 22 September
+    assert (first["rolling_attempts"], first["rolling_success_rate"]) == (20, 0.35)
+    assert (empty["attempts"], empty["success_rate"], empty["rolling_attempts"]) == (0, None, 20)
+    assert (last["rolling_attempts"], last["rolling_success_rate"]) == (21, 0.714)
+    assert lutz["trend"] == {"change": 0.364, "direction": "up"}
+
+
+@pytest.mark.django_db
+def test_weeks_are_cached_until_a_log_in_them_changes(
+    api_client, skater_logs, django_capture_on_commit_callbacks
+):
+    coach, skater, logs = skater_logs
+    api_client.force_authenticate(coach)
+    url = f"/api/skaters/{skater.id}/element-consistency/"
+    api_client.get(url, URL_PARAMS)
+
+    with CaptureQueriesContext(connection) as ctx:
+        cached = api_client.get(url, URL_PARAMS).json()
+    assert fact_queries(ctx) == []
+
+    # Editing one log only rebuilds its own week
+    with django_capture_on_commit_callbacks(execute=True):
+        logs[2].element_attempts = [{"element_code": "3Lz", "attempts": 10, "successful": 1}]
+        logs[2].save()
+    with CaptureQueriesContext(connection) as ctx:
+        updated = api_client.get(url, URL_PARAMS).json()
+    (sql,) = fact_queries(ctx)
+    assert "2025-10-20" in sql and "2025-10-06" not in sql
+
+    assert updated["elements"][0]["weeks"][:2] == cached["elements"][0]["weeks"][:2]
+    assert updated["elements"][0]["weeks"][2]["practice"] == {"attempts": 10, "successful": 1}
+    assert updated["elements"][0]["trend"] == {"change": -0.017, "direction": "flat"}
+
+
+@pytest.mark.django_db
+def test_deleting_a_log_retires_its_cached_weeks(
+    api_client, skater_logs, django_capture_on_commit_callbacks
+):
+    coach, skater, logs = skater_logs
+    api_client.force_authenticate(coach)
+    url = f"/api/skaters/{skater.id}/element-consistency/"
+    api_client.get(url, URL_PARAMS)
+
+    with django_capture_on_commit_callbacks(execute=True):
+        logs[2].delete()
+    with CaptureQueriesContext(connection) as ctx:
+        (lutz,) = api_client.get(url, URL_PARAMS).json()["elements"]
+    (sql,) = fact_queries(ctx)
+    assert "2025-10-06" not in sql
+    assert lutz["weeks"][2]["practice"] == {"attempts": 0, "successful": 0}
+    assert (lutz["attempts"], lutz["successful"]) == (10, 5)
@@ -0,0 +1,143 @@
+import pytest
+from io import StringIO
+from datetime import date
+from django.core import serializers
+from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from api.models import (
+    Skater,
+    SinglesEntity,
+    AthleteSeason,
+    SessionLog,
+    ElementAttemptFact,
+    PlanningEntityAccess,
+    SkatingElement,
+)
+
+
+@pytest.fixture
+def skater_season(user_factory):
+    coach = user_factory(email="coach@example.com", full_name="Coach", role="COACH")
+    skater = Skater.objects.create(full_name="Alex", date_of_birth=date(2010, 1, 1))
+    PlanningEntityAccess.objects.create(user=coach, access_level="COACH", planning_entity=skater)
+    singles = SinglesEntity.objects.create(skater=skater)
+    season = AthleteSeason.objects.create(skater=skater, season="2025-2026")
+    return coach, skater, singles, season
+
+
+def facts():
+    return sorted(ElementAttemptFact.objects.values_list("element_code", "attempts", "successful"))
+
+
+@pytest.mark.django_db
+def test_facts_follow_session_log_writes(skater_season):
+    coach, skater, singles, season = skater_season
+    lutz = SkatingElement.objects.create(
+        element_name="Triple Lutz", abbreviation="3Lz", discipline_type="SINGLES"
+    )
+    log = SessionLog.objects.create(
+        athlete_season=season,
+        planning_entity=singles,
+        session_date=date(2025, 10, 6),
+        element_attempts=[
+            {"element_code": "3Lz", "attempts": 5, "successful": 2},
+            {"element_code": "3Lz", "attempts": "3", "successful": 9},
+            {"element_code": "2A", "attempts": 0, "successful": 0},
+            {"element_code": "", "attempts": 4},
+            "garbage",
+        ],
+    )
+    assert facts() == [("3Lz", 8, 5)]
+    fact = ElementAttemptFact.objects.get()
+    assert (fact.skater_id, fact.element_id, fact.session_date) == (
+        skater.id,
+        lutz.id,
+        date(2025, 10, 6),
+    )
+
+    log.element_attempts = [{"element_code": "2A", "attempts": 10, "successful": 7}]
+    log.save()
+    assert facts() == [("2A", 10, 7)]
+
+    # Saves that don't touch the source fields leave the facts alone
+    with CaptureQueriesContext(connection) as ctx:
+        log.session_rating = 5
+        log.save(update_fields=["session_rating"])
+    assert not any("api_elementattemptfact" in q["sql"] for q in ctx.captured_queries)
+
+    log.delete()
+    assert facts() == []
+
+
+@pytest.mark.django_db
+def test_backfill_rebuilds_facts_for_bulk_created_logs(skater_season):
+    coach, skater, singles, season = skater_season
+    SessionLog.objects.bulk_create(
+        SessionLog(
+            athlete_season=season,
+            planning_entity=singles,
+            element_attempts=[{"element_code": "3F", "attempts": n + 1, "successful": n}],
+        )
+        for n in range(5)
+    )
+    assert facts() == []
+
+    out = StringIO()
+    call_command("backfill_element_facts", batch_size=2, stdout=out)
+    assert "5 from 5 logs" in out.getvalue()
+    assert [attempts for _, attempts, _ in facts()] == [1, 2, 3, 4, 5]
+
+
+@pytest.mark.django_db
+def test_fixture_loading_leaves_facts_to_the_backfill(skater_season):
+    coach, skater, singles, season = skater_season
+    SessionLog.objects.create(
+        athlete_season=season,
+        planning_entity=singles,
+        element_attempts=[{"element_code": "3F", "attempts": 4, "successful": 3}],
+    )
+    # Logs ahead of their season, as a fixture may list them
+    fixture = serializers.serialize("json", [*SessionLog.objects.all(), season])
+    season.delete()
+
+    for obj in serializers.deserialize("json", fixture):
+        obj.save()
+    assert facts() == []
+
+    call_command("backfill_element_facts", stdout=StringIO())
+    assert facts() == [("3F", 4, 3)]
+
+
+@pytest.mark.django_db
+def test_element_stats_endpoint(api_client, skater_season, django_assert_num_queries):
+    coach, skater, singles, season = skater_season
+    for day, attempts, successful in [(6, 4, 2), (8, 6, 6), (20, 10, 5)]:
+        SessionLog.objects.create(
+            athlete_season=season,
+            planning_entity=singles,
+            session_date=date(2025, 10, day),
+            element_attempts=[
+                {"element_code": "3Lz", "attempts": attempts, "successful": successful},
+                {"element_code": "2A", "attempts": 1, "successful": 1},
+            ],
+        )
+    api_client.force_authenticate(coach)
+
+    url = f"/api/skaters/{skater.id}/element-stats/"
+    # Auth, skater, access check and one aggregate query
+    with django_assert_num_queries(4):
+        data = api_client.get(url, {"end": "2025-10-26", "weeks": 3}).json()
+    assert data["start"] == "2025-10-06"
+    lutz, axel = data["elements"]
+    assert (lutz["element_code"], lutz["attempts"], lutz["success_rate"]) == ("3Lz", 20, 0.65)
+    assert [(w["week_start"], w["attempts"], w["success_rate"]) for w in lutz["series"]] == [
+        ("2025-10-06", 10, 0.8),
+        ("2025-10-13", 0, None),
+        ("2025-10-20", 10, 0.5),
+    ]
+    assert axel["attempts"] == 3
+
+    only = api_client.get(url, {"end": "2025-10-26", "weeks": 3, "elements": "2A"}).json()
+    assert [element["element_code"] for element in only["elements"]] == ["2A"]
+    assert api_client.get(url, {"end": "soon"}).status_code == 400
@@ -0,0 +1,89 @@
+import pytest
+from datetime import date
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from api.models import (
+    Skater,
+    SinglesEntity,
+    AthleteSeason,
+    AthleteProfile,
+    SessionLog,
+    PlanningEntityAccess,
+)
+from api.models.fields import Ciphertext
+
+
+@pytest.fixture
+def log(db):
+    skater = Skater.objects.create(full_name="Skater", date_of_birth=date(2010, 1, 1))
+    entity = SinglesEntity.objects.create(skater=skater)
+    season = AthleteSeason.objects.create(skater=skater, season="2024-2025")
+    return SessionLog.objects.create(
+        athlete_season=season,
+        planning_entity=entity,
+        coach_notes="Edges on the 3Lz",
+        skater_notes="Felt tired",
+    )
+
+
+@pytest.mark.django_db
+def test_encrypted_notes_are_decrypted_on_access(log):
+    loaded = SessionLog.objects.get(id=log.id)
+    assert isinstance(loaded.__dict__["coach_notes"], Ciphertext)
+
+    assert loaded.coach_notes == "Edges on the 3Lz"
+    assert loaded.__dict__["coach_notes"] == "Edges on the 3Lz"
+    # The other column is still untouched
+    assert isinstance(loaded.__dict__["skater_notes"], Ciphertext)
+
+
+@pytest.mark.django_db
+def test_untouched_ciphertext_round_trips_on_save(log, monkeypatch):
+    loaded = SessionLog.objects.get(id=log.id)
+    loaded.session_rating = 4
+    # Saving must write the stored ciphertext back without decrypting it
+    for name in ("coach_notes", "skater_notes"):
+        field = SessionLog._meta.get_field(name)
+        monkeypatch.setattr(field, "_load", lambda value: pytest.fail("decrypted on save"))
+    loaded.save()
+    monkeypatch.undo()
+    assert isinstance(loaded.__dict__["coach_notes"], Ciphertext)
+
+    reloaded = SessionLog.objects.get(id=log.id)
+    assert reloaded.coach_notes == "Edges on the 3Lz"
+    assert reloaded.skater_notes == "Felt tired"
+
+    reloaded.coach_notes = "Cleaner"
+    reloaded.save()
+    assert SessionLog.objects.get(id=log.id).coach_notes == "Cleaner"
+
+
+@pytest.mark.django_db
+def test_deferred_and_profile_fields(log):
+    deferred = SessionLog.objects.defer("coach_notes").get(id=log.id)
+    assert deferred.coach_notes == "Edges on the 3Lz"
+
+    profile = AthleteProfile.objects.create(
+        skater=log.athlete_season.skater, guardian_name="Parent", guardian_email="p@example.com"
+    )
+    loaded = AthleteProfile.objects.get(id=profile.id)
+    assert loaded.guardian_name == "Parent"
+    assert loaded.guardian_email == "p@example.com"
+    assert loaded.relevant_medical_notes is None
+
+
+@pytest.mark.django_db
+def test_fields_param_skips_notes(api_client, user_factory, log):
+    coach = user_factory(email="coach@example.com", full_name="Coach", role="COACH")
+    skater = log.athlete_season.skater
+    PlanningEntityAccess.objects.create(user=coach, access_level="COACH", planning_entity=skater)
+    api_client.force_authenticate(coach)
+
+    with CaptureQueriesContext(connection) as ctx:
+        response = api_client.get(f"/api/skaters/{skater.id}/logs/?fields=id,session_date")
+    assert response.json() == [{"id": log.id, "session_date": str(log.session_date)}]
+    log_queries = [q["sql"] for q in ctx.captured_queries if 'FROM "api_sessionlog"' in q["sql"]]
+    assert log_queries and not any("coach_notes" in sql for sql in log_queries)
+
+    full = api_client.get(f"/api/skaters/{skater.id}/logs/").json()
+    assert full[0]["coach_notes"] == "Edges on the 3Lz"
@@ -0,0 +1,231 @@
+import json
+import math
+import os
+import re
+import time
+from pathlib import Path
+
+import pytest
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from api.models import (
+    User,
+    AthleteSeason,
+    YearlyPlan,
+    Macrocycle,
+    Goal,
+    WeeklyPlan,
+    SessionLog,
+    InjuryLog,
+    CompetitionResult,
+    SkaterTest,
+    Program,
+    TeamTrip,
+    Invitation,
+)
+from api.seeding import seed_synthetic_club
+from api.services import get_content_type, warm_content_types
+from api.urls import urlpatterns
+
+# Query count, latency and response size for every GET route in api/urls.py,
+# measured against a seeded synthetic club and compared with endpoint_budgets.json.
+#
+# After an intentional change, re-record the budgets and review the diff:
+#   PERF_UPDATE_BUDGETS=1 python -m pytest api/tests/test_endpoint_budgets.py
+# PERF_TIME_FACTOR scales the latency budgets on slow machines (e.g. 3 in CI).
+BUDGETS_FILE = Path(__file__).with_name("endpoint_budgets.json")
+UPDATE_BUDGETS = os.environ.get("PERF_UPDATE_BUDGETS") == "1"
+TIME_FACTOR = float(os.environ.get("PERF_TIME_FACTOR", "1"))
+
+TIMING_RUNS = 3
+
+CLUB_SIZE = {"skaters": 200, "seasons": 2, "sessions_per_week": 2, "seed": 17}
+
+# Which seeded object a `pk` stands for, by route prefix
+PK_TARGETS = {
+    "skaters": "skater",
+    "entities/singles": "singles",
+    "entities/solodance": "solodance",
+    "entities/teams": "team",
+    "entities/synchro": "synchro",
+    "teams": "team",
+    "synchro": "synchro",
+    "ytps": "plan",
+    "macrocycles": "macrocycle",
+    "seasons": "season",
+    "goals": "goal",
+    "weeks": "week",
+    "logs": "log",
+    "injuries": "injury",
+    "results": "result",
+    "tests": "test",
+    "programs": "program",
+    "trips": "trip",
+    "itinerary": "itinerary",
+    "housing": "housing",
+}
+KWARG_TARGETS = {
+    "skater_id": "skater",
+    "plan_id": "plan",
+    "season_id": "season",
+    "trip_id": "trip",
+    "program_id": "program",
+    "token": "token",
+}
+# IsCoachOrOwner cannot resolve the owning entity of these rows yet, so even
+# their coach is refused; the budget covers the refusal until that is fixed.
+EXPECTED_STATUS = {
+    "macrocycles/<int:pk>/": 403,
+    "trips/<int:pk>/": 403,
+    "itinerary/<int:pk>/": 403,
+    "housing/<int:pk>/": 403,
+    # Staff only
+    "admin/instrumentation/": 403,
+}
+ROUTE_PARAM = re.compile(r"<(?:\w+:)?(\w+)>")
+
+
+def get_routes():
+    """Every route in api/urls.py that answers GET."""
+    return [
+        str(pattern.pattern)
+        for pattern in urlpatterns
+        if hasattr(pattern.callback.view_class, "get")
+    ]
+
+
+def resolve_route(route, targets):
+    prefix = route.split("/<")[0]
+
+    def value(match):
+        name = match.group(1)
+        if name == "pk":
+            return str(targets[PK_TARGETS[prefix]])
+        if name == "team_id":
+            return str(targets["synchro" if prefix == "synchro" else "team"])
+        return str(targets[KWARG_TARGETS[name]])
+
+    return "/api/" + ROUTE_PARAM.sub(value, route)
+
+
+def route_targets(club):
+    """One representative of everything a route can point at, centred on a skater
+    who skates singles, solo dance, pairs/dance and synchro."""
+    skater = club.skaters[0]
+    singles = club.singles[0]
+    synchro = club.synchro_teams[0]
+    plan = YearlyPlan.objects.filter(
+        content_type=get_content_type(singles), object_id=singles.pk
+    ).latest("id")
+    season = AthleteSeason.objects.filter(skater=skater, is_active=True).get()
+    trip = TeamTrip.objects.filter(
+        content_type=get_content_type(synchro), object_id=synchro.pk
+    ).get()
+    return {
+        "skater": skater.pk,
+        "singles": singles.pk,
+        "solodance": club.solo_dance[0].pk,
+        "team": club.teams[0].pk,
+        "synchro": synchro.pk,
+        "plan": plan.pk,
+        "macrocycle": Macrocycle.objects.filter(yearly_plan=plan).first().pk,
+        "season": season.pk,
+        "goal": Goal.objects.filter(assignee_skater=skater).first().pk,
+        "week": WeeklyPlan.objects.filter(athlete_season=season).first().pk,
+        "log": SessionLog.objects.filter(athlete_season=season).first().pk,
+        "injury": InjuryLog.objects.filter(skater=skater).first().pk,
+        "result": CompetitionResult.objects.filter(
+            content_type=get_content_type(singles), object_id=singles.pk
+        )
+        .first()
+        .pk,
+        "test": SkaterTest.objects.filter(skater=skater).first().pk,
+        "program": Program.objects.filter(
+            content_type=get_content_type(singles), object_id=singles.pk
+        )
+        .first()
+        .pk,
+        "trip": trip.pk,
+        "itinerary": trip.itinerary.first().pk,
+        "housing": trip.rooming_list.first().pk,
+        "token": Invitation.objects.filter(object_id=skater.pk).get().token,
+    }
+
+
+def timed_get(api_client, coach, url):
+    cache.clear()
+    # A fresh user per request, as in production (the access index is memoized on it)
+    api_client.force_authenticate(User.objects.get(pk=coach.pk))
+    start = time.perf_counter()
+    response = api_client.get(url)
+    return response, (time.perf_counter() - start) * 1000
+
+
+def measure(api_client, coach, url):
+    """Queries and size of a cold request; latency is the best of TIMING_RUNS."""
+    with CaptureQueriesContext(connection) as ctx:
+        response, elapsed = timed_get(api_client, coach, url)
+    queries = len(ctx.captured_queries)
+    for _ in range(TIMING_RUNS - 1):
+        elapsed = min(elapsed, timed_get(api_client, coach, url)[1])
+    return response, {"queries": queries, "ms": elapsed, "bytes": len(response.content)}
+
+
+def recorded_budget(measured):
+    """Budgets written by PERF_UPDATE_BUDGETS: exact query counts, headroom on the rest."""
+    return {
+        "queries": measured["queries"],
+        "ms": max(200, math.ceil(measured["ms"] * 4 / 50) * 50),
+        "bytes": max(1024, math.ceil(measured["bytes"] * 1.25 / 1024) * 1024),
+    }
+
+
+def test_every_get_route_has_a_budget():
+    budgets = json.loads(BUDGETS_FILE.read_text())
+    routes = get_routes()
+    if not UPDATE_BUDGETS:
+        assert sorted(set(routes) - set(budgets)) == [], "Routes without a budget"
+        assert sorted(set(budgets) - set(routes)) == [], "Budgets for removed routes"
+    for route in routes:
+        prefix = route.split("/<")[0]
+        if "<pk>" in route or "<int:pk>" in route:
+            assert prefix in PK_TARGETS, f"No seeded target for {route}"
+
+
+# Committed and truncated afterwards rather than rolled back: a rolled-back seed
+# leaves dead rows behind that skew the planner for later tests
+@pytest.mark.django_db(transaction=True)
+def test_endpoints_within_budget(api_client, user_factory):
+    coach = user_factory(email="coach@example.com", full_name="Coach", role="COACH")
+    club = seed_synthetic_club(coach=coach, **CLUB_SIZE)
+    targets = route_targets(club)
+    warm_content_types()
+
+    budgets = json.loads(BUDGETS_FILE.read_text())
+    recorded = {}
+    errors = []
+    failures = []
+    for route in get_routes():
+        url = resolve_route(route, targets)
+        response, measured = measure(api_client, coach, url)
+        if response.status_code != EXPECTED_STATUS.get(route, 200):
+            errors.append(f"{route}: GET {url} returned {response.status_code}")
+            continue
+        recorded[route] = recorded_budget(measured)
+
+        budget = budgets.get(route)
+        if budget is None:
+            failures.append(f"{route}: no budget in {BUDGETS_FILE.name}")
+            continue
+        limits = {**budget, "ms": budget["ms"] * TIME_FACTOR}
+        for key in ("queries", "ms", "bytes"):
+            if measured[key] > limits[key]:
+                failures.append(f"{route}: {measured[key]:.0f} {key} (budget {limits[key]:.0f})")
+
+    assert not errors, "Endpoints failed:\n" + "\n".join(errors)
+    if UPDATE_BUDGETS:
+        BUDGETS_FILE.write_text(json.dumps(recorded, indent=2) + "\n")
+        return
+    assert not failures, "Endpoint budgets exceeded:\n" + "\n".join(failures)
@@ -0,0 +1,84 @@
+import pytest
+from datetime import date
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from api.models import (
+    Skater,
+    SinglesEntity,
+    SoloDanceEntity,
+    Team,
+    AthleteSeason,
+    SessionLog,
+    Goal,
+    PlanningEntityAccess,
+    User,
+)
+from api.services import prefetch_planning_entities
+
+
+@pytest.fixture
+def skater_setup(user_factory):
+    coach = user_factory(email="coach@example.com", full_name="Coach", role="COACH")
+    skater = Skater.objects.create(full_name="Alex", date_of_birth=date(2010, 1, 1))
+    partner = Skater.objects.create(full_name="Sam", date_of_birth=date(2010, 1, 1))
+    PlanningEntityAccess.objects.create(user=coach, access_level="COACH", planning_entity=skater)
+    entities = [
+        SinglesEntity.objects.create(skater=skater),
+        SoloDanceEntity.objects.create(skater=skater),
+        Team.objects.create(
+            team_name="Alex/Sam", discipline="ICE_DANCE", partner_a=skater, partner_b=partner
+        ),
+    ]
+    season = AthleteSeason.objects.create(skater=skater, season="2025-2026")
+    return coach, skater, season, entities
+
+
+def add_logs(season, entities, per_entity):
+    for entity in entities:
+        for _ in range(per_entity):
+            SessionLog.objects.create(athlete_season=season, planning_entity=entity)
+
+
+def log_list(api_client, coach, skater):
+    api_client.force_authenticate(User.objects.get(pk=coach.pk))
+    with CaptureQueriesContext(connection) as ctx:
+        response = api_client.get(f"/api/skaters/{skater.id}/logs/")
+    assert response.status_code == 200
+    return response.json(), len(ctx.captured_queries)
+
+
+@pytest.mark.django_db
+def test_log_list_resolves_entities_per_content_type(api_client, skater_setup):
+    coach, skater, season, entities = skater_setup
+
+    add_logs(season, entities, 1)
+    _, few = log_list(api_client, coach, skater)
+    add_logs(season, entities, 4)
+    logs, many = log_list(api_client, coach, skater)
+
+    assert len(logs) == 15
+    assert few == many
+    assert {log["discipline_name"] for log in logs} == {"Singles", "Solo Dance", "Alex/Sam"}
+
+    # Trimming the entity-backed field away skips the lookup entirely
+    api_client.force_authenticate(User.objects.get(pk=coach.pk))
+    with CaptureQueriesContext(connection) as ctx:
+        api_client.get(f"/api/skaters/{skater.id}/logs/?fields=id,session_date")
+    assert not any('FROM "api_singlesentity"' in q["sql"] for q in ctx.captured_queries)
+
+
+@pytest.mark.django_db
+def test_prefetch_helper_selects_skater(skater_setup, django_assert_num_queries):
+    coach, skater, season, entities = skater_setup
+    for entity in entities:
+        Goal.objects.create(title="Goal", planning_entity=entity, target_date=date.today())
+
+    goals = list(Goal.objects.order_by("id"))
+    with django_assert_num_queries(3):
+        prefetch_planning_entities(goals)
+    with django_assert_num_queries(0):
+        assert [str(goal.planning_entity) for goal in goals] == [
+            "Alex (Singles)",
+            "Alex (Solo Dance)",
+            "Alex/Sam",
+        ]
@@ -0,0 +1,122 @@
+import pytest
+from datetime import date, timedelta
+from django.contrib.contenttypes.models import ContentType
+from django.db import connection
+from api.models import (
+    Skater,
+    SinglesEntity,
+    AthleteSeason,
+    SessionLog,
+    Goal,
+    InjuryLog,
+    Competition,
+    CompetitionResult,
+    PlanningEntityAccess,
+)
+
+
+@pytest.fixture
+def seeded(user_factory):
+    """A few hundred rows spread across many entities."""
+    coaches = [
+        user_factory(email=f"coach{i}@example.com", full_name=f"Coach {i}", role="COACH")
+        for i in range(5)
+    ]
+    comp = Competition.objects.create(
+        title="Sectionals",
+        city="Ottawa",
+        province_state="ON",
+        start_date=date(2025, 1, 1),
+        end_date=date(2025, 1, 2),
+    )
+    statuses = ["IN_PROGRESS", "COMPLETED", "DRAFT", "PENDING"]
+    recovery = ["Active"] + ["Resolved"] * 9
+    for i in range(40):
+        skater = Skater.objects.create(full_name=f"Skater {i}", date_of_birth=date(2010, 1, 1))
+        entity = SinglesEntity.objects.create(skater=skater)
+        season = AthleteSeason.objects.create(skater=skater, season="2024-2025")
+        for coach in coaches:
+            PlanningEntityAccess.objects.create(
+                user=coach, access_level="COACH", planning_entity=entity
+            )
+        SessionLog.objects.bulk_create(
+            SessionLog(
+                athlete_season=season,
+                planning_entity=entity,
+                session_date=date(2025, 1, 1) + timedelta(days=d),
+            )
+            for d in range(10)
+        )
+        Goal.objects.bulk_create(
+            Goal(
+                title=f"Goal {g}",
+                planning_entity=entity,
+                assignee_skater=skater,
+                current_status=statuses[g % 4],
+                target_date=date(2025, 1, 1) + timedelta(days=g),
+            )
+            for g in range(8)
+        )
+        InjuryLog.objects.bulk_create(
+            InjuryLog(
+                skater=skater,
+                injury_type="Strain",
+                date_of_onset=date(2024, 12, 1),
+                recovery_status=recovery[n],
+            )
+            for n in range(10)
+        )
+        CompetitionResult.objects.create(competition=comp, planning_entity=entity, level="Junior")
+    with connection.cursor() as cursor:
+        cursor.execute("ANALYZE")
+    return skater, entity, season, Skater.objects.order_by("id")[:10]
+
+
+def plan_for(queryset):
+    with connection.cursor() as cursor:
+        # Scoped to the test transaction; makes the planner show its index choice
+        # even on a dataset small enough to fit in a page or two
+        cursor.execute("SET LOCAL enable_seqscan = off")
+    return queryset.explain()
+
+
+@pytest.mark.django_db
+def test_planner_uses_generic_relation_indexes(seeded):
+    skater, entity, season, roster = seeded
+    ct = ContentType.objects.get_for_model(SinglesEntity)
+    open_statuses = ["IN_PROGRESS", "PENDING", "APPROVED"]
+
+    assert "sessionlog_season_date_idx" in plan_for(
+        SessionLog.objects.filter(athlete_season=season).order_by("-session_date")
+    )
+    assert "sessionlog_entity_date_idx" in plan_for(
+        SessionLog.objects.filter(content_type=ct, object_id=entity.id).order_by("-session_date")
+    )
+    assert "goal_entity_status_idx" in plan_for(
+        Goal.objects.filter(
+            content_type=ct,
+            object_id=entity.id,
+            current_status__in=open_statuses,
+            target_date__lt=date(2025, 1, 5),
+        ).order_by("target_date")
+    )
+    assert "goal_open_assignee_idx" in plan_for(
+        Goal.objects.filter(
+            assignee_skater__in=list(roster),
+            current_status__in=open_statuses,
+            target_date__lt=date(2025, 1, 5),
+        ).order_by("target_date")
+    )
+    assert "injury_open_skater_idx" in plan_for(
+        InjuryLog.objects.filter(
+            skater__in=list(roster), recovery_status__in=["Active", "Recovering"]
+        ).order_by("date_of_onset")
+    )
+    assert "result_entity_status_idx" in plan_for(
+        CompetitionResult.objects.filter(
+            content_type=ct, object_id=entity.id, status=CompetitionResult.Status.COMPLETED
+        ).order_by()
+    )
+    assert "pea_entity_idx" in plan_for(
+        PlanningEntityAccess.objects.filter(content_type=ct, object_id=entity.id)
+    )
@@ -0,0 +1,79 @@
+import json
+import logging
+
+import pytest
+
+from api.models import User
+from api.services import endpoint_stats, fingerprint, RequestMetrics
+
+
+@pytest.fixture
+def instrumented(settings):
+    settings.API_INSTRUMENTATION = True
+    settings.API_INSTRUMENTATION_SLOW_MS = 10_000
+    endpoint_stats.clear()
+    yield endpoint_stats
+    endpoint_stats.clear()
+
+
+def test_fingerprint_collapses_literals_and_in_lists():
+    assert fingerprint('SELECT * FROM "a" WHERE "id" IN (%s, %s, %s) LIMIT 21') == fingerprint(
+        'SELECT *  FROM "a" WHERE "id" IN (%s, %s) LIMIT 1'
+    )
+    assert fingerprint("SELECT 'x' FROM a") != fingerprint("SELECT 'x' FROM b")
+
+
+def test_repeated_statements_are_reported_as_duplicates():
+    metrics = RequestMetrics()
+    run = lambda sql, params, many, context: None  # noqa: E731
+    for pk in range(4):
+        metrics(run, 'SELECT * FROM "api_skater" WHERE "id" = %s', [pk], False, {})
+    metrics(run, 'SELECT * FROM "api_team"', [], False, {})
+
+    sample = metrics.finish("GET", "api/roster/", "RosterView", 200)
+    assert sample["queries"] == 5
+    assert sample["duplicate_queries"] == 3
+    assert sample["duplicates"] == [
+        {"count": 4, "sql": 'SELECT * FROM "api_skater" WHERE "id" = %s'}
+    ]
+
+
+@pytest.mark.django_db
+def test_requests_are_logged_and_aggregated(api_client, user_factory, instrumented, caplog):
+    coach = user_factory(email="coach@example.com", full_name="Coach", role="COACH")
+    admin = user_factory(email="admin@example.com", full_name="Admin", is_staff=True)
+
+    api_client.force_authenticate(coach)
+    with caplog.at_level(logging.INFO, logger="api.instrumentation"):
+        for _ in range(2):
+            assert api_client.get("/api/roster/").status_code == 200
+    record = json.loads(caplog.records[-1].getMessage())
+    assert record["route"] == "api/roster/"
+    assert record["view"] == "api.views.skaters.RosterView"
+    assert record["queries"] > 0
+    assert record["total_ms"] >= record["db_ms"]
+
+    # Staff only
+    assert api_client.get("/api/admin/instrumentation/").status_code == 403
+
+    api_client.force_authenticate(User.objects.get(pk=admin.pk))
+    response = api_client.get("/api/admin/instrumentation/")
+    assert response.status_code == 200
+    roster = next(row for row in response.data["endpoints"] if row["route"] == "api/roster/")
+    assert roster["requests"] == 2
+    assert roster["queries"]["max"] == record["queries"]
+
+    assert api_client.delete("/api/admin/instrumentation/").status_code == 204
+    # Only the DELETE itself is left
+    assert [row["method"] for row in endpoint_stats.snapshot()] == ["DELETE"]
+
+
+@pytest.mark.django_db
+def test_disabled_by_default(api_client, user_factory, settings):
+    settings.API_INSTRUMENTATION = False
+    endpoint_stats.clear()
+    api_client.force_authenticate(
+        user_factory(email="coach@example.com", full_name="Coach", role="COACH")
+    )
+    api_client.get("/api/roster/")
+    assert endpoint_stats.snapshot() == []
@@ -0,0 +1,140 @@
+import pytest
+from django.core import mail
+from django.core.mail.backends.locmem import EmailBackend
+
+from api.models import Invitation, PlanningEntityAccess, SynchroTeam
+from api.services import get_content_type
+from skateplan_project.celery import app as celery_app
+
+
+class BouncingBackend(EmailBackend):
+    """locmem, except that addresses at bounce.test always fail."""
+
+    def send_messages(self, messages):
+        for message in messages:
+            if any(to.endswith("@bounce.test") for to in message.to):
+                raise ConnectionError("550 mailbox unavailable")
+        return super().send_messages(messages)
+
+
+class UnreachableBackend(EmailBackend):
+    """locmem, except that the mail server can never be reached."""
+
+    def open(self):
+        raise ConnectionRefusedError("Connection refused")
+
+
+@pytest.fixture
+def eager_celery(settings):
+    settings.EMAIL_BACKEND = "django.core.mail.backends.locmem.EmailBackend"
+    # The app reads Django settings under the CELERY_ namespace. Eager tasks
+    # still acquire a producer, so point it at an in-memory broker (no Redis)
+    previous = {
+        key: celery_app.conf[key] for key in ("CELERY_TASK_ALWAYS_EAGER", "CELERY_BROKER_URL")
+    }
+    celery_app.conf.update(CELERY_TASK_ALWAYS_EAGER=True, CELERY_BROKER_URL="memory://")
+    yield
+    celery_app.conf.update(previous)
+
+
+@pytest.fixture
+def synchro(user_factory):
+    coach = user_factory(email="coach@example.com", full_name="Coach", role="COACH")
+    team = SynchroTeam.objects.create(team_name="Nexxice")
+    PlanningEntityAccess.objects.create(
+        user=coach,
+        content_type=get_content_type(team),
+        object_id=team.id,
+        access_level="COACH",
+    )
+    return coach, team
+
+
+def invite(api_client, team, emails):
+    return api_client.post(
+        "/api/invitations/send/",
+        {"emails": emails, "role": "ATHLETE", "entity_type": "SynchroTeam", "entity_id": team.id},
+        format="json",
+    )
+
+
+@pytest.mark.django_db
+def test_bulk_invites_are_queued_then_sent(
+    api_client, synchro, eager_celery, django_capture_on_commit_callbacks
+):
+    coach, team = synchro
+    api_client.force_authenticate(coach)
+    emails = [f"skater{n}@example.com" for n in range(30)] + ["skater0@example.com"]
+
+    with django_capture_on_commit_callbacks() as callbacks:
+        response = invite(api_client, team, emails)
+
+    # Nothing is sent on the request path
+    assert response.status_code == 201
+    assert len(mail.outbox) == 0
+    assert {row["status"] for row in response.data["results"]} == {"queued"}
+    assert len(response.data["results"]) == 30
+    ids = [str(row["invitation_id"]) for row in response.data["results"]]
+    status = api_client.get("/api/invitations/status/", {"ids": ",".join(ids[:2])})
+    assert [row["status"] for row in status.data] == ["queued", "queued"]
+
+    for callback in callbacks:
+        callback()
+
+    assert len(mail.outbox) == 30
+    assert "Nexxice" in mail.outbox[0].subject
+    assert "Team Member" in mail.outbox[0].alternatives[0][0]
+    status = api_client.get("/api/invitations/status/")
+    assert len(status.data) == 30
+    assert {(row["status"], row["attempts"]) for row in status.data} == {("sent", 1)}
+
+
+@pytest.mark.django_db
+def test_failed_emails_are_retried_then_marked_failed(
+    api_client, synchro, eager_celery, settings, django_capture_on_commit_callbacks
+):
+    settings.EMAIL_BACKEND = "api.tests.test_invitations.BouncingBackend"
+    coach, team = synchro
+    api_client.force_authenticate(coach)
+
+    with django_capture_on_commit_callbacks(execute=True):
+        invite(api_client, team, ["ok@example.com", "gone@bounce.test"])
+
+    assert [message.to for message in mail.outbox] == [["ok@example.com"]]
+    bounced = Invitation.objects.get(email="gone@bounce.test")
+    assert bounced.email_status == Invitation.EmailStatus.FAILED
+    assert bounced.email_attempts == 6
+    assert "550" in bounced.email_error
+    assert Invitation.objects.get(email="ok@example.com").email_attempts == 1
+
+
+@pytest.mark.django_db
+def test_unreachable_mail_server_fails_the_whole_batch(
+    api_client, synchro, eager_celery, settings, django_capture_on_commit_callbacks
+):
+    settings.EMAIL_BACKEND = "api.tests.test_invitations.UnreachableBackend"
+    coach, team = synchro
+    api_client.force_authenticate(coach)
+
+    with django_capture_on_commit_callbacks(execute=True):
+        invite(api_client, team, ["a@example.com", "b@example.com"])
+
+    assert mail.outbox == []
+    assert Invitation.objects.count() == 2
+    for invitation in Invitation.objects.all():
+        assert invitation.email_status == Invitation.EmailStatus.FAILED
+        assert invitation.email_attempts == 6
+        assert "refused" in invitation.email_error
+
+
+@pytest.mark.django_db
+def test_status_only_shows_own_invitations(api_client, synchro, user_factory):
+    coach, team = synchro
+    other = user_factory(email="other@example.com", full_name="Other", role="COACH")
+    invitation = Invitation.objects.create(
+        email="a@example.com", sender=coach, role="ATHLETE", token="t-1"
+    )
+
+    api_client.force_authenticate(other)
+    assert api_client.get("/api/invitations/status/", {"ids": invitation.pk}).data == []
+    assert api_client.get("/api/invitations/status/", {"ids": "nope"}).status_code == 400
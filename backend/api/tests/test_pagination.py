@@ -0,0 +1,100 @@
+import pytest
+from base64 import b64decode
+from urllib.parse import parse_qs, urlparse
+from datetime import date, timedelta
+from api.models import (
+    Skater,
+    SinglesEntity,
+    AthleteSeason,
+    SessionLog,
+    PlanningEntityAccess,
+)
+
+
+@pytest.fixture
+def coach_with_logs(user_factory):
+    coach = user_factory(email="coach@example.com", full_name="Coach", role="COACH")
+    skater = Skater.objects.create(full_name="Skater", date_of_birth=date(2010, 1, 1))
+    entity = SinglesEntity.objects.create(skater=skater)
+    season = AthleteSeason.objects.create(skater=skater, season="2024-2025")
+    PlanningEntityAccess.objects.create(user=coach, access_level="COACH", planning_entity=skater)
+    # Two logs per day so the keyset position has ties to break
+    SessionLog.objects.bulk_create(
+        SessionLog(
+            athlete_season=season,
+            planning_entity=entity,
+            session_date=date(2025, 1, 1) + timedelta(days=i // 2),
+        )
+        for i in range(25)
+    )
+    return coach, skater
+
+
+@pytest.mark.django_db
+def test_lists_are_unpaginated_by_default(api_client, coach_with_logs):
+    coach, skater = coach_with_logs
+    api_client.force_authenticate(coach)
+
+    response = api_client.get(f"/api/skaters/{skater.id}/logs/")
+    assert response.status_code == 200
+    assert isinstance(response.json(), list)
+    assert len(response.json()) == 25
+
+
+@pytest.mark.django_db
+def test_cursor_pages_walk_the_natural_ordering(api_client, coach_with_logs):
+    coach, skater = coach_with_logs
+    api_client.force_authenticate(coach)
+
+    expected = list(
+        SessionLog.objects.order_by("-session_date", "-session_time", "-id").values_list(
+            "id", flat=True
+        )
+    )
+    seen = []
+    url = f"/api/skaters/{skater.id}/logs/?page_size=10"
+    while url:
+        page = api_client.get(url).json()
+        assert len(page["results"]) <= 10
+        seen += [log["id"] for log in page["results"]]
+        url = page["next"]
+    assert seen == expected
+
+    # Page size is capped
+    page = api_client.get(f"/api/skaters/{skater.id}/logs/?page_size=100000").json()
+    assert len(page["results"]) == 25
+
+
+@pytest.mark.django_db
+def test_roster_pages_keep_active_skaters_first(api_client, user_factory):
+    coach = user_factory(email="roster@example.com", full_name="Coach", role="COACH")
+    for i in range(7):
+        skater = Skater.objects.create(
+            full_name=f"Skater {i}", date_of_birth=date(2010, 1, 1), is_active=i % 3 != 0
+        )
+        PlanningEntityAccess.objects.create(
+            user=coach, access_level="COACH", planning_entity=skater
+        )
+    api_client.force_authenticate(coach)
+
+    full = [s["id"] for s in api_client.get("/api/roster/").json()]
+    seen = []
+    url = "/api/roster/?page_size=2"
+    while url:
+        page = api_client.get(url).json()
+        seen += [s["id"] for s in page["results"]]
+        url = page["next"]
+        # The position is the whole (is_active, full_name, id) tuple, never an offset
+        if url:
+            cursor = parse_qs(urlparse(url).query)["cursor"][0]
+            assert "o=" not in b64decode(cursor).decode()
+    assert seen == full
+
+    # Walking back from the last page gives the same rows
+    back = []
+    url = page["previous"]
+    while url:
+        page = api_client.get(url).json()
+        back = [s["id"] for s in page["results"]] + back
+        url = page["previous"]
+    assert back == full[:-1]
@@ -0,0 +1,147 @@
+import pytest
+from io import StringIO
+from datetime import date
+from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from api.models import (
+    Skater,
+    SinglesEntity,
+    Team,
+    AthleteSeason,
+    SessionLog,
+    Competition,
+    CompetitionResult,
+    EntityPerformanceSummary,
+    PlanningEntityAccess,
+)
+from api.services import get_content_type
+
+
+def make_competition(title, start):
+    return Competition.objects.create(
+        title=title, city="Ottawa", province_state="ON", start_date=start, end_date=start
+    )
+
+
+@pytest.fixture
+def skater_with_results(user_factory):
+    coach = user_factory(email="coach@example.com", full_name="Coach", role="COACH")
+    skater = Skater.objects.create(full_name="Alex", date_of_birth=date(2010, 1, 1))
+    PlanningEntityAccess.objects.create(user=coach, access_level="COACH", planning_entity=skater)
+    singles = SinglesEntity.objects.create(skater=skater)
+    CompetitionResult.objects.create(
+        competition=make_competition("Fall Classic", date.today()),
+        planning_entity=singles,
+        level="Junior",
+        total_score="101.50",
+        segment_scores=[{"name": "Free", "score": 101.5, "tes": 50, "pcs": 51.5}],
+    )
+    return coach, skater, singles
+
+
+@pytest.mark.django_db
+def test_stats_endpoint_reads_a_single_summary_row(api_client, skater_with_results):
+    coach, skater, singles = skater_with_results
+    api_client.force_authenticate(coach)
+
+    first = api_client.get(f"/api/skaters/{skater.id}/stats/").json()
+    assert first["overall"]["pb"]["score"] == 101.5
+    assert first["segments"]["Free"]["pcs"]["pb"]["comp"] == "Fall Classic"
+    summary = EntityPerformanceSummary.objects.get()
+    assert summary.last_competition.title == "Fall Classic"
+
+    with CaptureQueriesContext(connection) as ctx:
+        second = api_client.get(f"/api/skaters/{skater.id}/stats/").json()
+    assert second == first
+    sql = " ".join(q["sql"] for q in ctx.captured_queries)
+    assert "api_competitionresult" not in sql and "api_sessionlog" not in sql
+
+    # A summary computed last season is rebuilt on read
+    EntityPerformanceSummary.objects.update(season_start=date(2000, 7, 1))
+    assert api_client.get(f"/api/skaters/{skater.id}/stats/").json() == first
+    assert EntityPerformanceSummary.objects.get().season_start != date(2000, 7, 1)
+
+
+@pytest.mark.django_db(transaction=True)
+def test_summary_follows_result_and_session_writes(api_client, skater_with_results):
+    coach, skater, singles = skater_with_results
+    api_client.force_authenticate(coach)
+    api_client.get(f"/api/skaters/{skater.id}/stats/")
+
+    partner = Skater.objects.create(full_name="Sam", date_of_birth=date(2010, 1, 1))
+    team = Team.objects.create(
+        team_name="Alex/Sam", discipline="PAIRS", partner_a=skater, partner_b=partner
+    )
+    result = CompetitionResult.objects.create(
+        competition=make_competition("Sectionals", date.today()),
+        planning_entity=team,
+        level="Junior",
+        total_score="150.00",
+    )
+    summary = EntityPerformanceSummary.objects.get(object_id=skater.id)
+    assert summary.overall["pb"]["score"] == 150.0
+    assert summary.last_competition_id == result.competition_id
+
+    season = AthleteSeason.objects.create(skater=skater, season="2025-2026")
+    SessionLog.objects.create(athlete_season=season, planning_entity=singles)
+    summary.refresh_from_db()
+    assert (summary.volume, summary.season_name) == (1, "2025-2026")
+
+    result.delete()
+    summary.refresh_from_db()
+    assert summary.overall["pb"]["score"] == 101.5
+
+    skater.delete()
+    assert not EntityPerformanceSummary.objects.exists()
+
+
+@pytest.mark.django_db
+def test_summary_follows_partner_changes(
+    api_client, skater_with_results, django_capture_on_commit_callbacks
+):
+    coach, skater, singles = skater_with_results
+    partner, newcomer = [
+        Skater.objects.create(full_name=name, date_of_birth=date(2010, 1, 1))
+        for name in ("Sam", "Jo")
+    ]
+    for athlete in (partner, newcomer):
+        PlanningEntityAccess.objects.create(
+            user=coach, access_level="COACH", planning_entity=athlete
+        )
+    team = Team.objects.create(
+        team_name="Alex/Sam", discipline="PAIRS", partner_a=skater, partner_b=partner
+    )
+    CompetitionResult.objects.create(
+        competition=make_competition("Sectionals", date.today()),
+        planning_entity=team,
+        level="Junior",
+        total_score="150.00",
+    )
+    api_client.force_authenticate(coach)
+    assert (
+        api_client.get(f"/api/skaters/{partner.id}/stats/").json()["overall"]["pb"]["score"]
+        == 150.0
+    )
+
+    # The dropped partner no longer has the team's results; the new one does
+    api_client.get(f"/api/skaters/{newcomer.id}/stats/")
+    with django_capture_on_commit_callbacks(execute=True):
+        team.partner_b = newcomer
+        team.save()
+    summaries = dict(
+        EntityPerformanceSummary.objects.filter(
+            content_type=get_content_type(Skater), object_id__in=[partner.id, newcomer.id]
+        ).values_list("object_id", "overall")
+    )
+    assert summaries[partner.id]["pb"]["score"] == 0.0
+    assert summaries[newcomer.id]["pb"]["score"] == 150.0
+
+
+@pytest.mark.django_db
+def test_rebuild_command(skater_with_results):
+    coach, skater, singles = skater_with_results
+    call_command("rebuild_performance_summaries", "--batch-size", "1", stdout=StringIO())
+    summary = EntityPerformanceSummary.objects.get(object_id=skater.id)
+    assert summary.overall["pb"]["score"] == 101.5
+    assert summary.history[0]["name"] == "Fall Classic"
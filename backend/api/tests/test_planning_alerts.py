@@ -0,0 +1,105 @@
+import pytest
+from datetime import date, timedelta
+from api.models import (
+    Skater,
+    Team,
+    SynchroTeam,
+    AthleteSeason,
+    YearlyPlan,
+    WeeklyPlan,
+    PlanningEntityAccess,
+)
+from api.services import collect_planning_alerts, get_access_index
+
+TODAY = date(2025, 1, 15)
+WEEK_START = TODAY - timedelta(days=TODAY.weekday())
+
+
+def make_season(coach, entity, planned, theme=None, **kwargs):
+    if isinstance(entity, Skater):
+        season = AthleteSeason.objects.create(skater=entity, season="2024-2025", **kwargs)
+    else:
+        season = AthleteSeason.objects.create(planning_entity=entity, season="2024-2025", **kwargs)
+    if planned:
+        plan = YearlyPlan.objects.create(coach_owner=coach, planning_entity=entity)
+        plan.athlete_seasons.add(season)
+        if theme is not None:
+            WeeklyPlan.objects.create(athlete_season=season, week_start=WEEK_START, theme=theme)
+    return season
+
+
+@pytest.mark.django_db
+def test_planning_alerts_query_count_is_constant(user_factory, django_assert_num_queries):
+    """Alerts for a whole roster come from a fixed number of queries."""
+    coach = user_factory(email="coach@example.com", full_name="Coach", role="COACH")
+
+    skaters = []
+    for i in range(12):
+        skater = Skater.objects.create(full_name=f"Skater {i:02}", date_of_birth=date(2010, 1, 1))
+        PlanningEntityAccess.objects.create(
+            user=coach, access_level="COACH", planning_entity=skater
+        )
+        skaters.append(skater)
+
+    # 0-3: no plan, 4-7: planned but no theme, 8-11: fully planned
+    for skater in skaters[:4]:
+        make_season(coach, skater, planned=False)
+    for skater in skaters[4:8]:
+        make_season(coach, skater, planned=True, theme="")
+    for skater in skaters[8:]:
+        make_season(coach, skater, planned=True, theme="Edges")
+    # Out-of-range season is skipped even without a weekly plan
+    make_season(
+        coach,
+        skaters[8],
+        planned=True,
+        start_date=date(2023, 7, 1),
+        end_date=date(2024, 6, 30),
+    )
+    # Inactive seasons are ignored
+    make_season(coach, skaters[9], planned=False, is_active=False)
+
+    team = Team.objects.create(
+        team_name="Pair", discipline="PAIRS", partner_a=skaters[0], partner_b=skaters[1]
+    )
+    PlanningEntityAccess.objects.create(
+        user=coach, access_level="COLLABORATOR", planning_entity=team
+    )
+    make_season(coach, team, planned=False)
+
+    synchro = SynchroTeam.objects.create(team_name="Nexxice", level="Senior")
+    PlanningEntityAccess.objects.create(user=coach, access_level="COACH", planning_entity=synchro)
+    make_season(coach, synchro, planned=True)
+
+    get_access_index(coach)
+    with django_assert_num_queries(2):
+        alerts = collect_planning_alerts(coach, skaters, [team], [synchro], today=TODAY)
+
+    issues = [(a["skater"], a["issue"], a["link"], a["is_shared"]) for a in alerts]
+    assert issues == (
+        [
+            (
+                f"Skater {i:02}",
+                "No Plan for 2024-2025",
+                f"#/skater/{skaters[i].id}?tab=yearly",
+                False,
+            )
+            for i in range(4)
+        ]
+        + [
+            (f"Skater {i:02}", "Unplanned Week", f"#/skater/{skaters[i].id}?tab=weekly", False)
+            for i in range(4, 8)
+        ]
+        + [
+            ("Pair", "No Team Plan", f"#/team/{team.id}?tab=yearly", True),
+            ("Nexxice", "Unplanned Week", f"#/synchro/{synchro.id}?tab=weekly", False),
+        ]
+    )
+
+
+@pytest.mark.django_db
+def test_planning_alerts_without_entities(user_factory, django_assert_num_queries):
+    coach = user_factory(email="empty@example.com", full_name="Empty", role="COACH")
+    collect_planning_alerts(coach, [], [], [])
+    with django_assert_num_queries(0):
+        assert collect_planning_alerts(coach, [], [], []) == []
@@ -0,0 +1,71 @@
+import pytest
+from datetime import date
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from api.models import (
+    Skater,
+    SinglesEntity,
+    SoloDanceEntity,
+    Team,
+    SynchroTeam,
+    PlanningEntityAccess,
+    User,
+)
+
+
+@pytest.fixture
+def coach(user_factory):
+    return user_factory(email="coach@example.com", full_name="Coach", role="COACH")
+
+
+def add_skaters(coach, user_factory, start, count):
+    synchro = SynchroTeam.objects.create(team_name=f"Synchro {start}", level="Senior")
+    PlanningEntityAccess.objects.create(user=coach, access_level="COACH", planning_entity=synchro)
+    for i in range(start, start + count):
+        skater = Skater.objects.create(full_name=f"Skater {i:02}", date_of_birth=date(2010, 1, 1))
+        partner = Skater.objects.create(full_name=f"Partner {i:02}", date_of_birth=date(2010, 1, 1))
+        SinglesEntity.objects.create(skater=skater)
+        SoloDanceEntity.objects.create(skater=skater)
+        team = Team.objects.create(
+            team_name=f"Team {i:02}", discipline="PAIRS", partner_a=skater, partner_b=partner
+        )
+        synchro.roster.add(skater)
+        PlanningEntityAccess.objects.create(
+            user=coach, access_level="COACH", planning_entity=skater
+        )
+        PlanningEntityAccess.objects.create(user=coach, access_level="COACH", planning_entity=team)
+        observer = user_factory(
+            email=f"observer{i}@example.com", full_name=f"Obs {i}", role="COACH"
+        )
+        PlanningEntityAccess.objects.create(
+            user=observer, access_level="OBSERVER", planning_entity=team
+        )
+
+
+def roster_queries(api_client, coach):
+    # A fresh user per request, as in production (the access index is memoized on it)
+    api_client.force_authenticate(User.objects.get(pk=coach.pk))
+    with CaptureQueriesContext(connection) as ctx:
+        response = api_client.get("/api/roster/")
+    assert response.status_code == 200
+    return response.json(), len(ctx.captured_queries)
+
+
+@pytest.mark.django_db
+def test_roster_query_count_stays_flat(api_client, coach, user_factory):
+    add_skaters(coach, user_factory, 0, 2)
+    small, small_queries = roster_queries(api_client, coach)
+
+    add_skaters(coach, user_factory, 2, 6)
+    large, large_queries = roster_queries(api_client, coach)
+
+    assert len(large) == 16
+    assert large_queries == small_queries
+
+    skater = next(s for s in large if s["full_name"] == "Skater 03")
+    entities = {e["type"]: e for e in skater["planning_entities"]}
+    assert set(entities) == {"SinglesEntity", "SoloDanceEntity", "Team", "SynchroTeam"}
+    assert entities["Team"]["partner_b_details"]["full_name"] == "Partner 03"
+    assert [o["full_name"] for o in entities["Team"]["observers"]] == ["Obs 3"]
+    assert [c["full_name"] for c in entities["Team"]["collaborators"]] == ["Coach"]
+    assert len(entities["SynchroTeam"]["roster"]) == 6
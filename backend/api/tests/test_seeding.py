@@ -0,0 +1,91 @@
+import pytest
+from io import StringIO
+from datetime import date
+from django.core.management import call_command
+from django.db import transaction
+from api.models import (
+    Organization,
+    OrganizationMembership,
+    PlanningEntityAccess,
+    AthleteSeason,
+    WeeklyPlan,
+    PlannedSession,
+    SessionLog,
+    CompetitionResult,
+    Skater,
+)
+from api.seeding import seed_synthetic_club
+
+TODAY = date(2025, 3, 12)
+
+
+def snapshot(**kwargs):
+    """Seeds a club, captures its content (without ids) and rolls it back."""
+    with transaction.atomic():
+        club = seed_synthetic_club(today=TODAY, **kwargs)
+        logs = list(
+            SessionLog.objects.order_by("id").values_list(
+                "session_date", "session_type", "session_rating", "element_attempts"
+            )
+        )
+        runs = [
+            [{k: v for k, v in run.items() if k != "program_id"} for run in runs]
+            for runs in SessionLog.objects.order_by("id").values_list("program_runs", flat=True)
+        ]
+        results = list(
+            CompetitionResult.objects.order_by("id").values_list(
+                "total_score", "segment_scores", "detailed_protocol"
+            )
+        )
+        names = list(Skater.objects.order_by("id").values_list("full_name", flat=True))
+        data = (club.counts, logs, runs, results, names)
+        transaction.set_rollback(True)
+    return data
+
+
+@pytest.mark.django_db
+def test_seeding_is_deterministic_across_batch_sizes():
+    first = snapshot(skaters=12, seasons=1, sessions_per_week=2, seed=3, batch_size=7)
+    second = snapshot(skaters=12, seasons=1, sessions_per_week=2, seed=3, batch_size=500)
+    assert first == second
+    assert snapshot(skaters=12, seasons=1, sessions_per_week=2, seed=4)[1] != first[1]
+
+
+@pytest.mark.django_db
+def test_seeded_club_shape():
+    club = seed_synthetic_club(
+        skaters=20, assistant_coaches=2, seasons=2, sessions_per_week=3, today=TODAY
+    )
+
+    assert OrganizationMembership.objects.filter(organization=club.organization).count() == 3
+    assert len(club.teams) == 2 and len(club.synchro_teams) == 1
+    assert club.synchro_teams[0].roster.count() == 16
+
+    # Skaters are shared between the coaches
+    coach_levels = PlanningEntityAccess.objects.filter(access_level="COACH")
+    assert coach_levels.values("user").distinct().count() == 3
+    assert PlanningEntityAccess.objects.filter(access_level="GUARDIAN").exists()
+    assert PlanningEntityAccess.objects.filter(access_level="OBSERVER").count() == 2
+
+    # Every week of both seasons is planned; logs stop at today
+    season = AthleteSeason.objects.filter(skater=club.skaters[0], is_active=False).get()
+    assert WeeklyPlan.objects.filter(athlete_season=season).count() == 53
+    assert PlannedSession.objects.filter(weekly_plan__athlete_season=season).count() == 159
+    assert not SessionLog.objects.filter(session_date__gt=TODAY).exists()
+
+    run = SessionLog.objects.exclude(program_runs=[]).first().program_runs[0]
+    assert {"program_id", "run_type", "elements", "total_score"} <= set(run)
+    result = CompetitionResult.objects.first()
+    assert result.detailed_protocol[0].keys() >= {"name", "base_value", "goe", "score"}
+    assert float(result.total_score) == pytest.approx(
+        sum(segment["score"] for segment in result.segment_scores)
+    )
+
+
+@pytest.mark.django_db
+def test_seed_command_builds_several_clubs():
+    out = StringIO()
+    call_command("seed_synthetic_club", clubs=2, skaters=12, seasons=1, stdout=out)
+    assert "Seeded 2 club(s)" in out.getvalue()
+    assert Organization.objects.count() == 2
+    assert Skater.objects.count() == 24
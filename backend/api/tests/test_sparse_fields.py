@@ -0,0 +1,71 @@
+import pytest
+from datetime import date
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from api.models import Skater, Team, SynchroTeam, PlanningEntityAccess
+
+
+@pytest.fixture
+def coach_setup(api_client, user_factory):
+    coach = user_factory(email="coach@example.com", full_name="Coach", role="COACH")
+    skater = Skater.objects.create(full_name="Alex", date_of_birth=date(2010, 1, 1))
+    partner = Skater.objects.create(full_name="Sam", date_of_birth=date(2010, 1, 1))
+    team = Team.objects.create(
+        team_name="Alex/Sam", discipline="PAIRS", partner_a=skater, partner_b=partner
+    )
+    synchro = SynchroTeam.objects.create(team_name="Nexxice", level="Senior")
+    synchro.roster.add(skater)
+    for entity in (skater, team, synchro):
+        PlanningEntityAccess.objects.create(
+            user=coach, access_level="COACH", planning_entity=entity
+        )
+    api_client.force_authenticate(coach)
+    return skater, team, synchro
+
+
+def get(api_client, url):
+    with CaptureQueriesContext(connection) as ctx:
+        response = api_client.get(url)
+    assert response.status_code == 200
+    return response.json(), " ".join(q["sql"] for q in ctx.captured_queries)
+
+
+@pytest.mark.django_db
+def test_bare_expand_skips_heavy_fields(api_client, coach_setup):
+    skater, team, synchro = coach_setup
+
+    full, _ = get(api_client, f"/api/skaters/{skater.id}/")
+    lean, sql = get(api_client, f"/api/skaters/{skater.id}/?expand=")
+
+    assert {"planning_entities", "guardians", "observers", "synchro_teams"} <= set(full)
+    assert set(full) - set(lean) == {
+        "planning_entities",
+        "synchro_teams",
+        "guardians",
+        "collaborators",
+        "observers",
+    }
+    # has_guardian still needs the skater's own access rows, but nothing else
+    assert lean["has_guardian"] is False
+    assert sql.count('"api_planningentityaccess" INNER JOIN "api_user"') == 1
+    assert 'FROM "api_team"' not in sql and 'FROM "api_synchroteam"' not in sql
+
+    expanded, _ = get(api_client, f"/api/skaters/{skater.id}/?expand=guardians")
+    assert "guardians" in expanded and "observers" not in expanded
+
+
+@pytest.mark.django_db
+def test_fields_trim_only_the_top_level(api_client, coach_setup):
+    skater, team, synchro = coach_setup
+
+    data, _ = get(api_client, f"/api/skaters/{skater.id}/?fields=id,planning_entities")
+    assert set(data) == {"id", "planning_entities"}
+    nested_team = next(e for e in data["planning_entities"] if e["type"] == "Team")
+    assert "partner_a_details" in nested_team and "collaborators" in nested_team
+
+    data, _ = get(api_client, f"/api/synchro/{synchro.id}/?expand=roster")
+    assert [s["full_name"] for s in data["roster"]] == ["Alex"]
+    assert "collaborators" not in data and "observers" not in data
+
+    data, _ = get(api_client, f"/api/teams/{team.id}/?fields=id,team_name")
+    assert data == {"id": team.id, "team_name": "Alex/Sam"}
@@ -0,0 +1,58 @@
+import pytest
+from datetime import date
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from api.models import Skater, Team, SynchroTeam, PlanningEntityAccess
+
+
+@pytest.mark.django_db
+def test_skater_detail_staff_comes_from_one_lookup(api_client, user_factory):
+    coach = user_factory(email="coach@example.com", full_name="Coach", role="COACH")
+    parent = user_factory(email="parent@example.com", full_name="Parent", role="GUARDIAN")
+    helper = user_factory(email="helper@example.com", full_name="Helper", role="COACH")
+    viewer = user_factory(email="viewer@example.com", full_name="Viewer", role="COACH")
+
+    skater = Skater.objects.create(full_name="Alex", date_of_birth=date(2010, 1, 1))
+    partner = Skater.objects.create(full_name="Sam", date_of_birth=date(2010, 1, 1))
+    team = Team.objects.create(
+        team_name="Alex/Sam", discipline="PAIRS", partner_a=skater, partner_b=partner
+    )
+    synchro = SynchroTeam.objects.create(team_name="Nexxice", level="Senior")
+    synchro.roster.add(skater)
+    for entity in (skater, team, synchro):
+        PlanningEntityAccess.objects.create(
+            user=coach, access_level="COACH", planning_entity=entity
+        )
+    PlanningEntityAccess.objects.create(
+        user=parent, access_level="GUARDIAN", planning_entity=skater
+    )
+    PlanningEntityAccess.objects.create(
+        user=helper, access_level="COLLABORATOR", planning_entity=skater
+    )
+    PlanningEntityAccess.objects.create(user=viewer, access_level="VIEWER", planning_entity=skater)
+    PlanningEntityAccess.objects.create(user=viewer, access_level="OBSERVER", planning_entity=team)
+
+    api_client.force_authenticate(coach)
+    with CaptureQueriesContext(connection) as ctx:
+        data = api_client.get(f"/api/skaters/{skater.id}/").json()
+
+    staff_queries = [
+        q for q in ctx.captured_queries if 'FROM "api_planningentityaccess" INNER JOIN' in q["sql"]
+    ]
+    assert len(staff_queries) == 1
+
+    assert [g["full_name"] for g in data["guardians"]] == ["Parent"]
+    assert data["has_guardian"] is True
+    assert [c["full_name"] for c in data["collaborators"]] == ["Coach", "Helper"]
+    assert data["observers"] == [
+        {
+            "id": data["observers"][0]["id"],
+            "user_id": viewer.pk,
+            "full_name": "Viewer",
+            "email": "viewer@example.com",
+            "role": "Observer",
+        }
+    ]
+    entities = {e["type"]: e for e in data["planning_entities"]}
+    assert [o["role"] for o in entities["Team"]["observers"]] == ["OBSERVER"]
+    assert [c["full_name"] for c in entities["SynchroTeam"]["collaborators"]] == ["Coach"]
@@ -0,0 +1,122 @@
+import pytest
+from datetime import date
+from api.models import (
+    Skater,
+    SinglesEntity,
+    Team,
+    SynchroTeam,
+    Competition,
+    CompetitionResult,
+    PlanningEntityAccess,
+)
+from api.services import ResultColumns, compute_stats, build_performance_summaries
+
+TODAY = date(2025, 1, 15)
+
+
+def segments(sp, fs):
+    return [
+        {"name": "Short", "score": sp[0], "tes": sp[1], "pcs": sp[2]},
+        {"name": "Free", "score": fs[0], "tes": fs[1], "pcs": fs[2]},
+    ]
+
+
+def test_compute_stats_matches_running_max():
+    frame = ResultColumns()
+    frame.append(
+        1, "Last Season", date(2024, 2, 1), "150.00", "60", segments((50, 25, 25), (100, 55, 45))
+    )
+    frame.append(
+        2, "Fall Classic", date(2024, 9, 1), "140.00", None, segments((55, 30, 25), (85, 40, 45))
+    )
+    frame.append(3, "Tie", date(2024, 10, 1), "140.00", None, "not a list")
+    stats = compute_stats(frame, today=TODAY)
+
+    assert stats["overall"]["pb"] == {
+        "score": 150.0,
+        "comp": "Last Season",
+        "date": date(2024, 2, 1),
+    }
+    # Ties keep the earliest result
+    assert stats["overall"]["sb"]["comp"] == "Fall Classic"
+    assert list(stats["segments"]) == ["Short", "Free"]
+    short = stats["segments"]["Short"]
+    assert short["total"]["pb"]["comp"] == "Fall Classic"
+    assert short["pcs"]["pb"]["comp"] == "Last Season"
+    assert stats["segments"]["Free"]["tes"]["sb"]["score"] == 40.0
+    assert stats["history"][0] == {
+        "date": date(2024, 2, 1),
+        "name": "Last Season",
+        "total_score": 150.0,
+        "tes": 80.0,
+        "planned_bv": 60.0,
+        "pcs_approx": 70.0,
+    }
+    assert stats["history"][2]["tes"] == 0.0
+
+
+def test_compute_stats_empty():
+    stats = compute_stats(ResultColumns(), today=TODAY)
+    assert stats["overall"]["pb"] == {"score": 0.0, "comp": "N/A", "date": None}
+    assert stats["segments"] == {} and stats["history"] == []
+
+
+@pytest.mark.django_db
+def test_skater_stats_in_fixed_queries(django_assert_num_queries):
+    comp = Competition.objects.create(
+        title="Sectionals",
+        city="Ottawa",
+        province_state="ON",
+        start_date=date(2024, 11, 1),
+        end_date=date(2024, 11, 2),
+    )
+    skaters = []
+    for i in range(6):
+        skater = Skater.objects.create(full_name=f"Skater {i}", date_of_birth=date(2010, 1, 1))
+        entity = SinglesEntity.objects.create(skater=skater)
+        CompetitionResult.objects.create(
+            competition=comp, planning_entity=entity, level="Junior", total_score=100 + i
+        )
+        skaters.append(skater)
+    team = Team.objects.create(
+        team_name="Pair", discipline="PAIRS", partner_a=skaters[0], partner_b=skaters[1]
+    )
+    CompetitionResult.objects.create(
+        competition=comp, planning_entity=team, level="Junior", total_score=120
+    )
+    # Same object id as a singles entity, but a different content type
+    synchro = SynchroTeam.objects.create(team_name="Nexxice", level="Senior")
+    clash_id = skaters[0].singles_entities.get().id
+    SynchroTeam.objects.filter(id=synchro.id).update(id=clash_id)
+    CompetitionResult.objects.create(
+        competition=comp,
+        planning_entity=SynchroTeam.objects.get(id=clash_id),
+        level="Senior",
+        total_score=200,
+    )
+
+    with django_assert_num_queries(9):
+        stats = build_performance_summaries(Skater, [s.id for s in skaters], today=TODAY)
+
+    assert [h["total_score"] for h in stats[skaters[0].id].history] == [100.0, 120.0]
+    assert stats[skaters[1].id].overall["pb"]["score"] == 120.0
+    assert stats[skaters[5].id].overall["sb"]["score"] == 105.0
+    assert stats[skaters[5].id].season_name == "Current"
+
+
+@pytest.mark.django_db
+def test_roster_stats_endpoint(api_client, user_factory):
+    coach = user_factory(email="coach@example.com", full_name="Coach", role="COACH")
+    skater = Skater.objects.create(full_name="Alex", date_of_birth=date(2010, 1, 1))
+    PlanningEntityAccess.objects.create(user=coach, access_level="COACH", planning_entity=skater)
+    synchro = SynchroTeam.objects.create(team_name="Nexxice", level="Senior")
+    PlanningEntityAccess.objects.create(user=coach, access_level="COACH", planning_entity=synchro)
+
+    api_client.force_authenticate(coach)
+    response = api_client.get("/api/dashboard/roster-stats/")
+    assert response.status_code == 200
+    data = response.json()
+    assert list(data["skaters"]) == [str(skater.id)]
+    assert list(data["synchro_teams"]) == [str(synchro.id)]
+    assert data["teams"] == {}
+    assert data["skaters"][str(skater.id)]["volume"] == 0
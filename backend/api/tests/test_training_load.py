@@ -0,0 +1,185 @@
+import pytest
+from io import StringIO
+from datetime import date, timedelta
+from django.core import serializers
+from django.core.management import call_command
+from api.models import (
+    Skater,
+    SinglesEntity,
+    AthleteSeason,
+    WeeklyPlan,
+    PlannedSession,
+    SessionLog,
+    DailyTrainingLoad,
+    PlanningEntityAccess,
+)
+from api.services import load_curve
+
+MONDAY = date(2025, 10, 6)
+
+
+@pytest.fixture
+def coach_skaters(user_factory):
+    coach = user_factory(email="coach@example.com", full_name="Coach", role="COACH")
+    skaters = []
+    for name in ("Alex", "Blair"):
+        skater = Skater.objects.create(full_name=name, date_of_birth=date(2010, 1, 1))
+        PlanningEntityAccess.objects.create(
+            user=coach, access_level="COACH", planning_entity=skater
+        )
+        singles = SinglesEntity.objects.create(skater=skater)
+        season = AthleteSeason.objects.create(skater=skater, season="2025-2026")
+        skaters.append((skater, singles, season))
+    return coach, skaters
+
+
+def log(singles, season, day, rating=3, session_type="ON_ICE"):
+    return SessionLog.objects.create(
+        athlete_season=season,
+        planning_entity=singles,
+        session_date=day,
+        session_rating=rating,
+        session_type=session_type,
+    )
+
+
+def loads():
+    return list(
+        DailyTrainingLoad.objects.order_by("date").values_list(
+            "date", "sessions", "minutes", "load"
+        )
+    )
+
+
+@pytest.mark.django_db
+def test_daily_load_follows_logs(coach_skaters):
+    coach, [(skater, singles, season), _] = coach_skaters
+    week = WeeklyPlan.objects.create(athlete_season=season, week_start=MONDAY)
+    PlannedSession.objects.create(
+        weekly_plan=week, day_of_week="MONDAY", planned_duration=45, session_type="OFF_ICE"
+    )
+    PlannedSession.objects.create(
+        weekly_plan=week, day_of_week="MONDAY", planned_duration=90, session_type="ON_ICE"
+    )
+
+    # Each log takes the duration of the session planned for its type, then 60 minutes
+    first = log(singles, season, MONDAY, rating=4)
+    assert loads() == [(MONDAY, 1, 90, 90 * 8)]
+    log(singles, season, MONDAY, rating=2, session_type="OFF_ICE")
+    log(singles, season, MONDAY, rating=5, session_type="CLASS")
+    assert loads() == [(MONDAY, 3, 195, 90 * 8 + 45 * 4 + 60 * 10)]
+
+    # Moving a log moves its load; the class then stands for the free on-ice slot
+    first.session_date = MONDAY + timedelta(days=1)
+    first.save()
+    assert loads() == [
+        (MONDAY, 2, 135, 45 * 4 + 90 * 10),
+        (MONDAY + timedelta(days=1), 1, 60, 60 * 8),
+    ]
+
+    first.delete()
+    assert loads() == [(MONDAY, 2, 135, 45 * 4 + 90 * 10)]
+
+
+@pytest.mark.django_db
+def test_daily_load_follows_planned_sessions(coach_skaters):
+    coach, [(skater, singles, season), _] = coach_skaters
+    log(singles, season, MONDAY, rating=4)
+    assert loads() == [(MONDAY, 1, 60, 60 * 8)]
+
+    week = WeeklyPlan.objects.create(athlete_season=season, week_start=MONDAY)
+    planned = PlannedSession.objects.create(
+        weekly_plan=week, day_of_week="MONDAY", planned_duration=90, session_type="ON_ICE"
+    )
+    assert loads() == [(MONDAY, 1, 90, 90 * 8)]
+
+    planned.planned_duration = 120
+    planned.save()
+    assert loads() == [(MONDAY, 1, 120, 120 * 8)]
+
+    # Moving the session (or its whole week) off the log's day drops it back to the default
+    planned.day_of_week = "TUESDAY"
+    planned.save()
+    assert loads() == [(MONDAY, 1, 60, 60 * 8)]
+    planned.day_of_week = "MONDAY"
+    planned.save()
+    week.week_start = MONDAY + timedelta(days=7)
+    week.save()
+    assert loads() == [(MONDAY, 1, 60, 60 * 8)]
+    week.week_start = MONDAY
+    week.save()
+    assert loads() == [(MONDAY, 1, 120, 120 * 8)]
+
+    week.delete()
+    assert loads() == [(MONDAY, 1, 60, 60 * 8)]
+
+
+def test_load_curve_metrics():
+    start = date(2025, 10, 1)
+    steady = {start - timedelta(days=n): 300 for n in range(28)}
+    (day,) = load_curve(steady, start, start)
+    assert (day["acute"], day["chronic"], day["acwr"]) == (2100, 2100.0, 1.0)
+    assert day["monotony"] is None and day["strain"] is None
+
+    # Three weeks off, then a hard week
+    spike = {start - timedelta(days=n): 600 if n % 7 else 0 for n in range(7)}
+    (day,) = load_curve(spike, start, start)
+    assert (day["acute"], day["chronic"], day["acwr"]) == (3600, 900.0, 4.0)
+    assert day["monotony"] == 2.45 and day["strain"] == 8818
+
+
+@pytest.mark.django_db
+def test_roster_load_endpoint(api_client, coach_skaters, django_assert_max_num_queries):
+    coach, [(alex, alex_singles, alex_season), (blair, blair_singles, blair_season)] = coach_skaters
+    end = MONDAY + timedelta(days=27)
+    for n in range(28):
+        log(alex_singles, alex_season, MONDAY + timedelta(days=n), rating=3)
+    for n in range(21, 28):
+        log(blair_singles, blair_season, MONDAY + timedelta(days=n), rating=5)
+
+    api_client.force_authenticate(coach)
+    with django_assert_max_num_queries(6):
+        response = api_client.get("/api/dashboard/roster-load/", {"end": end, "days": 7})
+    assert response.status_code == 200
+    first, second = response.data["skaters"]
+    assert first["full_name"] == "Blair" and first["latest"]["flag"] == "overload"
+    assert first["latest"]["acwr"] == 4.0
+    assert second["full_name"] == "Alex" and second["latest"]["flag"] == "ok"
+    assert second["curve"]["load"] == [360] * 7
+    # Alex's chronic load catches up with the acute load over the last week
+    assert second["curve"]["acwr"] == [1.27, 1.22, 1.17, 1.12, 1.08, 1.04, 1.0]
+
+
+@pytest.mark.django_db
+def test_fixture_loading_leaves_loads_to_the_rebuild(coach_skaters):
+    coach, [(skater, singles, season), _] = coach_skaters
+    week = WeeklyPlan.objects.create(athlete_season=season, week_start=MONDAY)
+    PlannedSession.objects.create(
+        weekly_plan=week, day_of_week="MONDAY", planned_duration=90, session_type="ON_ICE"
+    )
+    log(singles, season, MONDAY)
+    fixture = serializers.serialize(
+        "json", [*SessionLog.objects.all(), *PlannedSession.objects.all(), week]
+    )
+    week.delete()
+    SessionLog.objects.all().delete()
+    assert loads() == []
+
+    for obj in serializers.deserialize("json", fixture):
+        obj.save()
+    assert loads() == []
+
+    call_command("rebuild_training_load", stdout=StringIO())
+    assert loads() == [(MONDAY, 1, 90, 90 * 6)]
+
+
+@pytest.mark.django_db
+def test_rebuild_command(coach_skaters):
+    coach, [(skater, singles, season), _] = coach_skaters
+    log(singles, season, MONDAY)
+    DailyTrainingLoad.objects.all().delete()
+
+    out = StringIO()
+    call_command("rebuild_training_load", stdout=out)
+    assert "1 days for 2 skaters" in out.getvalue()
+    assert loads() == [(MONDAY, 1, 60, 360)]
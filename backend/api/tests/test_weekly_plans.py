@@ -0,0 +1,95 @@
+import pytest
+from datetime import date, timedelta
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from api.models import (
+    Skater,
+    SinglesEntity,
+    Team,
+    AthleteSeason,
+    YearlyPlan,
+    WeeklyPlan,
+    PlanningEntityAccess,
+)
+
+MONDAY = date(2025, 1, 13)
+
+
+@pytest.fixture
+def skater_setup(user_factory):
+    coach = user_factory(email="coach@example.com", full_name="Coach", role="COACH")
+    skater = Skater.objects.create(full_name="Alex Skater", date_of_birth=date(2010, 1, 1))
+    partner = Skater.objects.create(full_name="Sam Partner", date_of_birth=date(2010, 1, 1))
+    PlanningEntityAccess.objects.create(user=coach, access_level="COACH", planning_entity=skater)
+    singles = SinglesEntity.objects.create(skater=skater)
+    season = AthleteSeason.objects.create(skater=skater, season="2024-2025")
+    plan = YearlyPlan.objects.create(coach_owner=coach, planning_entity=singles)
+    plan.athlete_seasons.add(season)
+
+    team = Team.objects.create(
+        team_name="Alex/Sam", discipline="PAIRS", partner_a=skater, partner_b=partner
+    )
+    team_season = AthleteSeason.objects.create(planning_entity=team, season="2024-2025")
+    WeeklyPlan.objects.create(athlete_season=season, week_start=MONDAY, theme="Edges")
+    return coach, skater, season, team_season
+
+
+@pytest.mark.django_db
+def test_week_view_does_not_write(api_client, skater_setup):
+    coach, skater, season, team_season = skater_setup
+    api_client.force_authenticate(coach)
+
+    next_week = MONDAY + timedelta(weeks=1)
+    response = api_client.get(f"/api/skaters/{skater.id}/week-view/?date={next_week}")
+    assert response.status_code == 200
+    plans = response.json()["plans"]
+    assert {p["season_id"] for p in plans} == {season.id, team_season.id}
+    assert all(p["plan_data"]["id"] is None for p in plans)
+    assert {p["label"] for p in plans} == {"Alex Skater (Singles)", "Alex/Sam"}
+    assert WeeklyPlan.objects.count() == 1
+
+
+@pytest.mark.django_db
+def test_week_range_query_count_is_independent_of_weeks(api_client, skater_setup):
+    coach, skater, season, team_season = skater_setup
+    api_client.force_authenticate(coach)
+
+    def fetch(weeks):
+        with CaptureQueriesContext(connection) as ctx:
+            response = api_client.get(
+                f"/api/skaters/{skater.id}/week-range/?start={MONDAY}&weeks={weeks}"
+            )
+        return response.json()["weeks"], len(ctx.captured_queries)
+
+    fetch(1)
+    one_week, one_week_queries = fetch(1)
+    many_weeks, many_weeks_queries = fetch(8)
+    assert one_week_queries == many_weeks_queries
+    assert [w["week_start"] for w in many_weeks] == [
+        str(MONDAY + timedelta(weeks=i)) for i in range(8)
+    ]
+    first = {p["season_id"]: p["plan_data"] for p in many_weeks[0]["plans"]}
+    assert first[season.id]["theme"] == "Edges"
+    assert first[team_season.id]["id"] is None
+    assert WeeklyPlan.objects.count() == 1
+
+
+@pytest.mark.django_db
+def test_first_edit_creates_the_week(api_client, skater_setup):
+    coach, skater, season, team_season = skater_setup
+    api_client.force_authenticate(coach)
+    next_week = MONDAY + timedelta(weeks=1)
+
+    response = api_client.post(
+        f"/api/seasons/{season.id}/weeks/",
+        {"week_start": str(next_week), "theme": "Spins"},
+        format="json",
+    )
+    assert response.status_code == 201
+    response = api_client.post(
+        f"/api/seasons/{season.id}/weeks/",
+        {"week_start": str(next_week), "theme": "Jumps"},
+        format="json",
+    )
+    assert response.status_code == 200
+    assert WeeklyPlan.objects.get(athlete_season=season, week_start=next_week).theme == "Jumps"
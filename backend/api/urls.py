@@ -44,7 +44,17 @@ urlpatterns = [
     path("skaters/<int:skater_id>/programs/", views.ProgramListCreateView.as_view()),
     path("programs/<int:pk>/", views.ProgramDetailView.as_view()),
     path("skaters/<int:skater_id>/stats/", views.SkaterStatsView.as_view()),
+    path(
+        "skaters/<int:skater_id>/element-stats/", views.SkaterElementStatsView.as_view()
+    ),
+    path(
+        "skaters/<int:skater_id>/element-consistency/",
+        views.SkaterElementConsistencyView.as_view(),
+    ),
     path("dashboard/stats/", views.CoachDashboardStatsView.as_view()),
+    path("dashboard/roster-stats/", views.RosterStatsView.as_view()),
+    path("dashboard/roster-load/", views.RosterLoadView.as_view()),
+    path("dashboard/compliance/", views.RosterComplianceView.as_view()),
     path("elements/", views.SkatingElementList.as_view()),
     # Team URLs
     path("teams/", views.TeamListView.as_view()),
@@ -52,17 +62,20 @@ urlpatterns = [
     path("teams/<int:pk>/", views.TeamDetailView.as_view()),
     path("teams/<int:team_id>/ytps/", views.TeamYearlyPlanListCreateView.as_view()),
     path("skaters/<int:skater_id>/week-view/", views.MasterWeeklyPlanView.as_view()),
+    path("skaters/<int:skater_id>/week-range/", views.MasterWeeklyRangeView.as_view()),
     path("teams/<int:team_id>/goals/", views.GoalListByTeamView.as_view()),
     path(
         "teams/<int:team_id>/results/", views.CompetitionResultListByTeamView.as_view()
     ),
     path("teams/<int:team_id>/stats/", views.TeamStatsView.as_view()),
+    path("teams/<int:team_id>/compliance/", views.TeamComplianceView.as_view()),
     path("teams/<int:team_id>/programs/", views.ProgramListCreateByTeamView.as_view()),
     path("teams/<int:team_id>/logs/", views.SessionLogListCreateByTeamView.as_view()),
     path(
         "teams/<int:team_id>/injuries/", views.InjuryLogListCreateByTeamView.as_view()
     ),
     path("teams/<int:team_id>/week-view/", views.TeamMasterWeeklyPlanView.as_view()),
+    path("teams/<int:team_id>/week-range/", views.TeamMasterWeeklyRangeView.as_view()),
     # Synchro URLs
     path("synchro/create/", views.CreateSynchroTeamView.as_view()),
     path("synchro/<int:pk>/", views.SynchroTeamDetailView.as_view()),
@@ -81,11 +94,16 @@ urlpatterns = [
     path(
         "synchro/<int:team_id>/logs/", views.SynchroSessionLogListCreateView.as_view()
     ),
+    path(
+        "synchro/<int:team_id>/logs/bulk/",
+        views.SynchroSessionLogBulkCreateView.as_view(),
+    ),
     path(
         "synchro/<int:team_id>/results/",
         views.SynchroCompetitionResultListCreateView.as_view(),
     ),
     path("synchro/<int:team_id>/stats/", views.SynchroStatsView.as_view()),
+    path("synchro/<int:team_id>/compliance/", views.TeamComplianceView.as_view()),
     # Assets
     path("programs/<int:program_id>/assets/", views.ProgramAssetCreateView.as_view()),
     path("assets/<int:pk>/", views.ProgramAssetDestroyView.as_view()),
@@ -117,9 +135,13 @@ urlpatterns = [
         views.GapAnalysisRetrieveUpdateView.as_view(),
     ),
     path("synchro/<int:team_id>/week-view/", views.TeamMasterWeeklyPlanView.as_view()),
+    path("synchro/<int:team_id>/week-range/", views.TeamMasterWeeklyRangeView.as_view()),
     # Invites
     path("invitations/send/", views.SendInviteView.as_view()),
+    path("invitations/status/", views.InvitationStatusView.as_view()),
     path("invitations/accept/<str:token>/", views.AcceptInviteView.as_view()),
     path("access/<int:pk>/revoke/", views.RevokeAccessView.as_view()),
     path("skaters/<int:skater_id>/unlink-user/", views.UnlinkAthleteView.as_view()),
+    # Diagnostics
+    path("admin/instrumentation/", views.InstrumentationStatsView.as_view()),
 ]
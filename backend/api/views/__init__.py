@@ -4,6 +4,7 @@ from .core import (
     SkatingElementList,
     RevokeAccessView,
     UnlinkAthleteView,
+    InstrumentationStatsView,
 )
 from .skaters import (
     CreateSkaterView,
@@ -31,7 +32,9 @@ from .planning import (
     WeeklyPlanListView,
     WeeklyPlanDetailView,
     MasterWeeklyPlanView,
+    MasterWeeklyRangeView,
     TeamMasterWeeklyPlanView,
+    TeamMasterWeeklyRangeView,
     GoalListCreateByPlanView,
     GoalListBySkaterView,
     GoalListByTeamView,
@@ -44,6 +47,7 @@ from .logs import (
     SessionLogDetailView,
     SessionLogListCreateByTeamView,
     SynchroSessionLogListCreateView,
+    SynchroSessionLogBulkCreateView,
     InjuryLogListCreateView,
     InjuryLogDetailView,
     InjuryLogListCreateByTeamView,
@@ -69,6 +73,12 @@ from .dashboard import (
     SkaterStatsView,
     TeamStatsView,
     SynchroStatsView,
+    RosterStatsView,
+    SkaterElementStatsView,
+    SkaterElementConsistencyView,
+    RosterLoadView,
+    RosterComplianceView,
+    TeamComplianceView,
 )
 
 from .logistics import (
@@ -81,4 +91,4 @@ from .logistics import (
     HousingDetailView,
 )
 
-from .invitations import SendInviteView, AcceptInviteView
+from .invitations import SendInviteView, AcceptInviteView, InvitationStatusView
@@ -1,7 +1,6 @@
 from rest_framework import generics, permissions, status
 from rest_framework.response import Response
 from rest_framework.exceptions import ValidationError, PermissionDenied
-from django.contrib.contenttypes.models import ContentType
 from django.db.models import Q
 from datetime import date
 
@@ -25,12 +24,13 @@ from api.serializers import (
     ProgramAssetSerializer,
 )
 from api.permissions import IsCoachUser, IsCoachOrOwner
-from api.services import get_access_role
+from api.services import get_access_role, get_content_type
 
 
 class CompetitionListCreateView(generics.ListCreateAPIView):
     permission_classes = [permissions.IsAuthenticated]
     serializer_class = CompetitionSerializer
+    cursor_ordering = ("-start_date", "-id")
 
     def get_queryset(self):
         queryset = Competition.objects.all().order_by("-start_date")
@@ -84,6 +84,7 @@ class CompetitionListCreateView(generics.ListCreateAPIView):
 class CompetitionResultListCreateView(generics.ListCreateAPIView):
     permission_classes = [permissions.IsAuthenticated, IsCoachOrOwner]
     serializer_class = CompetitionResultSerializer
+    cursor_ordering = ("-competition__start_date", "-id")
 
     def get_queryset(self):
         skater_id = self.kwargs["skater_id"]
@@ -136,7 +137,7 @@ class CompetitionResultListCreateView(generics.ListCreateAPIView):
         if not entity:
             raise ValidationError("No active discipline found.")
 
-        content_type = ContentType.objects.get_for_model(entity)
+        content_type = get_content_type(entity)
         serializer.save(content_type=content_type, object_id=entity.id)
 
 
@@ -178,6 +179,7 @@ class SkaterTestDetailView(generics.RetrieveUpdateDestroyAPIView):
 class ProgramListCreateView(generics.ListCreateAPIView):
     permission_classes = [permissions.IsAuthenticated, IsCoachOrOwner]
     serializer_class = ProgramSerializer
+    cursor_ordering = ("-season", "-id")
 
     def get_queryset(self):
         skater_id = self.kwargs["skater_id"]
@@ -214,7 +216,7 @@ class ProgramListCreateView(generics.ListCreateAPIView):
             entity_id = skater.singles_entities.first().id
             model_class = SinglesEntity
 
-        content_type = ContentType.objects.get_for_model(model_class)
+        content_type = get_content_type(model_class)
         serializer.save(content_type=content_type, object_id=entity_id)
 
 
@@ -227,6 +229,7 @@ class ProgramDetailView(generics.RetrieveUpdateDestroyAPIView):
 class CompetitionResultListByTeamView(generics.ListCreateAPIView):
     permission_classes = [permissions.IsAuthenticated, IsCoachUser]
     serializer_class = CompetitionResultSerializer
+    cursor_ordering = ("-competition__start_date", "-id")
 
     def get_queryset(self):
         team_id = self.kwargs["team_id"]
@@ -235,7 +238,7 @@ class CompetitionResultListByTeamView(generics.ListCreateAPIView):
         if not get_access_role(self.request.user, team):
             return CompetitionResult.objects.none()
 
-        ct = ContentType.objects.get_for_model(Team)
+        ct = get_content_type(Team)
         return CompetitionResult.objects.filter(
             content_type=ct, object_id=team_id
         ).order_by("-competition__start_date")
@@ -248,13 +251,14 @@ class CompetitionResultListByTeamView(generics.ListCreateAPIView):
         if role in ["VIEWER", "OBSERVER"]:
             raise PermissionDenied("Observers cannot create results.")
 
-        ct = ContentType.objects.get_for_model(Team)
+        ct = get_content_type(Team)
         serializer.save(content_type=ct, object_id=team_id)
 
 
 class ProgramListCreateByTeamView(generics.ListCreateAPIView):
     permission_classes = [permissions.IsAuthenticated, IsCoachUser]
     serializer_class = ProgramSerializer
+    cursor_ordering = ("-season", "-id")
 
     def get_queryset(self):
         team_id = self.kwargs["team_id"]
@@ -263,7 +267,7 @@ class ProgramListCreateByTeamView(generics.ListCreateAPIView):
         if not get_access_role(self.request.user, team):
             return Program.objects.none()
 
-        ct = ContentType.objects.get_for_model(Team)
+        ct = get_content_type(Team)
         return Program.objects.filter(content_type=ct, object_id=team_id).order_by(
             "-season"
         )
@@ -276,13 +280,14 @@ class ProgramListCreateByTeamView(generics.ListCreateAPIView):
         if role in ["VIEWER", "OBSERVER"]:
             raise PermissionDenied("Observers cannot create programs.")
 
-        ct = ContentType.objects.get_for_model(Team)
+        ct = get_content_type(Team)
         serializer.save(content_type=ct, object_id=team_id)
 
 
 class SynchroCompetitionResultListCreateView(generics.ListCreateAPIView):
     permission_classes = [permissions.IsAuthenticated, IsCoachUser]
     serializer_class = CompetitionResultSerializer
+    cursor_ordering = ("-competition__start_date", "-id")
 
     def get_queryset(self):
         team_id = self.kwargs["team_id"]
@@ -291,7 +296,7 @@ class SynchroCompetitionResultListCreateView(generics.ListCreateAPIView):
         if not get_access_role(self.request.user, team):
             return CompetitionResult.objects.none()
 
-        ct = ContentType.objects.get_for_model(SynchroTeam)
+        ct = get_content_type(SynchroTeam)
         return CompetitionResult.objects.filter(
             content_type=ct, object_id=team_id
         ).order_by("-competition__start_date")
@@ -304,13 +309,14 @@ class SynchroCompetitionResultListCreateView(generics.ListCreateAPIView):
         if role in ["VIEWER", "OBSERVER"]:
             raise PermissionDenied("Observers cannot create results.")
 
-        ct = ContentType.objects.get_for_model(SynchroTeam)
+        ct = get_content_type(SynchroTeam)
         serializer.save(content_type=ct, object_id=team_id)
 
 
 class SynchroProgramListCreateView(generics.ListCreateAPIView):
     permission_classes = [permissions.IsAuthenticated, IsCoachUser]
     serializer_class = ProgramSerializer
+    cursor_ordering = ("-season", "-id")
 
     def get_queryset(self):
         team_id = self.kwargs["team_id"]
@@ -319,7 +325,7 @@ class SynchroProgramListCreateView(generics.ListCreateAPIView):
         if not get_access_role(self.request.user, team):
             return Program.objects.none()
 
-        ct = ContentType.objects.get_for_model(SynchroTeam)
+        ct = get_content_type(SynchroTeam)
         return Program.objects.filter(content_type=ct, object_id=team_id).order_by(
             "-season"
         )
@@ -332,7 +338,7 @@ class SynchroProgramListCreateView(generics.ListCreateAPIView):
         if role in ["VIEWER", "OBSERVER"]:
             raise PermissionDenied("Observers cannot create programs.")
 
-        ct = ContentType.objects.get_for_model(SynchroTeam)
+        ct = get_content_type(SynchroTeam)
         serializer.save(content_type=ct, object_id=team_id)
 
 
@@ -2,22 +2,25 @@ from rest_framework import generics, permissions, status
 from rest_framework.response import Response
 from rest_framework.views import APIView
 from django.shortcuts import get_object_or_404
+from django.conf import settings
 from django.db.models import Q
 
 from api.models import Federation, SkatingElement, PlanningEntityAccess
 from api.serializers import FederationSerializer, SkatingElementSerializer
-from api.services import get_access_role
+from api.services import get_access_role, endpoint_stats
 
 
 class FederationList(generics.ListAPIView):
     permission_classes = [permissions.IsAuthenticated]
     serializer_class = FederationSerializer
+    cursor_ordering = ("iso_code", "id")
     queryset = Federation.objects.all().order_by("iso_code")
 
 
 class SkatingElementList(generics.ListAPIView):
     permission_classes = [permissions.IsAuthenticated]
     serializer_class = SkatingElementSerializer
+    cursor_ordering = ("abbreviation", "id")
 
     def get_queryset(self):
         queryset = SkatingElement.objects.filter(is_active=True).order_by(
@@ -103,3 +106,26 @@ class UnlinkAthleteView(APIView):
         skater.save()
 
         return Response({"message": "Athlete unlinked successfully."}, status=200)
+
+
+class InstrumentationStatsView(APIView):
+    """
+    Staff only. Rolling per-endpoint metrics collected by
+    RequestInstrumentationMiddleware in this process (slowest p95 first).
+    DELETE starts a fresh window.
+    """
+
+    permission_classes = [permissions.IsAdminUser]
+
+    def get(self, request):
+        return Response(
+            {
+                "enabled": settings.API_INSTRUMENTATION,
+                "slow_ms": settings.API_INSTRUMENTATION_SLOW_MS,
+                "endpoints": endpoint_stats.snapshot(),
+            }
+        )
+
+    def delete(self, request):
+        endpoint_stats.clear()
+        return Response(status=status.HTTP_204_NO_CONTENT)
@@ -1,9 +1,9 @@
 from rest_framework.views import APIView
 from rest_framework.response import Response
-from rest_framework import permissions
+from rest_framework import permissions, status
 from django.shortcuts import get_object_or_404
 from django.db.models import Q
-from django.contrib.contenttypes.models import ContentType
+from django.utils.functional import cached_property
 from datetime import date, timedelta
 
 from api.models import (
@@ -11,196 +11,131 @@ from api.models import (
     InjuryLog,
     Goal,
     SessionLog,
-    SkaterTest,
-    Competition,
-    CompetitionResult,
-    WeeklyPlan,
-    AthleteSeason,
     PlanningEntityAccess,
     SinglesEntity,
     SoloDanceEntity,
     Team,
     SynchroTeam,
     User,
+    AthleteSeason,
 )
 from api.serializers import SessionLogSerializer
 from api.permissions import IsCoachUser, IsCoachOrOwner
-from api.services import get_accessible_skaters, get_access_role
+from api.services import (
+    get_accessible_skaters,
+    get_access_role,
+    collect_planning_alerts,
+    build_agenda,
+    get_dashboard_sections,
+    DASHBOARD_SECTIONS,
+    get_performance_summaries,
+    summary_payload,
+    get_content_type,
+    element_success_series,
+    element_consistency,
+    MAX_SERIES_WEEKS,
+    ROLLING_WEEKS,
+    MAX_LOAD_DAYS,
+    get_roster_load,
+    MAX_COMPLIANCE_DAYS,
+    compliance_report,
+)
+from api.services.stats import season_bounds
 
 
 # --- 1. COACH DASHBOARD AGGREGATOR ---
-class CoachDashboardStatsView(APIView):
-    permission_classes = [permissions.IsAuthenticated, IsCoachUser]
-
-    def get(self, request):
-        user = request.user
-        today = date.today()
-        next_week = today + timedelta(days=7)
-        two_weeks = today + timedelta(days=14)
-        start_of_week = today - timedelta(days=today.weekday())
-
-        # --- 1. FETCH ENTITIES ---
-        # Skaters
-        skaters = get_accessible_skaters(user, filter_mode="OPERATIONAL")
-
+class CoachDashboard:
+    """
+    Builds each section of the coach dashboard on demand.
+    The entity lists are resolved lazily, so a request served entirely from
+    the cache never touches them.
+    """
+
+    def __init__(self, user, today=None):
+        self.user = user
+        self.today = today or date.today()
+        self.next_week = self.today + timedelta(days=7)
+        self.ct_team = get_content_type(Team)
+        self.ct_synchro = get_content_type(SynchroTeam)
+
+    # --- 1. FETCH ENTITIES ---
+    @cached_property
+    def skaters(self):
+        return get_accessible_skaters(self.user, filter_mode="OPERATIONAL")
+
+    @cached_property
+    def teams(self):
         # Teams (Pairs/Dance)
-        ct_team = ContentType.objects.get_for_model(Team)
         team_ids = (
-            PlanningEntityAccess.objects.filter(user=user, content_type=ct_team)
+            PlanningEntityAccess.objects.filter(user=self.user, content_type=self.ct_team)
             .exclude(access_level__in=["VIEWER", "OBSERVER"])
             .values_list("object_id", flat=True)
         )
-        teams = Team.objects.filter(id__in=team_ids, is_active=True)
+        return Team.objects.filter(id__in=team_ids, is_active=True)
 
-        # Synchro
-        ct_synchro = ContentType.objects.get_for_model(SynchroTeam)
+    @cached_property
+    def synchro_teams(self):
         synchro_ids = (
-            PlanningEntityAccess.objects.filter(user=user, content_type=ct_synchro)
+            PlanningEntityAccess.objects.filter(user=self.user, content_type=self.ct_synchro)
             .exclude(access_level__in=["VIEWER", "OBSERVER"])
             .values_list("object_id", flat=True)
         )
-        synchro_teams = SynchroTeam.objects.filter(id__in=synchro_ids, is_active=True)
+        return SynchroTeam.objects.filter(id__in=synchro_ids, is_active=True)
 
-        # --- 2. INJURIES (Restored) ---
+    # --- 2. INJURIES (Restored) ---
+    def injuries(self):
         active_injuries = (
             InjuryLog.objects.filter(
-                skater__in=skaters, recovery_status__in=["Active", "Recovering"]
+                skater__in=self.skaters, recovery_status__in=["Active", "Recovering"]
             )
             .select_related("skater")
             .order_by("date_of_onset")
         )
+        return [
+            {
+                "skater": i.skater.full_name,
+                "skater_id": i.skater.id,
+                "injury": i.injury_type,
+                "status": i.recovery_status,
+                "date": i.date_of_onset,
+                "is_shared": get_access_role(self.user, i.skater) == "COLLABORATOR",
+                "link": f"#/skater/{i.skater.id}?tab=health",
+            }
+            for i in active_injuries
+        ]
 
-        # --- 3. PLANNING ALERTS ---
-        planning_alerts = []
-
-        # A. Skaters
-        for skater in skaters:
-            role = get_access_role(user, skater)
-            is_shared = role == "COLLABORATOR"
-            active_seasons = skater.athlete_seasons.filter(is_active=True)
-            if not active_seasons.exists():
-                continue
-            for season in active_seasons:
-                if not season.yearly_plans.exists():
-                    planning_alerts.append(
-                        {
-                            "skater": skater.full_name,
-                            "id": skater.id,
-                            "issue": f"No Plan for {season.season}",
-                            "is_shared": is_shared,
-                            "link": f"#/skater/{skater.id}?tab=yearly",
-                        }
-                    )
-                else:
-                    if (
-                        season.start_date
-                        and season.end_date
-                        and not (season.start_date <= today <= season.end_date)
-                    ):
-                        continue
-                    current_week = WeeklyPlan.objects.filter(
-                        athlete_season=season, week_start=start_of_week
-                    ).first()
-                    if not current_week or not current_week.theme:
-                        planning_alerts.append(
-                            {
-                                "skater": skater.full_name,
-                                "id": skater.id,
-                                "issue": f"Unplanned Week",
-                                "is_shared": is_shared,
-                                "link": f"#/skater/{skater.id}?tab=weekly",
-                            }
-                        )
-
-        # B. Teams
-        for team in teams:
-            role = get_access_role(user, team)
-            is_shared = role == "COLLABORATOR"
-            # Teams usually have 1 active season linked to the TEAM object
-            seasons = AthleteSeason.objects.filter(
-                content_type=ct_team, object_id=team.id, is_active=True
-            )
-            for season in seasons:
-                if not season.yearly_plans.exists():
-                    planning_alerts.append(
-                        {
-                            "skater": team.team_name,
-                            "id": team.id,
-                            "issue": "No Team Plan",
-                            "is_shared": is_shared,
-                            "link": f"#/team/{team.id}?tab=yearly",
-                        }
-                    )
-                else:
-                    current_week = WeeklyPlan.objects.filter(
-                        athlete_season=season, week_start=start_of_week
-                    ).first()
-                    if not current_week or not current_week.theme:
-                        planning_alerts.append(
-                            {
-                                "skater": team.team_name,
-                                "id": team.id,
-                                "issue": "Unplanned Week",
-                                "is_shared": is_shared,
-                                "link": f"#/team/{team.id}?tab=weekly",
-                            }
-                        )
-
-        # C. Synchro
-        for team in synchro_teams:
-            role = get_access_role(user, team)
-            is_shared = role == "COLLABORATOR"
-            seasons = AthleteSeason.objects.filter(
-                content_type=ct_synchro, object_id=team.id, is_active=True
-            )
-            for season in seasons:
-                if not season.yearly_plans.exists():
-                    planning_alerts.append(
-                        {
-                            "skater": team.team_name,
-                            "id": team.id,
-                            "issue": "No Team Plan",
-                            "is_shared": is_shared,
-                            "link": f"#/synchro/{team.id}?tab=yearly",
-                        }
-                    )
-                else:
-                    current_week = WeeklyPlan.objects.filter(
-                        athlete_season=season, week_start=start_of_week
-                    ).first()
-                    if not current_week or not current_week.theme:
-                        planning_alerts.append(
-                            {
-                                "skater": team.team_name,
-                                "id": team.id,
-                                "issue": "Unplanned Week",
-                                "is_shared": is_shared,
-                                "link": f"#/synchro/{team.id}?tab=weekly",
-                            }
-                        )
-
-        # --- 4. GOALS ---
-        goal_query = Q(assignee_skater__in=skaters)
+    # --- 3. PLANNING ALERTS ---
+    def planning(self):
+        return collect_planning_alerts(
+            self.user, self.skaters, self.teams, self.synchro_teams, today=self.today
+        )
+
+    # --- 4. GOALS ---
+    def goals(self):
+        user = self.user
+        today = self.today
+        goal_query = Q(assignee_skater__in=self.skaters)
 
         # Singles/Solo
-        singles_ids = SinglesEntity.objects.filter(skater__in=skaters).values_list(
+        singles_ids = SinglesEntity.objects.filter(skater__in=self.skaters).values_list(
             "id", flat=True
         )
         if singles_ids:
-            ct_singles = ContentType.objects.get_for_model(SinglesEntity)
+            ct_singles = get_content_type(SinglesEntity)
             goal_query |= Q(content_type=ct_singles, object_id__in=singles_ids)
 
         # Teams
-        if teams.exists():
+        if self.teams.exists():
             goal_query |= Q(
-                content_type=ct_team, object_id__in=teams.values_list("id", flat=True)
+                content_type=self.ct_team,
+                object_id__in=self.teams.values_list("id", flat=True),
             )
 
         # Synchro
-        if synchro_teams.exists():
+        if self.synchro_teams.exists():
             goal_query |= Q(
-                content_type=ct_synchro,
-                object_id__in=synchro_teams.values_list("id", flat=True),
+                content_type=self.ct_synchro,
+                object_id__in=self.synchro_teams.values_list("id", flat=True),
             )
 
         overdue_goals = Goal.objects.filter(
@@ -210,7 +145,7 @@ class CoachDashboardStatsView(APIView):
         ).order_by("target_date")[:10]
         due_soon_goals = Goal.objects.filter(
             goal_query,
-            target_date__range=(today, next_week),
+            target_date__range=(today, self.next_week),
             current_status__in=["IN_PROGRESS", "PENDING", "APPROVED"],
         ).order_by("target_date")[:10]
 
@@ -254,27 +189,30 @@ class CoachDashboardStatsView(APIView):
                 )
             return formatted
 
-        # --- 5. ACTIVITY ---
+        return {
+            "overdue_goals": format_goals(overdue_goals),
+            "due_soon_goals": format_goals(due_soon_goals),
+        }
+
+    # --- 5. ACTIVITY ---
+    def activity(self):
+        user = self.user
         # Fetch logs for Skaters + Teams + Synchro
-        log_query = Q(athlete_season__skater__in=skaters)
+        log_query = Q(athlete_season__skater__in=self.skaters)
 
-        if teams.exists():
+        if self.teams.exists():
             log_query |= Q(
-                athlete_season__content_type=ct_team,
-                athlete_season__object_id__in=teams.values_list("id", flat=True),
+                athlete_season__content_type=self.ct_team,
+                athlete_season__object_id__in=self.teams.values_list("id", flat=True),
             )
-        if synchro_teams.exists():
+        if self.synchro_teams.exists():
             log_query |= Q(
-                athlete_season__content_type=ct_synchro,
-                athlete_season__object_id__in=synchro_teams.values_list(
-                    "id", flat=True
-                ),
+                athlete_season__content_type=self.ct_synchro,
+                athlete_season__object_id__in=self.synchro_teams.values_list("id", flat=True),
             )
 
         recent_logs = (
-            SessionLog.objects.filter(
-                log_query, session_date__gte=today - timedelta(days=3)
-            )
+            SessionLog.objects.filter(log_query, session_date__gte=self.today - timedelta(days=3))
             .select_related("athlete_season")
             .order_by("-session_date")[:15]
         )
@@ -312,104 +250,39 @@ class CoachDashboardStatsView(APIView):
                     "link": link,
                 }
             )
+        return activity_data
 
-        # --- 6. AGENDA ---
-        agenda_items = []
-
-        # Tests (Skater only)
-        upcoming_tests = SkaterTest.objects.filter(
-            test_date__range=(today, two_weeks), skater__in=skaters
-        ).order_by("test_date")
-        for t in upcoming_tests:
-            role = get_access_role(user, t.skater)
-            is_shared = role == "COLLABORATOR"
-            agenda_items.append(
-                {
-                    "type": "Test",
-                    "title": t.test_name,
-                    "who": t.skater.full_name,
-                    "date": t.test_date,
-                    "is_shared": is_shared,
-                    "link": f"#/skater/{t.skater.id}?tab=tests",
-                }
-            )
+    # --- 6. AGENDA ---
+    def agenda(self):
+        return build_agenda(
+            self.user, self.skaters, self.teams, self.synchro_teams, today=self.today
+        )
 
-        # Comps (Global)
-        upcoming_comps = Competition.objects.filter(
-            start_date__range=(today, two_weeks)
-        ).order_by("start_date")
-        for c in upcoming_comps:
-            results = CompetitionResult.objects.filter(competition=c)
-            attendees = set()
-            first_link = "#/"
-
-            for r in results:
-                # Check Skaters
-                if r.planning_entity:
-                    if (
-                        hasattr(r.planning_entity, "skater")
-                        and r.planning_entity.skater in skaters
-                    ):
-                        attendees.add(r.planning_entity.skater.full_name)
-                        if first_link == "#/":
-                            first_link = f"#/skater/{r.planning_entity.skater.id}?tab=competitions"
-                    # Check Teams
-                    elif (
-                        isinstance(r.planning_entity, Team)
-                        and r.planning_entity in teams
-                    ):
-                        attendees.add(r.planning_entity.team_name)
-                        if first_link == "#/":
-                            first_link = (
-                                f"#/team/{r.planning_entity.id}?tab=competitions"
-                            )
-                    # Check Synchro
-                    elif (
-                        isinstance(r.planning_entity, SynchroTeam)
-                        and r.planning_entity in synchro_teams
-                    ):
-                        attendees.add(r.planning_entity.team_name)
-                        if first_link == "#/":
-                            first_link = (
-                                f"#/synchro/{r.planning_entity.id}?tab=competitions"
-                            )
-
-            if attendees:
-                agenda_items.append(
-                    {
-                        "type": "Competition",
-                        "title": c.title,
-                        "who": ", ".join(list(attendees)),
-                        "date": c.start_date,
-                        "is_shared": False,
-                        "link": first_link,
-                    }
-                )
 
-        agenda_items.sort(key=lambda x: x["date"])
+class CoachDashboardStatsView(APIView):
+    permission_classes = [permissions.IsAuthenticated, IsCoachUser]
+
+    def get(self, request):
+        user = request.user
+        dashboard = CoachDashboard(user)
+
+        # Each section is cached per user and invalidated by api.signals
+        sections = get_dashboard_sections(
+            user,
+            {section: getattr(dashboard, section) for section in DASHBOARD_SECTIONS},
+            today=dashboard.today,
+        )
 
         return Response(
             {
                 "red_flags": {
-                    "injuries": [
-                        {
-                            "skater": i.skater.full_name,
-                            "skater_id": i.skater.id,
-                            "injury": i.injury_type,
-                            "status": i.recovery_status,
-                            "date": i.date_of_onset,
-                            "is_shared": get_access_role(user, i.skater)
-                            == "COLLABORATOR",
-                            "link": f"#/skater/{i.skater.id}?tab=health",
-                        }
-                        for i in active_injuries
-                    ],
-                    "planning": planning_alerts,
-                    "overdue_goals": format_goals(overdue_goals),
-                    "due_soon_goals": format_goals(due_soon_goals),
+                    "injuries": sections["injuries"],
+                    "planning": sections["planning"],
+                    "overdue_goals": sections["goals"]["overdue_goals"],
+                    "due_soon_goals": sections["goals"]["due_soon_goals"],
                 },
-                "activity": activity_data,
-                "agenda": agenda_items,
+                "activity": sections["activity"],
+                "agenda": sections["agenda"],
             }
         )
 
@@ -424,32 +297,8 @@ class SkaterStatsView(APIView):
         # Manual Permission Check
         self.check_object_permissions(request, skater)
 
-        entity_ids = [
-            e.id
-            for e in list(skater.singles_entities.all())
-            + list(skater.solodance_entities.all())
-            + list(skater.teams_as_partner_a.all())
-            + list(skater.teams_as_partner_b.all())
-        ]
-
-        all_results = (
-            CompetitionResult.objects.filter(
-                object_id__in=entity_ids, status=CompetitionResult.Status.COMPLETED
-            )
-            .select_related("competition")
-            .order_by("competition__start_date")
-        )
-
-        active_seasons = AthleteSeason.objects.filter(skater=skater, is_active=True)
-        total_sessions = SessionLog.objects.filter(
-            athlete_season__in=active_seasons
-        ).count()
-
-        season_name = (
-            active_seasons.last().season if active_seasons.exists() else "Current"
-        )
-
-        return calculate_stats_response(all_results, total_sessions, season_name)
+        summary = get_performance_summaries(Skater, [skater.id])[skater.id]
+        return Response(summary_payload(summary))
 
 
 # --- 3. TEAM STATS ---
@@ -460,22 +309,8 @@ class TeamStatsView(APIView):
         team = get_object_or_404(Team, id=team_id)
         self.check_object_permissions(request, team)
 
-        ct = ContentType.objects.get_for_model(Team)
-        all_results = (
-            CompetitionResult.objects.filter(
-                content_type=ct,
-                object_id=team_id,
-                status=CompetitionResult.Status.COMPLETED,
-            )
-            .select_related("competition")
-            .order_by("competition__start_date")
-        )
-
-        total_sessions = SessionLog.objects.filter(
-            content_type=ct, object_id=team_id
-        ).count()
-
-        return calculate_stats_response(all_results, total_sessions, "Current")
+        summary = get_performance_summaries(Team, [team.id])[team.id]
+        return Response(summary_payload(summary))
 
 
 # --- 4. SYNCHRO STATS ---
@@ -486,133 +321,249 @@ class SynchroStatsView(APIView):
         team = get_object_or_404(SynchroTeam, id=team_id)
         self.check_object_permissions(request, team)
 
-        ct = ContentType.objects.get_for_model(SynchroTeam)
-        all_results = (
-            CompetitionResult.objects.filter(
-                content_type=ct,
-                object_id=team_id,
-                status=CompetitionResult.Status.COMPLETED,
-            )
-            .select_related("competition")
-            .order_by("competition__start_date")
-        )
+        summary = get_performance_summaries(SynchroTeam, [team.id])[team.id]
+        return Response(summary_payload(summary))
 
-        total_sessions = SessionLog.objects.filter(
-            content_type=ct, object_id=team_id
-        ).count()
 
-        return calculate_stats_response(all_results, total_sessions, "Current")
+# --- 5. ROSTER STATS (every entity on the coach's dashboard) ---
+class RosterStatsView(APIView):
+    """
+    Stats for all of a coach's skaters, teams and synchro teams in one call,
+    instead of one stats request per entity.
+    """
 
+    permission_classes = [permissions.IsAuthenticated, IsCoachUser]
 
-# --- HELPER FOR STATS ---
-def calculate_stats_response(all_results, total_sessions, season_name):
-    def make_stat():
-        return {"score": 0.0, "comp": "N/A", "date": None}
+    def get(self, request):
+        dashboard = CoachDashboard(request.user)
+        entities = {
+            "skaters": (Skater, dashboard.skaters),
+            "teams": (Team, dashboard.teams),
+            "synchro_teams": (SynchroTeam, dashboard.synchro_teams),
+        }
+        data = {}
+        for key, (model, queryset) in entities.items():
+            summaries = get_performance_summaries(model, queryset.values_list("id", flat=True))
+            data[key] = {pk: summary_payload(summary) for pk, summary in summaries.items()}
+        return Response(data)
+
+
+# --- 6. ELEMENT SUCCESS RATES ---
+def parse_element_range(request):
+    """
+    (start, end, codes, error_response) from ?weeks=8 (max MAX_SERIES_WEEKS),
+    ?end=YYYY-MM-DD (default today) and ?elements=3Lz,2A.
+    """
+    try:
+        end = date.fromisoformat(request.query_params.get("end") or date.today().isoformat())
+    except ValueError:
+        error = Response({"error": "Invalid date"}, status=status.HTTP_400_BAD_REQUEST)
+        return None, None, None, error
+    try:
+        weeks = int(request.query_params.get("weeks", 8))
+    except ValueError:
+        weeks = 8
+    weeks = max(1, min(weeks, MAX_SERIES_WEEKS))
+    start = end - timedelta(days=end.weekday(), weeks=weeks - 1)
+    codes = [code for code in request.query_params.get("elements", "").split(",") if code]
+    return start, end, codes, None
+
+
+class SkaterElementStatsView(APIView):
+    """
+    Weekly success-rate series per element from ElementAttemptFact
+    (query parameters as in parse_element_range).
+    """
 
-    stats = {"total": {"pb": make_stat(), "sb": make_stat()}, "segments": {}}
+    permission_classes = [permissions.IsAuthenticated, IsCoachOrOwner]
 
-    today = date.today()
-    start_year = today.year if today.month >= 7 else today.year - 1
-    season_start = date(start_year, 7, 1)
-    season_end = date(start_year + 1, 6, 30)
+    def get(self, request, skater_id):
+        skater = get_object_or_404(Skater, id=skater_id)
+        self.check_object_permissions(request, skater)
 
-    history = []
+        start, end, codes, error = parse_element_range(request)
+        if error:
+            return error
+        return Response(
+            {
+                "start": start,
+                "end": end,
+                "elements": element_success_series(skater.id, start, end, codes),
+            }
+        )
 
-    for res in all_results:
-        comp_name = res.competition.title
-        comp_date = res.competition.start_date
 
-        total_tes = 0.0
-        if res.segment_scores and isinstance(res.segment_scores, list):
-            for seg in res.segment_scores:
-                total_tes += float(seg.get("tes") or 0)
+# --- 7. ELEMENT CONSISTENCY ---
+class SkaterElementConsistencyView(APIView):
+    """
+    Landing percentages per element and week, from element attempts and
+    program runs, with rolling ROLLING_WEEKS-week rates and a trend.
+    Weeks are cached per skater and week, and only rebuilt after a log in them
+    changes.
+    """
 
-        planned_bv = float(res.planned_base_value or 0)
-        total_score = float(res.total_score or 0)
+    permission_classes = [permissions.IsAuthenticated, IsCoachOrOwner]
 
-        history.append(
+    def get(self, request, skater_id):
+        skater = get_object_or_404(Skater, id=skater_id)
+        self.check_object_permissions(request, skater)
+
+        start, end, codes, error = parse_element_range(request)
+        if error:
+            return error
+        return Response(
             {
-                "date": comp_date,
-                "name": comp_name,
-                "total_score": total_score,
-                "tes": total_tes,
-                "planned_bv": planned_bv,
-                "pcs_approx": total_score - total_tes,
+                "start": start,
+                "end": end,
+                "rolling_weeks": ROLLING_WEEKS,
+                "elements": element_consistency(skater.id, start, end, codes),
             }
         )
 
-        is_current = season_start <= comp_date <= season_end
 
-        if total_score > stats["total"]["pb"]["score"]:
-            stats["total"]["pb"] = {
-                "score": total_score,
-                "comp": comp_name,
-                "date": comp_date,
-            }
-        if is_current and total_score > stats["total"]["sb"]["score"]:
-            stats["total"]["sb"] = {
-                "score": total_score,
-                "comp": comp_name,
-                "date": comp_date,
-            }
+# --- 8. ROSTER TRAINING LOAD ---
+class RosterLoadView(APIView):
+    """
+    Training load curves (daily load, ACWR, monotony, strain) for every skater
+    on the coach's dashboard, read from DailyTrainingLoad in one query.
+    ?days=28 (max MAX_LOAD_DAYS) ending at ?end=YYYY-MM-DD (default today).
+    Skaters with the highest ACWR come first.
+    """
 
-        if res.segment_scores and isinstance(res.segment_scores, list):
-            for seg in res.segment_scores:
-                name = seg.get("name", "Unknown")
-                if name not in stats["segments"]:
-                    stats["segments"][name] = {
-                        "total": {"pb": make_stat(), "sb": make_stat()},
-                        "tes": {"pb": make_stat(), "sb": make_stat()},
-                        "pcs": {"pb": make_stat(), "sb": make_stat()},
-                    }
-                bucket = stats["segments"][name]
-                s_score = float(seg.get("score") or 0)
-                s_tes = float(seg.get("tes") or 0)
-                s_pcs = float(seg.get("pcs") or 0)
-
-                if s_score > bucket["total"]["pb"]["score"]:
-                    bucket["total"]["pb"] = {
-                        "score": s_score,
-                        "comp": comp_name,
-                        "date": comp_date,
-                    }
-                if is_current and s_score > bucket["total"]["sb"]["score"]:
-                    bucket["total"]["sb"] = {
-                        "score": s_score,
-                        "comp": comp_name,
-                        "date": comp_date,
-                    }
-                if s_tes > bucket["tes"]["pb"]["score"]:
-                    bucket["tes"]["pb"] = {
-                        "score": s_tes,
-                        "comp": comp_name,
-                        "date": comp_date,
-                    }
-                if is_current and s_tes > bucket["tes"]["sb"]["score"]:
-                    bucket["tes"]["sb"] = {
-                        "score": s_tes,
-                        "comp": comp_name,
-                        "date": comp_date,
-                    }
-                if s_pcs > bucket["pcs"]["pb"]["score"]:
-                    bucket["pcs"]["pb"] = {
-                        "score": s_pcs,
-                        "comp": comp_name,
-                        "date": comp_date,
-                    }
-                if is_current and s_pcs > bucket["pcs"]["sb"]["score"]:
-                    bucket["pcs"]["sb"] = {
-                        "score": s_pcs,
-                        "comp": comp_name,
-                        "date": comp_date,
-                    }
+    permission_classes = [permissions.IsAuthenticated, IsCoachUser]
 
-    return Response(
+    def get(self, request):
+        try:
+            end = date.fromisoformat(request.query_params.get("end") or date.today().isoformat())
+        except ValueError:
+            return Response({"error": "Invalid date"}, status=status.HTTP_400_BAD_REQUEST)
+        try:
+            days = int(request.query_params.get("days", 28))
+        except ValueError:
+            days = 28
+        days = max(1, min(days, MAX_LOAD_DAYS))
+        start = end - timedelta(days=days - 1)
+
+        skaters = list(CoachDashboard(request.user).skaters.values_list("id", "full_name"))
+        loads = get_roster_load([pk for pk, _ in skaters], start, end)
+        data = [
+            {"id": pk, "full_name": full_name, **loads[pk]} for pk, full_name in skaters
+        ]
+        data.sort(key=lambda row: -(row["latest"]["acwr"] or 0))
+        return Response({"start": start, "end": end, "skaters": data})
+
+
+# --- 9. PLANNED VS ACTUAL COMPLIANCE ---
+def parse_compliance_range(request):
+    """
+    (start, end, error_response) from ?start= and ?end= (YYYY-MM-DD), by
+    default the season (July to June) containing today. At most
+    MAX_COMPLIANCE_DAYS days.
+    """
+    season_start, season_end = season_bounds(date.today())
+    try:
+        start = date.fromisoformat(request.query_params.get("start") or season_start.isoformat())
+        end = date.fromisoformat(request.query_params.get("end") or season_end.isoformat())
+    except ValueError:
+        return None, None, Response({"error": "Invalid date"}, status=status.HTTP_400_BAD_REQUEST)
+    if start > end or (end - start).days >= MAX_COMPLIANCE_DAYS:
+        error = Response(
+            {"error": f"Range must run forwards and span at most {MAX_COMPLIANCE_DAYS} days"},
+            status=status.HTTP_400_BAD_REQUEST,
+        )
+        return None, None, error
+    return start, end, None
+
+
+def compliance_payload(seasons, start, end):
+    """
+    Response body for compliance_report over `seasons`, given as
+    (season_id, season, skater_id, name) rows. Athletes without planned
+    sessions in the range are left out.
+    """
+    report = compliance_report([row[0] for row in seasons], start, end)
+    athletes = [
         {
-            "overall": stats["total"],
-            "segments": stats["segments"],
-            "volume": total_sessions,
-            "season_name": season_name,
-            "history": history,
+            "season_id": season_id,
+            "season": season,
+            "skater_id": skater_id,
+            "name": name,
+            **report["seasons"][season_id],
         }
-    )
+        for season_id, season, skater_id, name in seasons
+        if season_id in report["seasons"]
+    ]
+    athletes.sort(key=lambda row: (row["completion"] is None, row["completion"], row["name"]))
+    return {
+        "start": start,
+        "end": end,
+        "totals": report["totals"],
+        "weeks": report["weeks"],
+        "session_types": report["session_types"],
+        "athletes": athletes,
+    }
+
+
+class RosterComplianceView(APIView):
+    """
+    Planned-vs-logged completion for the coach's skaters (all of them, or
+    ?skaters=1,2), per week and session type, over ?start=&end=.
+    Least compliant athletes come first.
+    """
+
+    permission_classes = [permissions.IsAuthenticated, IsCoachUser]
+
+    def get(self, request):
+        start, end, error = parse_compliance_range(request)
+        if error:
+            return error
+
+        skaters = CoachDashboard(request.user).skaters
+        requested = request.query_params.get("skaters")
+        if requested:
+            try:
+                ids = [int(pk) for pk in requested.split(",") if pk]
+            except ValueError:
+                return Response(
+                    {"error": "skaters must be a list of ids"},
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+            skaters = skaters.filter(id__in=ids)
+
+        seasons = AthleteSeason.objects.filter(skater__in=skaters).values_list(
+            "id", "season", "skater_id", "skater__full_name"
+        )
+        return Response(compliance_payload(list(seasons), start, end))
+
+
+class TeamComplianceView(APIView):
+    """
+    Compliance of a pairs/dance team or a synchro team (by path): the team's
+    own plan, and each partner's or roster skater's plan.
+    """
+
+    permission_classes = [permissions.IsAuthenticated, IsCoachOrOwner]
+
+    def get(self, request, team_id):
+        if "synchro" in request.path:
+            team = get_object_or_404(SynchroTeam, id=team_id)
+            member_ids = team.roster.values("id")
+        else:
+            team = get_object_or_404(Team, id=team_id)
+            member_ids = [pk for pk in (team.partner_a_id, team.partner_b_id) if pk]
+        self.check_object_permissions(request, team)
+
+        start, end, error = parse_compliance_range(request)
+        if error:
+            return error
+
+        seasons = [
+            (season_id, season, None, team.team_name)
+            for season_id, season in AthleteSeason.objects.filter(
+                content_type=get_content_type(team), object_id=team.id
+            ).values_list("id", "season")
+        ]
+        seasons += AthleteSeason.objects.filter(skater_id__in=member_ids).values_list(
+            "id", "season", "skater_id", "skater__full_name"
+        )
+        return Response(compliance_payload(seasons, start, end))
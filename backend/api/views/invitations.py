@@ -3,17 +3,15 @@ from rest_framework.response import Response
 from rest_framework.views import APIView
 from rest_framework.exceptions import PermissionDenied
 from django.shortcuts import get_object_or_404
-from django.contrib.contenttypes.models import ContentType
-from django.core.mail import send_mail
 from django.utils import timezone
 from django.db import transaction
-from django.conf import settings
 from django.contrib.auth import authenticate
 import uuid
 from datetime import date, timedelta
 
 from api.models import Invitation, User, Skater, Team, SynchroTeam, PlanningEntityAccess
-from api.services import get_access_role
+from api.services import get_access_role, get_content_type
+from api.tasks import queue_invitation_emails
 
 
 class SendInviteView(APIView):
@@ -52,13 +50,17 @@ class SendInviteView(APIView):
                 "You do not have permission to invite users to this entity."
             )
 
-        # 3. Loop and Send
+        # 3. Create the invitations (emails go out from the task queue)
         results = []
+        invites = []
+        seen = set()
+        expires_at = timezone.now() + timedelta(days=7)
 
         for email in emails:
             email = email.strip()
-            if not email:
+            if not email or email.lower() in seen:
                 continue
+            seen.add(email.lower())
 
             # Compliance Check (Minors - Skaters Only) - Skip for bulk team invites usually
             if role == "ATHLETE" and entity_type == "Skater":
@@ -80,50 +82,74 @@ class SendInviteView(APIView):
                         )
                         continue
 
-            # Create Invitation
-            invite = Invitation.objects.create(
-                email=email,
-                sender=request.user,
-                role=role,
-                content_type=ContentType.objects.get_for_model(target),
-                object_id=target.id,
-                token=str(uuid.uuid4()),
+            invites.append(
+                Invitation(
+                    email=email,
+                    sender=request.user,
+                    role=role,
+                    content_type=get_content_type(target),
+                    object_id=target.id,
+                    token=str(uuid.uuid4()),
+                    expires_at=expires_at,
+                )
             )
 
-            # Send Email
-            base_url = settings.FRONTEND_URL.rstrip("/")
-            accept_link = f"{base_url}/#/accept-invite/{invite.token}"
-
-            display_role = role.replace("_", " ").title()
-            if role == "ATHLETE" and entity_type != "Skater":
-                display_role = "Team Member"
-
-            html_message = f"""
-            <div style="font-family: sans-serif; max-width: 600px; margin: 0 auto; padding: 20px; border: 1px solid #eee; border-radius: 8px;">
-                <h2 style="color: #2563eb;">Welcome to SkatePlan!</h2>
-                <p>Hello,</p>
-                <p>Your coach <strong>{request.user.full_name}</strong> has invited you to join their roster on SkatePlan.</p>
-                <p><strong>Role:</strong> {display_role}</p>
-                <p><strong>Team/Athlete:</strong> {str(target)}</p>
-                <br>
-                <a href="{accept_link}" style="background-color: #2563eb; color: white; padding: 12px 24px; text-decoration: none; border-radius: 4px; font-weight: bold; display: inline-block;">Accept Invitation</a>
-                <br><br>
-                <p style="font-size: 12px; color: #666;">Or copy this link: <br> <a href="{accept_link}">{accept_link}</a></p>
-            </div>
-            """
-
-            send_mail(
-                subject=f"Invitation to join {str(target)}",
-                message=f"Accept at: {accept_link}",
-                from_email=settings.DEFAULT_FROM_EMAIL,
-                recipient_list=[email],
-                html_message=html_message,
-                fail_silently=True,
+        with transaction.atomic():
+            Invitation.objects.bulk_create(invites)
+            ids = [invite.pk for invite in invites]
+            transaction.on_commit(lambda: queue_invitation_emails(ids))
+
+        results.extend(
+            {"email": invite.email, "status": "queued", "invitation_id": invite.pk}
+            for invite in invites
+        )
+        return Response(
+            {"message": "Invitations queued", "results": results}, status=201
+        )
+
+
+class InvitationStatusView(APIView):
+    """
+    Email delivery status of invitations sent by the current user.
+    ?ids=<uuid>,<uuid> polls specific invitations (as returned by
+    invitations/send/); otherwise lists the ones still open.
+    """
+
+    permission_classes = [permissions.IsAuthenticated]
+
+    def get(self, request):
+        queryset = Invitation.objects.filter(sender=request.user)
+        ids = [pk for pk in request.query_params.get("ids", "").split(",") if pk]
+        if ids:
+            try:
+                ids = [uuid.UUID(pk) for pk in ids]
+            except ValueError:
+                return Response({"error": "ids must be invitation UUIDs"}, status=400)
+            queryset = queryset.filter(pk__in=ids)
+        else:
+            queryset = queryset.filter(
+                accepted_at__isnull=True, expires_at__gt=timezone.now()
             )
-            results.append({"email": email, "status": "sent"})
 
         return Response(
-            {"message": "Invitations processed", "results": results}, status=201
+            [
+                {
+                    "invitation_id": row["id"],
+                    "email": row["email"],
+                    "status": row["email_status"].lower(),
+                    "attempts": row["email_attempts"],
+                    "error": row["email_error"],
+                    "sent_at": row["email_sent_at"],
+                }
+                for row in queryset.order_by("-created_at").values(
+                    "id",
+                    "email",
+                    "email_status",
+                    "email_attempts",
+                    "email_error",
+                    "email_sent_at",
+                )
+            ]
         )
 
 
@@ -142,7 +168,7 @@ class AcceptInviteView(APIView):
                     - ((today.month, today.day) < (dob.month, dob.day))
                 )
                 if 13 <= age < 18:
-                    ct = ContentType.objects.get_for_model(Skater)
+                    ct = get_content_type(Skater)
                     has_guardian = PlanningEntityAccess.objects.filter(
                         content_type=ct, object_id=skater.id, access_level="GUARDIAN"
                     ).exists()
@@ -219,7 +245,7 @@ class AcceptInviteView(APIView):
 
         # --- 3. ASSIGN PERMISSIONS ---
         entity = invite.target_entity
-        ct = ContentType.objects.get_for_model(entity)
+        ct = get_content_type(entity)
 
         # Case A: Direct Skater Link (Profile Ownership) - ONLY for Skater entities
         if (invite.role == "ATHLETE" or invite.role == "SKATER") and isinstance(
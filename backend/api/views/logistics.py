@@ -1,6 +1,5 @@
 from rest_framework import generics, permissions
 from rest_framework.exceptions import PermissionDenied
-from django.contrib.contenttypes.models import ContentType
 from api.models import TeamTrip, ItineraryItem, HousingAssignment, SynchroTeam, Skater
 from api.serializers import (
     TeamTripSerializer,
@@ -8,7 +7,7 @@ from api.serializers import (
     HousingAssignmentSerializer,
 )
 from api.permissions import IsCoachUser, IsCoachOrOwner
-from api.services import get_access_role  # <--- Import Service
+from api.services import get_access_role, get_content_type  # <--- Import Service
 
 
 class SynchroTripListCreateView(generics.ListCreateAPIView):
@@ -21,7 +20,7 @@ class SynchroTripListCreateView(generics.ListCreateAPIView):
 
     def get_queryset(self):
         team_id = self.kwargs["team_id"]
-        ct = ContentType.objects.get_for_model(SynchroTeam)
+        ct = get_content_type(SynchroTeam)
         return TeamTrip.objects.filter(content_type=ct, object_id=team_id)
 
     def perform_create(self, serializer):
@@ -33,7 +32,7 @@ class SynchroTripListCreateView(generics.ListCreateAPIView):
         if role in ["VIEWER", "OBSERVER"] or not role:
             raise PermissionDenied("Observers cannot create trips.")
 
-        ct = ContentType.objects.get_for_model(SynchroTeam)
+        ct = get_content_type(SynchroTeam)
         serializer.save(content_type=ct, object_id=team.id)
 
 
@@ -57,7 +56,7 @@ class SkaterTripListView(generics.ListAPIView):
             return TeamTrip.objects.none()
 
         # 2. Get trips for these teams
-        ct = ContentType.objects.get_for_model(SynchroTeam)
+        ct = get_content_type(SynchroTeam)
         return TeamTrip.objects.filter(
             content_type=ct,
             object_id__in=teams.values_list("id", flat=True),
@@ -1,7 +1,10 @@
 from rest_framework import generics, permissions, status
 from rest_framework.exceptions import ValidationError, PermissionDenied
-from django.contrib.contenttypes.models import ContentType
+from rest_framework.response import Response
+from rest_framework.views import APIView
+from django.db import transaction
 from django.db.models import Q
+from django.shortcuts import get_object_or_404
 from datetime import date
 
 from api.models import (
@@ -14,16 +17,29 @@ from api.models import (
     Team,
     SynchroTeam,
 )
-from api.serializers import SessionLogSerializer, InjuryLogSerializer
+from api.serializers import (
+    SessionLogSerializer,
+    SessionLogAthleteSerializer,
+    InjuryLogSerializer,
+)
 from api.permissions import IsCoachUser, IsCoachOrOwner
-from api.services import get_access_role
+from api.services import (
+    get_access_role,
+    get_content_type,
+    bulk_create_session_logs,
+    invalidate_dashboard,
+)
+from api.services.stats import season_bounds
+from .mixins import DeferUnrequestedFieldsMixin
 
 # --- SESSION LOGS ---
 
 
-class SessionLogListCreateView(generics.ListCreateAPIView):
+class SessionLogListCreateView(DeferUnrequestedFieldsMixin, generics.ListCreateAPIView):
     permission_classes = [permissions.IsAuthenticated, IsCoachOrOwner]
     serializer_class = SessionLogSerializer
+    cursor_ordering = ("-session_date", "-session_time", "-id")
+    defer_unless_requested = ("coach_notes", "skater_notes")
 
     def get_queryset(self):
         skater_id = self.kwargs["skater_id"]
@@ -41,7 +57,7 @@ class SessionLogListCreateView(generics.ListCreateAPIView):
         # 2. Team Seasons (Pairs/Dance)
         teams = Team.objects.filter(Q(partner_a=skater) | Q(partner_b=skater))
         if teams.exists():
-            ct_team = ContentType.objects.get_for_model(Team)
+            ct_team = get_content_type(Team)
             season_query |= Q(
                 content_type=ct_team, object_id__in=teams.values_list("id", flat=True)
             )
@@ -49,7 +65,7 @@ class SessionLogListCreateView(generics.ListCreateAPIView):
         # 3. Synchro Seasons
         synchro = skater.synchro_teams.all()
         if synchro.exists():
-            ct_synchro = ContentType.objects.get_for_model(SynchroTeam)
+            ct_synchro = get_content_type(SynchroTeam)
             season_query |= Q(
                 content_type=ct_synchro,
                 object_id__in=synchro.values_list("id", flat=True),
@@ -103,7 +119,7 @@ class SessionLogListCreateView(generics.ListCreateAPIView):
         if not model_class or not entity_id:
             raise ValidationError(f"Invalid or missing planning entity.")
 
-        content_type = ContentType.objects.get_for_model(model_class)
+        content_type = get_content_type(model_class)
 
         serializer.save(
             author=self.request.user,
@@ -113,9 +129,11 @@ class SessionLogListCreateView(generics.ListCreateAPIView):
         )
 
 
-class SessionLogListCreateByTeamView(generics.ListCreateAPIView):
+class SessionLogListCreateByTeamView(DeferUnrequestedFieldsMixin, generics.ListCreateAPIView):
     permission_classes = [permissions.IsAuthenticated, IsCoachUser]
     serializer_class = SessionLogSerializer
+    cursor_ordering = ("-session_date", "-session_time", "-id")
+    defer_unless_requested = ("coach_notes", "skater_notes")
 
     def get_queryset(self):
         team_id = self.kwargs["team_id"]
@@ -125,7 +143,7 @@ class SessionLogListCreateByTeamView(generics.ListCreateAPIView):
         if not get_access_role(self.request.user, team):
             return SessionLog.objects.none()
 
-        ct = ContentType.objects.get_for_model(Team)
+        ct = get_content_type(Team)
         return SessionLog.objects.filter(
             athlete_season__content_type=ct, athlete_season__object_id=team_id
         ).order_by("-session_date")
@@ -138,7 +156,7 @@ class SessionLogListCreateByTeamView(generics.ListCreateAPIView):
         if role in ["VIEWER", "OBSERVER"]:
             raise PermissionDenied("Observers cannot create logs.")
 
-        ct = ContentType.objects.get_for_model(Team)
+        ct = get_content_type(Team)
 
         active_season = AthleteSeason.objects.filter(
             content_type=ct, object_id=team_id, is_active=True
@@ -155,9 +173,11 @@ class SessionLogListCreateByTeamView(generics.ListCreateAPIView):
         )
 
 
-class SynchroSessionLogListCreateView(generics.ListCreateAPIView):
+class SynchroSessionLogListCreateView(DeferUnrequestedFieldsMixin, generics.ListCreateAPIView):
     permission_classes = [permissions.IsAuthenticated, IsCoachUser]
     serializer_class = SessionLogSerializer
+    cursor_ordering = ("-session_date", "-session_time", "-id")
+    defer_unless_requested = ("coach_notes", "skater_notes")
 
     def get_queryset(self):
         team_id = self.kwargs["team_id"]
@@ -166,7 +186,7 @@ class SynchroSessionLogListCreateView(generics.ListCreateAPIView):
         if not get_access_role(self.request.user, team):
             return SessionLog.objects.none()
 
-        ct = ContentType.objects.get_for_model(SynchroTeam)
+        ct = get_content_type(SynchroTeam)
         return SessionLog.objects.filter(
             athlete_season__content_type=ct, athlete_season__object_id=team_id
         ).order_by("-session_date")
@@ -179,7 +199,7 @@ class SynchroSessionLogListCreateView(generics.ListCreateAPIView):
         if role in ["VIEWER", "OBSERVER"]:
             raise PermissionDenied("Observers cannot create logs.")
 
-        ct = ContentType.objects.get_for_model(SynchroTeam)
+        ct = get_content_type(SynchroTeam)
 
         active_season = AthleteSeason.objects.filter(
             content_type=ct, object_id=team_id, is_active=True
@@ -196,6 +216,136 @@ class SynchroSessionLogListCreateView(generics.ListCreateAPIView):
         )
 
 
+class SynchroSessionLogBulkCreateView(APIView):
+    """
+    Logs a synchro practice for the team and every athlete at once.
+
+    The body is the practice (as for SynchroSessionLogListCreateView) plus
+    "athletes": [{"skater_id", "status": PRESENT/LATE/ABSENT, and overrides
+    of session_rating, energy_stamina, sentiment_emoji, coach_notes and
+    element_attempts}]. The team log gets the practice and the attendance;
+    each athlete who was there gets their own log in their active season
+    (created if missing) with the practice's session fields and their
+    overrides. The practice's element attempts and program runs stay on the
+    team log.
+    """
+
+    permission_classes = [permissions.IsAuthenticated, IsCoachUser]
+
+    def post(self, request, team_id):
+        team = get_object_or_404(SynchroTeam, id=team_id)
+        role = get_access_role(request.user, team)
+        if not role or role in ["VIEWER", "OBSERVER"]:
+            raise PermissionDenied("Observers cannot create logs.")
+
+        practice = SessionLogSerializer(
+            data={key: value for key, value in request.data.items() if key != "athletes"}
+        )
+        practice.is_valid(raise_exception=True)
+        athletes = SessionLogAthleteSerializer(data=request.data.get("athletes", []), many=True)
+        athletes.is_valid(raise_exception=True)
+        entries = athletes.validated_data
+
+        roster = dict(team.roster.values_list("id", "full_name"))
+        skater_ids = [entry["skater_id"] for entry in entries]
+        if len(set(skater_ids)) != len(skater_ids):
+            raise ValidationError("Each athlete can only be listed once.")
+        strangers = sorted(set(skater_ids) - set(roster))
+        if strangers:
+            raise ValidationError(f"Not on the team roster: {strangers}")
+
+        ct = get_content_type(SynchroTeam)
+        team_season = AthleteSeason.objects.filter(
+            content_type=ct, object_id=team_id, is_active=True
+        ).last()
+        if not team_season:
+            raise ValidationError("No active season found for this team.")
+
+        # Attendance comes from "athletes"; element work stays on the team log
+        fields = {
+            key: value for key, value in practice.validated_data.items() if key != "attendance"
+        }
+        session_fields = {
+            key: value
+            for key, value in fields.items()
+            if key not in ("element_attempts", "program_runs")
+        }
+        present = [entry for entry in entries if entry["status"] != "ABSENT"]
+
+        with transaction.atomic():
+            # Active season per skater, as SessionLogListCreateView picks it
+            seasons = dict(
+                AthleteSeason.objects.filter(
+                    skater_id__in=[entry["skater_id"] for entry in present], is_active=True
+                )
+                .order_by("id")
+                .values_list("skater_id", "id")
+            )
+            missing = [entry["skater_id"] for entry in present if entry["skater_id"] not in seasons]
+            if missing:
+                start_year = season_bounds(date.today())[0].year
+                created = AthleteSeason.objects.bulk_create(
+                    AthleteSeason(skater_id=pk, season=f"{start_year}-{start_year + 1}")
+                    for pk in missing
+                )
+                seasons.update((season.skater_id, season.id) for season in created)
+                invalidate_dashboard([(Skater, pk) for pk in missing], ["planning"])
+
+            team_log = SessionLog(
+                **fields,
+                author=request.user,
+                athlete_season=team_season,
+                content_type=ct,
+                object_id=team_id,
+                attendance=[
+                    {
+                        "id": entry["skater_id"],
+                        "name": roster[entry["skater_id"]],
+                        "status": entry["status"],
+                    }
+                    for entry in entries
+                ],
+            )
+            athlete_logs = [
+                SessionLog(
+                    **{
+                        **session_fields,
+                        **{
+                            key: value
+                            for key, value in entry.items()
+                            if key not in ("skater_id", "status")
+                        },
+                    },
+                    author=request.user,
+                    athlete_season_id=seasons[entry["skater_id"]],
+                    content_type=ct,
+                    object_id=team_id,
+                )
+                for entry in present
+            ]
+            season_skaters = {season_id: pk for pk, season_id in seasons.items()}
+            season_skaters[team_season.id] = None
+            team_log, *athlete_logs = bulk_create_session_logs(
+                [team_log] + athlete_logs, season_skaters, [(SynchroTeam, team.id)]
+            )
+
+        return Response(
+            {
+                "team_log": SessionLogSerializer(team_log).data,
+                "athlete_logs": [
+                    {
+                        "id": log.id,
+                        "skater_id": season_skaters[log.athlete_season_id],
+                        "athlete_season_id": log.athlete_season_id,
+                    }
+                    for log in athlete_logs
+                ],
+                "created_seasons": len(missing),
+            },
+            status=status.HTTP_201_CREATED,
+        )
+
+
 class SessionLogDetailView(generics.RetrieveUpdateDestroyAPIView):
     permission_classes = [permissions.IsAuthenticated, IsCoachOrOwner]
     serializer_class = SessionLogSerializer
@@ -205,6 +355,7 @@ class SessionLogDetailView(generics.RetrieveUpdateDestroyAPIView):
 class InjuryLogListCreateView(generics.ListCreateAPIView):
     permission_classes = [permissions.IsAuthenticated, IsCoachOrOwner]
     serializer_class = InjuryLogSerializer
+    cursor_ordering = ("-date_of_onset", "-id")
 
     def get_queryset(self):
         skater_id = self.kwargs["skater_id"]
@@ -237,6 +388,7 @@ class InjuryLogDetailView(generics.RetrieveUpdateDestroyAPIView):
 class InjuryLogListCreateByTeamView(generics.ListCreateAPIView):
     permission_classes = [permissions.IsAuthenticated, IsCoachUser]
     serializer_class = InjuryLogSerializer
+    cursor_ordering = ("-date_of_onset", "-id")
 
     def get_queryset(self):
         team_id = self.kwargs["team_id"]
@@ -276,6 +428,7 @@ class InjuryLogListCreateByTeamView(generics.ListCreateAPIView):
 class SynchroInjuryLogListCreateView(generics.ListCreateAPIView):
     permission_classes = [permissions.IsAuthenticated, IsCoachUser]
     serializer_class = InjuryLogSerializer
+    cursor_ordering = ("-date_of_onset", "-id")
 
     def get_queryset(self):
         team_id = self.kwargs["team_id"]
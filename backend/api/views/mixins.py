@@ -0,0 +1,19 @@
+from api.serializers.mixins import requested_fields
+
+
+class DeferUnrequestedFieldsMixin:
+    """
+    Skips loading expensive columns (e.g. encrypted notes) when a ?fields=
+    request leaves them out. List the candidates in `defer_unless_requested`.
+    """
+
+    defer_unless_requested = ()
+
+    def filter_queryset(self, queryset):
+        queryset = super().filter_queryset(queryset)
+        wanted = requested_fields(self.request)
+        if wanted:
+            skipped = [name for name in self.defer_unless_requested if name not in wanted]
+            if skipped:
+                queryset = queryset.defer(*skipped)
+        return queryset
@@ -2,8 +2,8 @@ from rest_framework import generics, permissions, status
 from rest_framework.response import Response
 from rest_framework.views import APIView
 from rest_framework.exceptions import ValidationError, PermissionDenied
-from django.contrib.contenttypes.models import ContentType
-from django.db.models import Q
+from django.shortcuts import get_object_or_404
+from django.db.models import Q, Prefetch
 from datetime import date, timedelta
 
 from api.models import (
@@ -28,7 +28,13 @@ from api.serializers import (
     GapAnalysisSerializer,
 )
 from api.permissions import IsCoachUser, IsCoachOrOwner
-from api.services import get_access_role  # <--- Use Service
+from api.services import (  # <--- Use Service
+    get_access_role,
+    get_week_plans,
+    week_starts,
+    MAX_RANGE_WEEKS,
+    get_content_type,
+)
 
 # ... (AthleteSeason Views remain same) ...
 
@@ -57,7 +63,7 @@ class YearlyPlanListCreateView(generics.ListCreateAPIView):
     def get_queryset(self):
         if "team_id" in self.kwargs:
             team_id = self.kwargs["team_id"]
-            ct = ContentType.objects.get_for_model(Team)
+            ct = get_content_type(Team)
             return YearlyPlan.objects.filter(content_type=ct, object_id=team_id)
         else:
             skater_id = self.kwargs["skater_id"]
@@ -126,7 +132,7 @@ class YearlyPlanListCreateView(generics.ListCreateAPIView):
             model_class = model_map.get(entity_type)
             if not model_class:
                 raise ValidationError("Invalid entity type")
-            content_type = ContentType.objects.get_for_model(model_class)
+            content_type = get_content_type(model_class)
 
             plan = serializer.save(
                 coach_owner=self.request.user,
@@ -142,13 +148,13 @@ class TeamYearlyPlanListCreateView(generics.ListCreateAPIView):
 
     def get_queryset(self):
         team_id = self.kwargs["team_id"]
-        ct = ContentType.objects.get_for_model(Team)
+        ct = get_content_type(Team)
         return YearlyPlan.objects.filter(content_type=ct, object_id=team_id)
 
     def perform_create(self, serializer):
         team_id = self.kwargs["team_id"]
         team = Team.objects.get(id=team_id)
-        ct = ContentType.objects.get_for_model(Team)
+        ct = get_content_type(Team)
         season_data = self.request.data.get("new_season_data")
         season_name = (
             season_data.get("season") if season_data else f"{date.today().year} Team"
@@ -175,13 +181,13 @@ class SynchroYearlyPlanListCreateView(generics.ListCreateAPIView):
 
     def get_queryset(self):
         team_id = self.kwargs["team_id"]
-        ct = ContentType.objects.get_for_model(SynchroTeam)
+        ct = get_content_type(SynchroTeam)
         return YearlyPlan.objects.filter(content_type=ct, object_id=team_id)
 
     def perform_create(self, serializer):
         team_id = self.kwargs["team_id"]
         team = SynchroTeam.objects.get(id=team_id)
-        ct = ContentType.objects.get_for_model(SynchroTeam)
+        ct = get_content_type(SynchroTeam)
         season_data = self.request.data.get("new_season_data")
         season_name = (
             season_data.get("season") if season_data else f"{date.today().year} Synchro"
@@ -227,15 +233,41 @@ class MacrocycleDetailView(generics.RetrieveUpdateDestroyAPIView):
     queryset = Macrocycle.objects.all()
 
 
-class WeeklyPlanListView(generics.ListAPIView):
+class WeeklyPlanListView(generics.ListCreateAPIView):
     permission_classes = [permissions.IsAuthenticated, IsCoachOrOwner]
     serializer_class = WeeklyPlanSerializer
+    cursor_ordering = ("week_start", "id")
 
     def get_queryset(self):
         return WeeklyPlan.objects.filter(
             athlete_season_id=self.kwargs["season_id"]
         ).order_by("week_start")
 
+    def create(self, request, *args, **kwargs):
+        """
+        Upsert on (season, week_start): the week-view endpoints hand out unsaved
+        placeholders, and this is where the row is created on the first edit.
+        """
+        season = get_object_or_404(AthleteSeason, id=self.kwargs["season_id"])
+        self.check_object_permissions(request, season)
+
+        week_start = request.data.get("week_start")
+        if not week_start:
+            raise ValidationError({"week_start": "This field is required."})
+
+        data = request.data.copy()
+        data["athlete_season"] = season.id
+        instance = WeeklyPlan.objects.filter(
+            athlete_season=season, week_start=week_start
+        ).first()
+        serializer = self.get_serializer(instance, data=data, partial=instance is not None)
+        serializer.is_valid(raise_exception=True)
+        serializer.save()
+        return Response(
+            serializer.data,
+            status=status.HTTP_201_CREATED if instance is None else status.HTTP_200_OK,
+        )
+
 
 class WeeklyPlanDetailView(generics.RetrieveUpdateDestroyAPIView):
     permission_classes = [permissions.IsAuthenticated, IsCoachOrOwner]
@@ -243,29 +275,68 @@ class WeeklyPlanDetailView(generics.RetrieveUpdateDestroyAPIView):
     queryset = WeeklyPlan.objects.all()
 
 
-# ... (Master Weekly Plans remain same) ...
+# --- MASTER WEEKLY PLANS ---
+def parse_week_start(request, param):
+    """Returns (date, error_response). Defaults to the Monday of the current week."""
+    date_str = request.query_params.get(param)
+    if not date_str:
+        today = date.today()
+        return today - timedelta(days=today.weekday()), None
+    try:
+        return date.fromisoformat(date_str), None
+    except ValueError:
+        return None, Response({"error": "Invalid date"}, status=status.HTTP_400_BAD_REQUEST)
+
+
+def parse_week_count(request, default=4):
+    try:
+        weeks = int(request.query_params.get("weeks", default))
+    except ValueError:
+        weeks = default
+    return max(1, min(weeks, MAX_RANGE_WEEKS))
+
+
+def build_week_payload(seasons, starts, describe):
+    """
+    Serializes every season x week with one WeeklyPlan query.
+    `describe(season)` returns the (label, can_edit) pair shown for a season.
+    """
+    plans = get_week_plans(seasons, starts)
+    described = [(season, *describe(season)) for season in seasons]
+    weeks = []
+    for start in starts:
+        weeks.append(
+            {
+                "week_start": start,
+                "plans": [
+                    {
+                        "plan_data": WeeklyPlanSerializer(plans[(season.id, start)]).data,
+                        "label": label,
+                        "season_id": season.id,
+                        "can_edit": can_edit,
+                    }
+                    for season, label, can_edit in described
+                ],
+            }
+        )
+    return weeks
+
+
 class MasterWeeklyPlanView(APIView):
-    permission_classes = [permissions.IsAuthenticated, IsCoachOrOwner]
+    """
+    Every active season a skater takes part in (own, partnered, synchro) for one week.
+    Missing weeks come back as placeholders with plan_data.id = null; they are
+    created on the first save through WeeklyPlanListView (POST).
+    """
 
-    def get(self, request, skater_id):
-        skater = Skater.objects.get(id=skater_id)
-        self.check_object_permissions(request, skater)
-        date_str = request.query_params.get("date")
-        if not date_str:
-            today = date.today()
-            target_date = today - timedelta(days=today.weekday())
-        else:
-            try:
-                target_date = date.fromisoformat(date_str)
-            except ValueError:
-                return Response(
-                    {"error": "Invalid date"}, status=status.HTTP_400_BAD_REQUEST
-                )
+    permission_classes = [permissions.IsAuthenticated, IsCoachOrOwner]
+    date_param = "date"
 
+    def get_seasons(self, skater):
         season_query = Q(skater=skater, is_active=True)
         teams = Team.objects.filter(Q(partner_a=skater) | Q(partner_b=skater))
         if teams.exists():
-            ct_team = ContentType.objects.get_for_model(Team)
+            ct_team = get_content_type(Team)
             season_query |= Q(
                 content_type=ct_team,
                 object_id__in=teams.values_list("id", flat=True),
@@ -273,39 +344,74 @@ class MasterWeeklyPlanView(APIView):
             )
         synchro_teams = skater.synchro_teams.all()
         if synchro_teams.exists():
-            ct_synchro = ContentType.objects.get_for_model(SynchroTeam)
+            ct_synchro = get_content_type(SynchroTeam)
             season_query |= Q(
                 content_type=ct_synchro,
                 object_id__in=synchro_teams.values_list("id", flat=True),
                 is_active=True,
             )
 
-        active_seasons = AthleteSeason.objects.filter(season_query)
-        data = []
-        for season in active_seasons:
-            week_plan, created = WeeklyPlan.objects.get_or_create(
-                athlete_season=season, week_start=target_date, defaults={"theme": ""}
+        return list(
+            AthleteSeason.objects.filter(season_query).prefetch_related(
+                "planning_entity",
+                Prefetch("yearly_plans", queryset=YearlyPlan.objects.order_by("id")),
+                "yearly_plans__planning_entity",
             )
+        )
+
+    def get_weeks(self, request, start):
+        return [start]
+
+    def get(self, request, skater_id):
+        skater = Skater.objects.get(id=skater_id)
+        self.check_object_permissions(request, skater)
+        start, error = parse_week_start(request, self.date_param)
+        if error:
+            return error
+
+        def describe(season):
             label = season.season
-            ytp = season.yearly_plans.first()
+            ytp = next(iter(season.yearly_plans.all()), None)
             if ytp:
                 label = str(ytp.planning_entity)
             elif season.planning_entity:
                 label = str(season.planning_entity)
-            can_edit = season.skater == skater
-            data.append(
-                {
-                    "plan_data": WeeklyPlanSerializer(week_plan).data,
-                    "label": label,
-                    "season_id": season.id,
-                    "can_edit": can_edit,
-                }
-            )
-        return Response({"week_start": target_date, "plans": data})
+            return label, season.skater_id == skater.id
+
+        weeks = build_week_payload(
+            self.get_seasons(skater), self.get_weeks(request, start), describe
+        )
+        return self.respond(weeks)
+
+    def respond(self, weeks):
+        return Response(weeks[0])
+
+
+class MasterWeeklyRangeView(MasterWeeklyPlanView):
+    """
+    Read-only calendar strip: ?start=YYYY-MM-DD&weeks=N (max 26) for all seasons.
+    `start` is snapped to its Monday.
+    """
+
+    date_param = "start"
+
+    def get_weeks(self, request, start):
+        start -= timedelta(days=start.weekday())
+        return week_starts(start, parse_week_count(request))
+
+    def respond(self, weeks):
+        return Response({"weeks": weeks})
 
 
 class TeamMasterWeeklyPlanView(APIView):
     permission_classes = [permissions.IsAuthenticated, IsCoachUser]
+    date_param = "date"
+
+    def get_weeks(self, request, start):
+        return [start]
+
+    def respond(self, weeks):
+        return Response(weeks[0])
 
     def get(self, request, team_id):
         is_synchro = "synchro" in request.path
@@ -314,58 +420,52 @@ class TeamMasterWeeklyPlanView(APIView):
                 target_entity = SynchroTeam.objects.get(id=team_id)
             except SynchroTeam.DoesNotExist:
                 return Response({"error": "Synchro Team not found"}, status=404)
-            ct = ContentType.objects.get_for_model(SynchroTeam)
-            relevant_skaters = []
+            ct = get_content_type(SynchroTeam)
+            partner_ids = []
         else:
             try:
                 target_entity = Team.objects.get(id=team_id)
             except Team.DoesNotExist:
                 return Response({"error": "Team not found"}, status=404)
-            ct = ContentType.objects.get_for_model(Team)
-            relevant_skaters = [target_entity.partner_a, target_entity.partner_b]
+            ct = get_content_type(Team)
+            partner_ids = [target_entity.partner_a_id, target_entity.partner_b_id]
 
-        date_str = request.query_params.get("date")
-        if not date_str:
-            today = date.today()
-            target_date = today - timedelta(days=today.weekday())
-        else:
-            try:
-                target_date = date.fromisoformat(date_str)
-            except ValueError:
-                return Response({"error": "Invalid date"}, status=400)
+        start, error = parse_week_start(request, self.date_param)
+        if error:
+            return error
 
         team_seasons = AthleteSeason.objects.filter(
             content_type=ct, object_id=team_id, is_active=True
         )
-        partner_seasons = AthleteSeason.objects.none()
-        for s in relevant_skaters:
-            p_seasons = AthleteSeason.objects.filter(skater=s, is_active=True)
-            partner_seasons = partner_seasons | p_seasons
-
+        partner_seasons = AthleteSeason.objects.filter(
+            skater_id__in=[pk for pk in partner_ids if pk], is_active=True
+        ).select_related("skater")
         all_seasons = list(team_seasons) + list(partner_seasons)
-        data = []
-        for season in all_seasons:
-            week_plan, created = WeeklyPlan.objects.get_or_create(
-                athlete_season=season, week_start=target_date, defaults={"theme": ""}
-            )
-            label = season.season
-            can_edit = False
-            if season.planning_entity == target_entity:
-                label = "Team Plan"
-                can_edit = True
-            elif season.skater:
-                label = f"{season.skater.full_name.split(' ')[0]} ({season.season})"
-            elif season.planning_entity:
-                label = str(season.planning_entity)
-            data.append(
-                {
-                    "plan_data": WeeklyPlanSerializer(week_plan).data,
-                    "label": label,
-                    "season_id": season.id,
-                    "can_edit": can_edit,
-                }
-            )
-        return Response({"week_start": target_date, "plans": data})
+
+        def describe(season):
+            if season.content_type_id == ct.id and season.object_id == target_entity.id:
+                return "Team Plan", True
+            if season.skater:
+                return f"{season.skater.full_name.split(' ')[0]} ({season.season})", False
+            if season.planning_entity:
+                return str(season.planning_entity), False
+            return season.season, False
+
+        weeks = build_week_payload(all_seasons, self.get_weeks(request, start), describe)
+        return self.respond(weeks)
+
+
+class TeamMasterWeeklyRangeView(TeamMasterWeeklyPlanView):
+    """Range variant of TeamMasterWeeklyPlanView (?start=&weeks=)."""
+
+    date_param = "start"
+
+    def get_weeks(self, request, start):
+        start -= timedelta(days=start.weekday())
+        return week_starts(start, parse_week_count(request))
+
+    def respond(self, weeks):
+        return Response({"weeks": weeks})
 
 
 class GapAnalysisRetrieveUpdateView(generics.RetrieveUpdateAPIView):
@@ -391,7 +491,7 @@ class GapAnalysisRetrieveUpdateView(generics.RetrieveUpdateAPIView):
             entity = Skater.objects.get(id=skater_id)
 
         self.check_object_permissions(self.request, entity)
-        ct = ContentType.objects.get_for_model(entity)
+        ct = get_content_type(entity)
         obj, _ = GapAnalysis.objects.get_or_create(content_type=ct, object_id=entity.id)
         return obj
 
@@ -399,6 +499,7 @@ class GapAnalysisRetrieveUpdateView(generics.RetrieveUpdateAPIView):
 class GoalListCreateByPlanView(generics.ListCreateAPIView):
     permission_classes = [permissions.IsAuthenticated, IsCoachOrOwner]
     serializer_class = GoalSerializer
+    cursor_ordering = ("-created_at", "-id")
 
     def get_queryset(self):
         plan = YearlyPlan.objects.get(id=self.kwargs["plan_id"])
@@ -426,6 +527,7 @@ class GoalListCreateByPlanView(generics.ListCreateAPIView):
 class GoalListBySkaterView(generics.ListCreateAPIView):
     permission_classes = [permissions.IsAuthenticated, IsCoachOrOwner]
     serializer_class = GoalSerializer
+    cursor_ordering = ("-created_at", "-id")
 
     def get_queryset(self):
         skater_id = self.kwargs["skater_id"]
@@ -448,22 +550,22 @@ class GoalListBySkaterView(generics.ListCreateAPIView):
 
             if singles:
                 query |= Q(
-                    content_type=ContentType.objects.get_for_model(SinglesEntity),
+                    content_type=get_content_type(SinglesEntity),
                     object_id__in=[e.id for e in singles],
                 )
             if dance:
                 query |= Q(
-                    content_type=ContentType.objects.get_for_model(SoloDanceEntity),
+                    content_type=get_content_type(SoloDanceEntity),
                     object_id__in=[e.id for e in dance],
                 )
             if teams:
                 query |= Q(
-                    content_type=ContentType.objects.get_for_model(Team),
+                    content_type=get_content_type(Team),
                     object_id__in=[e.id for e in teams],
                 )
             if synchro:
                 query |= Q(
-                    content_type=ContentType.objects.get_for_model(SynchroTeam),
+                    content_type=get_content_type(SynchroTeam),
                     object_id__in=[e.id for e in synchro],
                 )
 
@@ -477,8 +579,8 @@ class GoalListBySkaterView(generics.ListCreateAPIView):
         # 1. Direct Access (Skater Profile) -> See Singles/Dance
         # Note: Role here comes from get_access_role which checks direct PEA
         if role:
-            ct_singles = ContentType.objects.get_for_model(SinglesEntity)
-            ct_dance = ContentType.objects.get_for_model(SoloDanceEntity)
+            ct_singles = get_content_type(SinglesEntity)
+            ct_dance = get_content_type(SoloDanceEntity)
             singles_ids = skater.singles_entities.values_list("id", flat=True)
             dance_ids = skater.solodance_entities.values_list("id", flat=True)
             if singles_ids:
@@ -492,13 +594,13 @@ class GoalListBySkaterView(generics.ListCreateAPIView):
         )
         for team in teams:
             if get_access_role(user, team):  # Check permission on team
-                ct = ContentType.objects.get_for_model(Team)
+                ct = get_content_type(Team)
                 query |= Q(content_type=ct, object_id=team.id)
 
         # 3. Synchro Access
         for st in skater.synchro_teams.all():
             if get_access_role(user, st):
-                ct = ContentType.objects.get_for_model(SynchroTeam)
+                ct = get_content_type(SynchroTeam)
                 query |= Q(content_type=ct, object_id=st.id)
 
         if not query:
@@ -533,7 +635,7 @@ class GoalListBySkaterView(generics.ListCreateAPIView):
                 "You do not have permission to add goals to this discipline."
             )
 
-        content_type = ContentType.objects.get_for_model(entity)
+        content_type = get_content_type(entity)
         status_val = Goal.GoalStatus.APPROVED
         role = get_access_role(self.request.user, entity)
         if role in ["GUARDIAN", "SKATER_OWNER", "SKATER"]:
@@ -552,17 +654,18 @@ class GoalListBySkaterView(generics.ListCreateAPIView):
 class GoalListByTeamView(generics.ListCreateAPIView):
     permission_classes = [permissions.IsAuthenticated, IsCoachUser]
     serializer_class = GoalSerializer
+    cursor_ordering = ("-created_at", "-id")
 
     def get_queryset(self):
         team_id = self.kwargs["team_id"]
-        ct = ContentType.objects.get_for_model(Team)
+        ct = get_content_type(Team)
         return Goal.objects.filter(content_type=ct, object_id=team_id).order_by(
             "-created_at"
         )
 
     def perform_create(self, serializer):
         team_id = self.kwargs["team_id"]
-        ct = ContentType.objects.get_for_model(Team)
+        ct = get_content_type(Team)
         serializer.save(
             content_type=ct,
             object_id=team_id,
@@ -575,17 +678,18 @@ class GoalListByTeamView(generics.ListCreateAPIView):
 class SynchroGoalListCreateView(generics.ListCreateAPIView):
     permission_classes = [permissions.IsAuthenticated, IsCoachUser]
     serializer_class = GoalSerializer
+    cursor_ordering = ("-created_at", "-id")
 
     def get_queryset(self):
         team_id = self.kwargs["team_id"]
-        ct = ContentType.objects.get_for_model(SynchroTeam)
+        ct = get_content_type(SynchroTeam)
         return Goal.objects.filter(content_type=ct, object_id=team_id).order_by(
             "-created_at"
         )
 
     def perform_create(self, serializer):
         team_id = self.kwargs["team_id"]
-        ct = ContentType.objects.get_for_model(SynchroTeam)
+        ct = get_content_type(SynchroTeam)
         serializer.save(
             content_type=ct,
             object_id=team_id,
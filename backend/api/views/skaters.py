@@ -1,6 +1,5 @@
 from rest_framework import generics, permissions, status
 from rest_framework.response import Response
-from django.contrib.contenttypes.models import ContentType
 from datetime import date
 
 from api.models import (
@@ -25,7 +24,13 @@ from api.serializers import (
     SoloDanceEntitySerializer,
 )
 from api.permissions import IsCoachUser, IsCoachOrOwner
-from api.services import get_accessible_skaters
+from api.serializers.mixins import field_is_rendered
+from api.services import (
+    get_accessible_skaters,
+    clear_access_index,
+    prefetch_roster,
+    get_content_type,
+)
 
 # --- SKATERS ---
 
@@ -108,6 +113,7 @@ class CreateSkaterView(generics.CreateAPIView):
             access_level=PlanningEntityAccess.AccessLevel.COACH,
             planning_entity=entity,
         )
+        clear_access_index(request.user)
 
         # 6. Auto-Create Season
         today = date.today()
@@ -123,7 +129,7 @@ class CreateSkaterView(generics.CreateAPIView):
         )
 
         # 7. Auto-Create Yearly Plan
-        ct = ContentType.objects.get_for_model(entity)
+        ct = get_content_type(entity)
         ytp = YearlyPlan.objects.create(
             coach_owner=request.user,
             content_type=ct,
@@ -143,15 +149,24 @@ class CreateSkaterView(generics.CreateAPIView):
 class SkaterDetailView(generics.RetrieveUpdateDestroyAPIView):
     permission_classes = [permissions.IsAuthenticated, IsCoachOrOwner]
     serializer_class = SkaterSerializer
-    queryset = Skater.objects.all()
+
+    def get_queryset(self):
+        queryset = Skater.objects.select_related("profile", "user_account")
+        if any(
+            field_is_rendered(self.request, SkaterSerializer, name)
+            for name in ("planning_entities", "synchro_teams")
+        ):
+            queryset = prefetch_roster(queryset)
+        return queryset
 
 
 class RosterView(generics.ListAPIView):
     permission_classes = [permissions.IsAuthenticated]
     serializer_class = RosterSkaterSerializer
+    cursor_ordering = ("-is_active", "full_name", "id")
 
     def get_queryset(self):
-        return get_accessible_skaters(self.request.user, filter_mode="ALL")
+        return prefetch_roster(get_accessible_skaters(self.request.user, filter_mode="ALL"))
 
 
 # --- ENTITY DETAILS ---
@@ -191,10 +206,11 @@ class CreateTeamView(generics.CreateAPIView):
         PlanningEntityAccess.objects.create(
             user=self.request.user, access_level="COACH", planning_entity=team
         )
+        clear_access_index(self.request.user)
         today = date.today()
         start_year = today.year if today.month >= 7 else today.year - 1
         season_name = f"{start_year}-{start_year + 1} Team"
-        ct = ContentType.objects.get_for_model(Team)
+        ct = get_content_type(Team)
         team_season = AthleteSeason.objects.create(
             content_type=ct,
             object_id=team.id,
@@ -216,9 +232,10 @@ class CreateTeamView(generics.CreateAPIView):
 class TeamListView(generics.ListAPIView):
     permission_classes = [permissions.IsAuthenticated]
     serializer_class = TeamSerializer
+    cursor_ordering = ("-is_active", "team_name", "id")
 
     def get_queryset(self):
-        ct = ContentType.objects.get_for_model(Team)
+        ct = get_content_type(Team)
         ids = PlanningEntityAccess.objects.filter(
             user=self.request.user, content_type=ct
         ).values_list("object_id", flat=True)
@@ -237,10 +254,11 @@ class CreateSynchroTeamView(generics.CreateAPIView):
         PlanningEntityAccess.objects.create(
             user=self.request.user, access_level="COACH", planning_entity=team
         )
+        clear_access_index(self.request.user)
         today = date.today()
         start_year = today.year if today.month >= 7 else today.year - 1
         season_name = f"{start_year}-{start_year + 1} Synchro"
-        ct = ContentType.objects.get_for_model(SynchroTeam)
+        ct = get_content_type(SynchroTeam)
         team_season = AthleteSeason.objects.create(
             content_type=ct,
             object_id=team.id,
@@ -262,9 +280,10 @@ class CreateSynchroTeamView(generics.CreateAPIView):
 class SynchroTeamListView(generics.ListAPIView):
     permission_classes = [permissions.IsAuthenticated]
     serializer_class = SynchroTeamSerializer
+    cursor_ordering = ("-is_active", "team_name", "id")
 
     def get_queryset(self):
-        ct = ContentType.objects.get_for_model(SynchroTeam)
+        ct = get_content_type(SynchroTeam)
         ids = PlanningEntityAccess.objects.filter(
             user=self.request.user, content_type=ct
         ).values_list("object_id", flat=True)
@@ -37,6 +37,8 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    # First, so its total time covers the rest of the stack; off unless API_INSTRUMENTATION
+    "api.middleware.RequestInstrumentationMiddleware",
     "django.middleware.security.SecurityMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "corsheaders.middleware.CorsMiddleware",
@@ -86,9 +88,12 @@ CACHES = {
         "LOCATION": f"redis://{os.environ.get('REDIS_HOST')}:{os.environ.get('REDIS_PORT')}/1",
         "OPTIONS": {
             "CLIENT_CLASS": "django_redis.client.DefaultClient",
+            # A Redis outage degrades to cache misses instead of failing writes
+            "IGNORE_EXCEPTIONS": True,
         },
     }
 }
+DJANGO_REDIS_LOG_IGNORED_EXCEPTIONS = True
 
 # --- Celery ---
 CELERY_BROKER_URL = (
@@ -101,6 +106,14 @@ CELERY_ACCEPT_CONTENT = ["json"]
 CELERY_TASK_SERIALIZER = "json"
 CELERY_RESULT_SERIALIZER = "json"
 CELERY_TIMEZONE = "UTC"
+# Run tasks inline (no broker or worker), e.g. for local development
+CELERY_TASK_ALWAYS_EAGER = os.environ.get("CELERY_TASK_ALWAYS_EAGER", "False") == "True"
+
+# --- Request instrumentation ---
+# Per-request query counts, duplicate queries and timings for API views, logged
+# to "api.instrumentation" and summarised at /api/admin/instrumentation/
+API_INSTRUMENTATION = os.environ.get("API_INSTRUMENTATION", "False") == "True"
+API_INSTRUMENTATION_SLOW_MS = int(os.environ.get("API_INSTRUMENTATION_SLOW_MS", "500"))
 
 # Password validation
 AUTH_PASSWORD_VALIDATORS = [
@@ -164,6 +177,8 @@ REST_FRAMEWORK = {
     "DEFAULT_PERMISSION_CLASSES": [
         "rest_framework.permissions.IsAuthenticated",
     ],
+    # Opt-in: lists are only paginated when ?page_size= or ?cursor= is sent
+    "DEFAULT_PAGINATION_CLASS": "api.pagination.OptInCursorPagination",
     "DEFAULT_THROTTLE_CLASSES": [
         "rest_framework.throttling.AnonRateThrottle",
         "rest_framework.throttling.UserRateThrottle",
@@ -191,7 +206,8 @@ if os.getenv("USE_S3", "True") == "True":
     AWS_QUERYSTRING_AUTH = False
 
 INSTALLED_APPS += ["anymail"]
-EMAIL_BACKEND = "anymail.backends.sendinblue.EmailBackend"
+# EMAIL_BACKEND=django.core.mail.backends.locmem.EmailBackend keeps mail offline
+EMAIL_BACKEND = os.getenv("EMAIL_BACKEND", "anymail.backends.sendinblue.EmailBackend")
 ANYMAIL = {
     "SENDINBLUE_API_KEY": os.getenv("BREVO_API_KEY"),
 }
@@ -41,10 +41,19 @@ export function WeeklyEditModal({ open, onClose, plans, weekStart, onSaved }) {
         if (!editData) return;
         setLoading(true);
         try {
-            await apiRequest(`/weeks/${editData.plan_data.id}/`, 'PATCH', {
+            const payload = {
                 theme: editData.plan_data.theme,
                 session_breakdown: editData.plan_data.session_breakdown
-            }, token);
+            };
+            if (editData.plan_data.id) {
+                await apiRequest(`/weeks/${editData.plan_data.id}/`, 'PATCH', payload, token);
+            } else {
+                // Unsaved placeholder week: the first save creates it
+                await apiRequest(`/seasons/${editData.season_id}/weeks/`, 'POST', {
+                    ...payload,
+                    week_start: editData.plan_data.week_start
+                }, token);
+            }
             
             if (onSaved) onSaved();
             onClose();